@@ -105,6 +105,16 @@ def get_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--open-ui", action="store_true", help="Open the webinterface in a browser"
     )
+    parser.add_argument(
+        "--profile-imports",
+        action="store_true",
+        help="Record the time spent importing integrations during startup",
+    )
+    parser.add_argument(
+        "--defer-platform-imports",
+        action="store_true",
+        help="Import rarely used integration platforms on their first use",
+    )
 
     skip_pip_group = parser.add_mutually_exclusive_group()
     skip_pip_group.add_argument(
@@ -201,6 +211,8 @@ def main() -> int:
         debug=args.debug,
         open_ui=args.open_ui,
         safe_mode=safe_mode,
+        profile_imports=args.profile_imports,
+        defer_platform_imports=args.defer_platform_imports,
     )
 
     fault_file_name = os.path.join(config_dir, FAULT_LOG_FILENAME)
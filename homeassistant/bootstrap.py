@@ -87,6 +87,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.json import save_json
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
@@ -120,6 +121,7 @@ SETUP_ORDER_SORT_KEY = partial(contains, BASE_PLATFORMS)
 
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+IMPORT_PROFILE_FILENAME = "import_profile.json"
 
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
@@ -279,6 +281,11 @@ async def async_setup_hass(
         hass.config.skip_pip = runtime_config.skip_pip
         hass.config.skip_pip_packages = runtime_config.skip_pip_packages
 
+        if runtime_config.profile_imports:
+            loader.async_enable_import_profiler(hass)
+        if runtime_config.defer_platform_imports:
+            loader.async_defer_platform_imports(hass)
+
         return hass
 
     async def stop_hass(hass: core.HomeAssistant) -> None:
@@ -434,6 +441,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -490,7 +498,17 @@ async def async_from_config_dict(
         )
         return None
 
-    await _async_set_up_integrations(hass, config)
+    if profiler := hass.data.get(loader.DATA_IMPORT_PROFILER):
+        profiler.start()
+    try:
+        await _async_set_up_integrations(hass, config)
+    finally:
+        if profiler:
+            profiler.stop()
+    if profiler:
+        await hass.async_add_executor_job(
+            save_json, hass.config.path(IMPORT_PROFILE_FILENAME), profiler.as_dict()
+        )
 
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
@@ -78,7 +78,7 @@ from .const import (  # noqa: F401
     SERVICE_RECORD,
     StreamType,
 )
-from .img_util import scale_jpeg_camera_image
+from .img_util import ScaledJpegCache
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
@@ -195,7 +195,8 @@ async def _async_get_image(
                     assert width is not None
                     assert height is not None
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        camera.scaled_image_cache.scale(image, width, height),
                     )
 
                 return image
@@ -504,6 +505,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.stream_options: dict[str, str | bool | float] = {}
         self.content_type: str = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
+        self.scaled_image_cache = ScaledJpegCache()
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
@@ -6,6 +6,8 @@ from contextlib import suppress
 import logging
 from typing import TYPE_CHECKING, Literal, cast
 
+from lru import LRU
+
 with suppress(Exception):
     # TurboJPEG imports numpy which may or may not work so
     # we have to guard the import here. We still want
@@ -23,6 +25,9 @@ _LOGGER = logging.getLogger(__name__)
 
 JPEG_QUALITY = 75
 
+# The maximum number of sizes the last image of a camera is kept at
+MAX_SCALED_IMAGES = 8
+
 
 def find_supported_scaling_factor(
     current_width: int, current_height: int, target_width: int, target_height: int
@@ -77,6 +82,31 @@ def scale_jpeg_camera_image(cam_image: Image, width: int, height: int) -> bytes:
     )
 
 
+class ScaledJpegCache:
+    """Cache the scaled images of the last image of a camera.
+
+    Dashboards show the same snapshot at several sizes, so the scaled
+    images are kept by their size until the camera returns another image.
+    Only the MAX_SCALED_IMAGES most recently requested sizes are kept.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._content: bytes | None = None
+        self._scaled: LRU[tuple[int, int], bytes] = LRU(MAX_SCALED_IMAGES)
+
+    def scale(self, cam_image: Image, width: int, height: int) -> bytes:
+        """Scale a camera image or return it from the cache."""
+        if cam_image.content != self._content:
+            self._content = cam_image.content
+            self._scaled.clear()
+        if (scaled := self._scaled.get((width, height))) is None:
+            scaled = self._scaled[(width, height)] = scale_jpeg_camera_image(
+                cam_image, width, height
+            )
+        return scaled
+
+
 class TurboJPEGSingleton:
     """Load TurboJPEG only once.
 
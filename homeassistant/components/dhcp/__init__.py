@@ -6,11 +6,7 @@ import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
-from fnmatch import translate
-from functools import lru_cache
-import itertools
 import logging
-import re
 from typing import Any, Final
 
 import aiodhcpwatcher
@@ -57,7 +53,7 @@ from homeassistant.helpers.event import (
     async_track_time_interval,
 )
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import DHCPMatcher, async_get_dhcp
+from homeassistant.loader import DHCPMatcher, DiscoveryMatcherIndex, async_get_dhcp
 
 from .const import DOMAIN
 
@@ -87,8 +83,7 @@ class DhcpMatchers:
     """Prepared info from dhcp entries."""
 
     registered_devices_domains: set[str]
-    no_oui_matchers: dict[str, list[DHCPMatcher]]
-    oui_matchers: dict[str, list[DHCPMatcher]]
+    matchers: DiscoveryMatcherIndex[str]
 
 
 def async_index_integration_matchers(
@@ -96,33 +91,31 @@ def async_index_integration_matchers(
 ) -> DhcpMatchers:
     """Index the integration matchers.
 
-    We have three types of matchers:
+    We have two types of matchers:
 
     1. Registered devices
-    2. Devices with no OUI - index by first char of lower() hostname
-    3. Devices with OUI - index by OUI
+    2. Devices matched by their MAC address and hostname, which are
+       compiled to match the domains
     """
     registered_devices_domains: set[str] = set()
-    no_oui_matchers: dict[str, list[DHCPMatcher]] = {}
-    oui_matchers: dict[str, list[DHCPMatcher]] = {}
+    matchers: list[tuple[str, dict[str, str]]] = []
     for matcher in integration_matchers:
         domain = matcher["domain"]
         if REGISTERED_DEVICES in matcher:
             registered_devices_domains.add(domain)
             continue
 
+        patterns: dict[str, str] = {}
         if mac_address := matcher.get(MAC_ADDRESS):
-            oui_matchers.setdefault(mac_address[:6], []).append(matcher)
-            continue
-
+            patterns[MAC_ADDRESS] = mac_address
         if hostname := matcher.get(HOSTNAME):
-            first_char = hostname[0].lower()
-            no_oui_matchers.setdefault(first_char, []).append(matcher)
+            patterns[HOSTNAME] = hostname
+        if patterns:
+            matchers.append((domain, patterns))
 
     return DhcpMatchers(
         registered_devices_domains=registered_devices_domains,
-        no_oui_matchers=no_oui_matchers,
-        oui_matchers=oui_matchers,
+        matchers=DiscoveryMatcherIndex(matchers),
     )
 
 
@@ -251,23 +244,10 @@ class WatcherBase:
                 ) and entry.domain in registered_devices_domains:
                     matched_domains.add(entry.domain)
 
-        oui = uppercase_mac[:6]
-        lowercase_hostname_first_char = (
-            lowercase_hostname[0] if len(lowercase_hostname) else ""
-        )
-        for matcher in itertools.chain(
-            matchers.no_oui_matchers.get(lowercase_hostname_first_char, ()),
-            matchers.oui_matchers.get(oui, ()),
+        for domain in matchers.matchers.match(
+            {MAC_ADDRESS: uppercase_mac, HOSTNAME: lowercase_hostname}
         ):
-            domain = matcher["domain"]
-            if (
-                matcher_hostname := matcher.get(HOSTNAME)
-            ) is not None and not _memorized_fnmatch(
-                lowercase_hostname, matcher_hostname
-            ):
-                continue
-
-            _LOGGER.debug("Matched %s against %s", data, matcher)
+            _LOGGER.debug("Matched %s against %s", data, domain)
             matched_domains.add(domain)
 
         for domain in matched_domains:
@@ -411,24 +391,3 @@ class DHCPWatcher(WatcherBase):
     async def async_start(self) -> None:
         """Start watching for dhcp packets."""
         self._unsub = await aiodhcpwatcher.async_start(self._async_process_dhcp_request)
-
-
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    DHCP has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
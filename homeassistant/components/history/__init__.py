@@ -21,7 +21,16 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import DOMAIN
+from .cache import HistoryCache
+from .const import (
+    CONF_CACHE,
+    CONF_MAX_AGE,
+    CONF_MAX_STATES,
+    DATA_HISTORY_CACHE,
+    DEFAULT_CACHE_MAX_AGE,
+    DEFAULT_CACHE_MAX_STATES,
+    DOMAIN,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 CONF_ORDER = "use_include_order"
@@ -35,7 +44,19 @@ CONFIG_SCHEMA = vol.Schema(
             cv.deprecated(CONF_EXCLUDE),
             cv.deprecated(CONF_ORDER),
             INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
-                {vol.Optional(CONF_ORDER, default=False): cv.boolean}
+                {
+                    vol.Optional(CONF_ORDER, default=False): cv.boolean,
+                    vol.Optional(CONF_CACHE): vol.Schema(
+                        {
+                            vol.Optional(
+                                CONF_MAX_STATES, default=DEFAULT_CACHE_MAX_STATES
+                            ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                            vol.Optional(
+                                CONF_MAX_AGE, default=DEFAULT_CACHE_MAX_AGE
+                            ): cv.positive_time_period,
+                        }
+                    ),
+                }
             ),
         )
     },
@@ -45,6 +66,12 @@ CONFIG_SCHEMA = vol.Schema(
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the history hooks."""
+    if (conf := config.get(DOMAIN)) and (cache_conf := conf.get(CONF_CACHE)):
+        cache = HistoryCache(
+            hass, cache_conf[CONF_MAX_STATES], cache_conf[CONF_MAX_AGE]
+        )
+        cache.async_setup()
+        hass.data[DATA_HISTORY_CACHE] = cache
     hass.http.register_view(HistoryPeriodView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
@@ -118,7 +145,7 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_read_executor_job(
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -0,0 +1,443 @@
+"""In-memory cache of the recent states of the recorded entities.
+
+The cache keeps a bounded buffer of the states of each recorded entity,
+fed from the live state_changed events, so the history of the recent
+period can be answered without querying the database.
+
+The states of an entity are stored as columns: the timestamps in float
+arrays and the state strings in a list, where repeated states share a
+single string. The attributes are only stored when they change. An entity
+is known to be complete from the time of the first state in its buffer,
+which is either the first state changed event seen for it or the state it
+had when the cache was set up. Periods starting before that are answered
+from the database up to that time and from the cache afterwards.
+
+The cache is only accessed from the event loop, the states are snapshot
+there and converted to the response in the executor.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any, cast
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of distinct states of an entity which share a single string
+MAX_SHARED_STATES = 32
+
+
+@dataclass(slots=True)
+class CachedStates:
+    """States of an entity during a period snapshot from the cache.
+
+    If complete is set the states cover the whole period, including the
+    state at the start time if it was requested. Otherwise they are the
+    states from split_ts on and the earlier states of the period have to
+    be read from the database.
+    """
+
+    states: list[str | None]
+    last_updated_ts: array[float]
+    last_changed_ts: array[float]
+    attributes: list[Mapping[str, Any]]
+    split_ts: float
+    complete: bool
+
+
+class _EntityStates:
+    """Columns of the cached states of an entity."""
+
+    __slots__ = (
+        "attributes",
+        "attributes_index",
+        "last_changed_ts",
+        "last_updated_ts",
+        "offset",
+        "raw_attributes",
+        "shared_states",
+        "states",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.states: list[str | None] = []
+        self.last_updated_ts = array("d")
+        self.last_changed_ts = array("d")
+        # The recorded attributes and the absolute index of the first state
+        # they were set on, offset is the absolute index of the first state
+        self.attributes: list[Mapping[str, Any]] = []
+        self.attributes_index = array("q")
+        self.offset = 0
+        self.raw_attributes: Mapping[str, Any] | None = None
+        self.shared_states: dict[str, str] = {}
+
+    def append(self, state: State | None, timestamp: float) -> None:
+        """Append a state, None if the entity was removed."""
+        if state is None:
+            state_value: str | None = None
+            last_updated_ts = last_changed_ts = timestamp
+            raw_attributes: Mapping[str, Any] = {}
+        else:
+            state_value = state.state
+            if (shared := self.shared_states.get(state_value)) is not None:
+                state_value = shared
+            elif len(self.shared_states) < MAX_SHARED_STATES:
+                self.shared_states[state_value] = state_value
+            last_updated_ts = state.last_updated_timestamp
+            last_changed_ts = state.last_changed_timestamp
+            raw_attributes = state.attributes
+        if raw_attributes is not self.raw_attributes:
+            # The state machine keeps the attributes object if the
+            # attributes did not change
+            self.raw_attributes = raw_attributes
+            if state is None:
+                recorded_attributes: Mapping[str, Any] = raw_attributes
+            else:
+                excluded = StateAttributes.excluded_attributes(state)
+                recorded_attributes = {
+                    key: value
+                    for key, value in raw_attributes.items()
+                    if key not in excluded
+                }
+            self.attributes.append(recorded_attributes)
+            self.attributes_index.append(self.offset + len(self.states))
+        self.states.append(state_value)
+        self.last_updated_ts.append(last_updated_ts)
+        self.last_changed_ts.append(last_changed_ts)
+
+    def trim(self, count: int) -> None:
+        """Drop the oldest states."""
+        new_offset = self.offset + count
+        # Keep the attributes of the first remaining state
+        keep = bisect_right(self.attributes_index, new_offset) - 1
+        del self.attributes[:keep]
+        del self.attributes_index[:keep]
+        self.attributes_index[0] = new_offset
+        del self.states[:count]
+        del self.last_updated_ts[:count]
+        del self.last_changed_ts[:count]
+        self.offset = new_offset
+
+    def snapshot(
+        self, start: int, end: int, split_ts: float, complete: bool
+    ) -> CachedStates:
+        """Return a snapshot of the states between two indices."""
+        attributes_index = self.attributes_index
+        position = bisect_right(attributes_index, self.offset + start) - 1
+        next_change = (
+            attributes_index[position + 1] - self.offset
+            if position + 1 < len(attributes_index)
+            else end
+        )
+        attributes: list[Mapping[str, Any]] = []
+        for index in range(start, end):
+            if index >= next_change:
+                position += 1
+                next_change = (
+                    attributes_index[position + 1] - self.offset
+                    if position + 1 < len(attributes_index)
+                    else end
+                )
+            attributes.append(self.attributes[position])
+        return CachedStates(
+            self.states[start:end],
+            self.last_updated_ts[start:end],
+            self.last_changed_ts[start:end],
+            attributes,
+            split_ts,
+            complete,
+        )
+
+
+class HistoryCache:
+    """Cache of the recent states of the recorded entities."""
+
+    def __init__(
+        self, hass: HomeAssistant, max_states: int, max_age: timedelta
+    ) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.max_states = max_states
+        self.max_age = max_age.total_seconds()
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self._entities: dict[str, _EntityStates] = {}
+        # Drop the oldest states in batches to avoid moving the
+        # columns on every state change
+        self._trim_batch = max(1, max_states // 16)
+
+    @callback
+    def async_setup(self) -> None:
+        """Start caching the states of the recorded entities."""
+        instance = get_instance(self.hass)
+        if EVENT_STATE_CHANGED in instance.exclude_event_types:
+            return
+        entity_filter = instance.entity_filter
+        now_ts = time.time()
+        for state in self.hass.states.async_all():
+            if entity_filter is None or entity_filter(state.entity_id):
+                self._async_append(state.entity_id, state, now_ts)
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, self._async_is_recorded
+        )
+
+    @callback
+    def _async_is_recorded(self, event_data: EventStateChangedData) -> bool:
+        """Return if the recorder records the states of an entity."""
+        entity_filter = get_instance(self.hass).entity_filter
+        return entity_filter is None or entity_filter(event_data["entity_id"])
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Cache a changed state."""
+        self._async_append(
+            event.data["entity_id"], event.data["new_state"], event.time_fired_timestamp
+        )
+
+    @callback
+    def _async_append(self, entity_id: str, state: State | None, now_ts: float) -> None:
+        """Append a state to the cached states of an entity."""
+        if (entity_states := self._entities.get(entity_id)) is None:
+            entity_states = self._entities[entity_id] = _EntityStates()
+        last_updated_ts = state.last_updated_timestamp if state else now_ts
+        if (
+            entity_states.last_updated_ts
+            and last_updated_ts < entity_states.last_updated_ts[-1]
+        ):
+            # The states must be ordered, start over if a state was
+            # written with an earlier timestamp
+            entity_states = self._entities[entity_id] = _EntityStates()
+        entity_states.append(state, now_ts)
+        count = len(entity_states.states)
+        if count > self.max_states:
+            entity_states.trim(
+                min(count - self.max_states + self._trim_batch, count - 1)
+            )
+        elif entity_states.last_updated_ts[0] < now_ts - self.max_age:
+            # Keep the last state before the cut off, it is the state
+            # at the start of the cached period
+            old = bisect_left(entity_states.last_updated_ts, now_ts - self.max_age) - 1
+            if old >= self._trim_batch:
+                entity_states.trim(old)
+
+    @callback
+    def async_get_states(
+        self,
+        entity_ids: list[str],
+        start_time: datetime,
+        end_time: datetime | None,
+        include_start_time_state: bool,
+    ) -> dict[str, CachedStates] | None:
+        """Return a snapshot of the cached states of entities during a period.
+
+        Returns None if the states of an entity are not cached.
+        """
+        instance = get_instance(self.hass)
+        recording_start_ts = instance.recorder_runs_manager.recording_start.timestamp()
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp() if end_time else None
+        cached: dict[str, CachedStates] = {}
+        for entity_id in entity_ids:
+            if (entity_states := self._entities.get(entity_id)) is None:
+                self.misses += 1
+                _LOGGER.debug("History cache miss for %s", entity_id)
+                return None
+            last_updated_ts = entity_states.last_updated_ts
+            # Only the states recorded since the recorder started are
+            # known to be in the database
+            split_ts = max(last_updated_ts[0], recording_start_ts)
+            # The database has neither the states at nor the states
+            # before the start time in the period
+            start = bisect_left(last_updated_ts, max(start_ts, split_ts))
+            if not include_start_time_state:
+                complete = start_ts >= split_ts
+            elif complete := (
+                start > 0
+                and recording_start_ts <= last_updated_ts[start - 1] < start_ts
+            ):
+                start -= 1
+            end = (
+                len(last_updated_ts)
+                if end_ts is None
+                else bisect_left(last_updated_ts, end_ts)
+            )
+            cached[entity_id] = entity_states.snapshot(
+                start, max(start, end), split_ts, complete
+            )
+        if all(entity_cached.complete for entity_cached in cached.values()):
+            self.hits += 1
+        else:
+            self.partial_hits += 1
+        _LOGGER.debug(
+            "History cache hits: %s, partial hits: %s, misses: %s",
+            self.hits,
+            self.partial_hits,
+            self.misses,
+        )
+        return cached
+
+
+def _compressed_states(
+    entity_id: str,
+    cached: CachedStates,
+    start_time_ts: float,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    ent_results: list[dict[str, Any]],
+) -> None:
+    """Append cached states in the compressed format of the database history.
+
+    ent_results holds the states read from the database before the
+    cached states, if any.
+    """
+    domain = split_entity_id(entity_id)[0]
+    significant_only = (
+        significant_changes_only and domain not in history.SIGNIFICANT_DOMAINS
+    )
+    include_last_changed = not significant_changes_only
+    minimal = minimal_response and domain not in history.NEED_ATTRIBUTE_DOMAINS
+    has_start_time_state = include_start_time_state and cached.complete
+    prev_state = ent_results[-1][COMPRESSED_STATE_STATE] if ent_results else None
+    for index, (state, last_updated_ts, last_changed_ts, attributes) in enumerate(
+        zip(
+            cached.states,
+            cached.last_updated_ts,
+            cached.last_changed_ts,
+            cached.attributes,
+            strict=True,
+        )
+    ):
+        if is_start_time_state := has_start_time_state and index == 0:
+            last_updated_ts = start_time_ts
+        elif last_updated_ts <= start_time_ts or (
+            significant_only and last_changed_ts != last_updated_ts
+        ):
+            continue
+        if minimal and ent_results:
+            # With minimal response only the changes of the state
+            # are provided after the first state
+            if state != prev_state:
+                ent_results.append(
+                    {
+                        COMPRESSED_STATE_STATE: (prev_state := state),
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                    }
+                )
+            continue
+        comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state}
+        if not minimal:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = (
+                {} if no_attributes else attributes
+            )
+        elif not no_attributes:
+            comp_state[COMPRESSED_STATE_ATTRIBUTES] = attributes
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = last_updated_ts
+        if (
+            include_last_changed
+            and not is_start_time_state
+            and last_changed_ts != last_updated_ts
+        ):
+            comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed_ts
+        ent_results.append(comp_state)
+        prev_state = state
+
+
+def get_significant_states_with_cache(
+    hass: HomeAssistant,
+    cached: dict[str, CachedStates],
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the significant states in the compressed format from the cache.
+
+    This returns the same states as get_significant_states, the states
+    which are not complete in the cache are read from the database up
+    to the first cached state.
+    """
+    db_states: dict[str, list[dict[str, Any]]] = {}
+    if split_times := [
+        entity_cached.split_ts
+        for entity_cached in cached.values()
+        if not entity_cached.complete
+    ]:
+        db_end_time = dt_util.utc_from_timestamp(max(split_times))
+        if end_time is not None and end_time < db_end_time:
+            db_end_time = end_time
+        # The other entities are queried as well as the states at the
+        # start time depend on the number of entities
+        db_states = cast(
+            dict[str, list[dict[str, Any]]],
+            history.get_significant_states(
+                hass,
+                start_time,
+                db_end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            ),
+        )
+    start_time_ts = start_time.timestamp()
+    result: dict[str, list[dict[str, Any]]] = {}
+    for entity_id in entity_ids:
+        entity_cached = cached[entity_id]
+        ent_results: list[dict[str, Any]] = []
+        if not entity_cached.complete:
+            # The state at the start time has the start time as last_updated
+            ent_results = [
+                comp_state
+                for comp_state in db_states.get(entity_id, ())
+                if (last_updated_ts := comp_state[COMPRESSED_STATE_LAST_UPDATED])
+                < entity_cached.split_ts
+                or last_updated_ts == start_time_ts
+            ]
+        _compressed_states(
+            entity_id,
+            entity_cached,
+            start_time_ts,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            ent_results,
+        )
+        if ent_results:
+            result[entity_id] = ent_results
+    return result
@@ -1,7 +1,30 @@
 """History integration constants."""
 
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.util.hass_dict import HassKey
+
+if TYPE_CHECKING:
+    from .cache import HistoryCache
+
 DOMAIN = "history"
 
+DATA_HISTORY_CACHE: HassKey[HistoryCache] = HassKey(f"{DOMAIN}_cache")
+
+CONF_CACHE = "cache"
+CONF_MAX_AGE = "max_age"
+CONF_MAX_STATES = "max_states"
+
+# Number of states cached per entity, a state every 30 seconds for a day
+DEFAULT_CACHE_MAX_STATES = 2880
+DEFAULT_CACHE_MAX_AGE = timedelta(days=1)
+
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Number of states sent per message by a chunked history during period
+HISTORY_CHUNK_SIZE = 1000
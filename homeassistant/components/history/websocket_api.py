@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import (
@@ -39,7 +40,13 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .cache import CachedStates, get_significant_states_with_cache
+from .const import (
+    DATA_HISTORY_CACHE,
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_SIZE,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -94,6 +101,130 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_cached_significant_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    cached: dict[str, CachedStates],
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> bytes:
+    """Convert cached significant_states to json in the executor."""
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            get_significant_states_with_cache(
+                hass,
+                cached,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            ),
+        )
+    )
+
+
+def _ws_send_significant_states_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    Each chunk is converted to json here and handed to the event loop. The
+    next chunk is only read from the database once the websocket writer has
+    sent the chunk to the client, so only one chunk is held in memory
+    regardless of the length of the period or the speed of the client.
+    """
+    states: dict[str, list[dict[str, Any]]] = {}
+    pending = 0
+    with session_scope(hass=hass, read_only=True) as session:
+        for entity_id, chunk in history.iter_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+            HISTORY_CHUNK_SIZE,
+        ):
+            states.setdefault(entity_id, []).extend(cast(list[dict[str, Any]], chunk))
+            pending += len(chunk)
+            if pending < HISTORY_CHUNK_SIZE:
+                continue
+            if not _send_history_chunk(hass, connection, msg_id, states):
+                return
+            states = {}
+            pending = 0
+    if states:
+        _send_history_chunk(hass, connection, msg_id, states)
+
+
+def _send_history_chunk(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    states: dict[str, list[dict[str, Any]]],
+) -> bool:
+    """Send a chunk of history from the executor and wait until it was sent.
+
+    Returns False if the client unsubscribed.
+    """
+    return asyncio.run_coroutine_threadsafe(
+        _async_send_history_chunk(
+            connection,
+            msg_id,
+            json_bytes(messages.event_message(msg_id, {"states": states})),
+        ),
+        hass.loop,
+    ).result()
+
+
+async def _async_send_history_chunk(
+    connection: ActiveConnection, msg_id: int, message: bytes
+) -> bool:
+    """Send a chunk of history if the client is still subscribed.
+
+    Waits until the writer sent the chunk to the client.
+    """
+    if msg_id not in connection.subscriptions:
+        return False
+    connection.send_message(message)
+    await connection.async_wait_sent()
+    return True
+
+
+@callback
+def _async_send_empty_history_response(
+    connection: ActiveConnection, msg_id: int, chunked: bool
+) -> None:
+    """Send an empty history during period response."""
+    if not chunked:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    connection.send_message(messages.event_message(msg_id, {"done": True}))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -104,15 +235,23 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    With chunked set, the command is acknowledged with an empty result and
+    the states are sent as events with a "states" key holding at most
+    about HISTORY_CHUNK_SIZE states. The states of an entity may be split
+    over consecutive events. The last event has "done" set.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
+    chunked: bool = msg["chunked"]
 
     if start_time := dt_util.parse_datetime(start_time_str):
         start_time = dt_util.as_utc(start_time)
@@ -130,7 +269,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_response(connection, msg["id"], chunked)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -150,14 +289,62 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_response(connection, msg["id"], chunked)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunked:
+        msg_id: int = msg["id"]
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        try:
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_send_significant_states_chunks,
+                hass,
+                connection,
+                msg_id,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                queue_key=connection,
+            )
+        finally:
+            subscribed = connection.subscriptions.pop(msg_id, None) is not None
+        if subscribed:
+            connection.send_message(messages.event_message(msg_id, {"done": True}))
+        return
+
+    if (cache := hass.data.get(DATA_HISTORY_CACHE)) and (
+        cached := cache.async_get_states(
+            entity_ids, start_time, end_time, include_start_time_state
+        )
+    ):
+        connection.send_message(
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_get_cached_significant_states,
+                hass,
+                msg["id"],
+                cached,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                queue_key=connection,
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -168,6 +355,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            queue_key=connection,
         )
     )
 
@@ -280,7 +468,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -292,6 +480,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        queue_key=connection,
     )
     if payload:
         connection.send_message(payload)
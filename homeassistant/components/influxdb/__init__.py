@@ -14,7 +14,7 @@ from typing import Any
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
-from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
+from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.rest import ApiException
 import requests.exceptions
 import urllib3.exceptions
@@ -47,12 +47,16 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     API_VERSION_2,
     BATCH_BUFFER_SIZE,
+    BATCH_BUFFER_SIZE_MAX,
     BATCH_TIMEOUT,
+    BATCH_TIMEOUT_MAX,
+    BATCH_WRITE_TARGET,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
     CLIENT_ERROR_V2,
@@ -96,12 +100,18 @@ from .const import (
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_CHUNK_BYTES,
+    SPOOL_ERROR_MESSAGE,
+    SPOOL_FILE,
+    SPOOL_FULL_MESSAGE,
+    SPOOL_MAX_BYTES,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -200,6 +210,42 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
+_MEASUREMENT_ESCAPE = str.maketrans(
+    {
+        "\\": r"\\",
+        ",": r"\,",
+        " ": r"\ ",
+        "\n": r"\n",
+        "\r": r"\r",
+        "\t": r"\t",
+    }
+)
+_KEY_ESCAPE = str.maketrans(
+    {
+        "\\": r"\\",
+        ",": r"\,",
+        "=": r"\=",
+        " ": r"\ ",
+        "\n": r"\n",
+        "\r": r"\r",
+        "\t": r"\t",
+    }
+)
+# Newlines in string fields are escaped so every point is a single line
+_STRING_ESCAPE = str.maketrans({"\\": r"\\", '"': r"\"", "\n": r"\n"})
+
+# Multiplier and divisor of a timestamp in microseconds for each precision
+_PRECISION_SCALE: dict[str | None, tuple[int, int]] = {
+    None: (1000, 1),
+    "ns": (1000, 1),
+    "us": (1, 1),
+    "ms": (1, 1000),
+    "s": (1, 1000000),
+}
+
+# The V1 API names some precisions differently
+_V1_PRECISION = {"ns": "n", "us": "u"}
+
 
 def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | None]:
     """Build event to json converter and add to config."""
@@ -321,12 +367,50 @@ def _generate_event_to_json(conf: dict) -> Callable[[Event], dict[str, Any] | No
     return event_to_json
 
 
+def _json_to_line(json: dict[str, Any], timestamp: int) -> bytes | None:
+    """Encode json in format Influx expects as a line of line protocol."""
+    fields = []
+    for key, value in json[INFLUX_CONF_FIELDS].items():
+        key = str(key).translate(_KEY_ESCAPE)
+        if isinstance(value, str):
+            fields.append(f'{key}="{value.translate(_STRING_ESCAPE)}"')
+        elif math.isfinite(value := float(value)):
+            fields.append(f"{key}={value!r}")
+    if not fields:
+        return None
+
+    # Measurements and tags may be set from attributes of any type
+    series = [str(json[INFLUX_CONF_MEASUREMENT]).translate(_MEASUREMENT_ESCAPE)]
+    tags = {str(key): value for key, value in json[INFLUX_CONF_TAGS].items()}
+    for key, value in sorted(tags.items()):
+        if value is None or (value := str(value)) == "":
+            continue
+        series.append(f"{key.translate(_KEY_ESCAPE)}={value.translate(_KEY_ESCAPE)}")
+
+    return f"{','.join(series)} {','.join(fields)} {timestamp}\n".encode()
+
+
+def _generate_event_to_line(conf: dict) -> Callable[[Event], bytes | None]:
+    """Build event to line protocol converter."""
+    event_to_json = _generate_event_to_json(conf)
+    multiplier, divisor = _PRECISION_SCALE[conf.get(CONF_PRECISION)]
+
+    def event_to_line(event: Event) -> bytes | None:
+        """Convert event into a line of line protocol."""
+        if (json := event_to_json(event)) is None:
+            return None
+        microseconds = round(event.time_fired_timestamp * 1000000)
+        return _json_to_line(json, microseconds * multiplier // divisor)
+
+    return event_to_line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
 
     data_repositories: list[str]
-    write: Callable[[str], None]
+    write: Callable[[bytes], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
 
@@ -351,12 +435,12 @@ def get_influx_connection(  # noqa: C901
         bucket = conf.get(CONF_BUCKET)
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
-        initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
-        write_api = influx.write_api(write_options=initial_write_mode)
+        # Writes are batched by the writer thread, which spools them on errors
+        write_api = influx.write_api(write_options=SYNCHRONOUS)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write line protocol to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -367,7 +451,7 @@ def get_influx_connection(  # noqa: C901
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -391,7 +475,6 @@ def get_influx_connection(  # noqa: C901
             # Then invalid inputs is returned. Anything else is a broken config
             with suppress(ValueError):
                 write_v2(b"")
-            write_api = influx.write_api(write_options=ASYNCHRONOUS)
 
         if test_read:
             tables = query_v2(TEST_QUERY_V2)
@@ -430,11 +513,23 @@ def get_influx_connection(  # noqa: C901
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
     influx = InfluxDBClient(**kwargs)
+    write_params = {}
+    if CONF_DB_NAME in conf:
+        write_params["db"] = conf[CONF_DB_NAME]
+    if precision is not None:
+        write_params["precision"] = _V1_PRECISION.get(precision, precision)
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write line protocol to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.request(
+                url="write",
+                method="POST",
+                params=write_params,
+                data=lines,
+                expected_response_code=204,
+                headers={"Content-Type": "application/octet-stream"},
+            )
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -443,7 +538,7 @@ def get_influx_connection(  # noqa: C901
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -467,7 +562,7 @@ def get_influx_connection(  # noqa: C901
 
     databases = []
     if test_write:
-        write_v1([])
+        write_v1(b"")
 
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
@@ -491,9 +586,18 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         )
         return True
 
-    event_to_json = _generate_event_to_json(conf)
+    event_to_line = _generate_event_to_line(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    # Lines are encoded with the configured precision, so each has its own spool
+    spool = InfluxSpool(
+        hass.config.path(
+            STORAGE_DIR, f"{SPOOL_FILE}.{conf.get(CONF_PRECISION) or 'ns'}"
+        ),
+        SPOOL_MAX_BYTES,
+    )
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_line, max_tries, spool
+    )
     instance.start()
 
     def shutdown(event):
@@ -508,18 +612,28 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    Events are encoded to line protocol and written in batches. The size of
+    a batch and the time to wait for it to fill up adapt to how long the
+    writes take. Batches which cannot be written are spooled to disk and
+    written again, oldest first, once InfluxDB accepts writes again.
+    """
+
+    def __init__(self, hass, influx, event_to_line, max_tries, spool):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
             queue.SimpleQueue()
         )
         self.influx = influx
-        self.event_to_json = event_to_json
+        self.event_to_line = event_to_line
         self.max_tries = max_tries
+        self.spool: InfluxSpool = spool
+        self.batch_size = BATCH_BUFFER_SIZE
+        self.flush_interval: float = BATCH_TIMEOUT
         self.write_errors = 0
+        self.write_failed = False
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -529,25 +643,31 @@ class InfluxThread(threading.Thread):
         item = (time.monotonic(), event)
         self.queue.put(item)
 
-    @staticmethod
-    def batch_timeout():
-        """Return number of seconds to wait for more events."""
-        return BATCH_TIMEOUT
+    def batch_timeout(self) -> float:
+        """Return number of seconds to wait for a batch to fill up."""
+        return self.flush_interval
 
-    def get_events_json(self):
-        """Return a batch of events formatted for writing."""
-        queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
+    def get_events_lines(self) -> tuple[list[bytes], list[threading.Event]]:
+        """Return a batch of events encoded for writing.
 
-        count = 0
-        json = []
+        Events which waited longer in the queue than it takes to write them
+        are spooled, so the thread catches up without losing them. Also
+        returns the events of callers waiting for the batch to be written.
+        """
+        queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
 
-        dropped = 0
+        lines: list[bytes] = []
+        stale: list[bytes] = []
+        waiters: list[threading.Event] = []
+        deadline: float | None = None
+        # Do not wait for events while there are spooled lines to write
+        timeout: float | None = 0 if self.spool and not self.write_failed else None
 
         with suppress(queue.Empty):
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
-                timeout = None if count == 0 else self.batch_timeout()
+            while len(lines) < self.batch_size and not self.shutdown:
                 item = self.queue.get(timeout=timeout)
-                count += 1
+                if deadline is None:
+                    deadline = time.monotonic() + self.batch_timeout()
 
                 if item is None:
                     self.shutdown = True
@@ -555,48 +675,98 @@ class InfluxThread(threading.Thread):
                     timestamp, event = item
                     age = time.monotonic() - timestamp
 
-                    if age < queue_seconds:
-                        if event_json := self.event_to_json(event):
-                            json.append(event_json)
-                    else:
-                        dropped += 1
+                    try:
+                        line = self.event_to_line(event)
+                    except Exception:
+                        # A single event must not stop the thread writing all events
+                        _LOGGER.exception("Error converting event %s", event)
+                        line = None
+                    if line:
+                        if age < queue_seconds:
+                            lines.append(line)
+                        else:
+                            stale.append(line)
                 elif isinstance(item, threading.Event):
-                    item.set()
+                    waiters.append(item)
+                    break
 
-        if dropped:
-            _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+                timeout = max(deadline - time.monotonic(), 0)
 
-        return count, json
+        if stale:
+            _LOGGER.warning(CATCHING_UP_MESSAGE, len(stale))
+            self.spool_lines(stale)
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
-        for retry in range(self.max_tries + 1):
-            try:
-                self.influx.write(json)
+        return lines, waiters
 
-                if self.write_errors:
-                    _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
-                    self.write_errors = 0
+    def spool_lines(self, lines: list[bytes]) -> None:
+        """Spool lines to write them later."""
+        try:
+            spooled = self.spool.append(lines)
+        except OSError as err:
+            _LOGGER.error(SPOOL_ERROR_MESSAGE, len(lines), err)
+        else:
+            if not spooled:
+                _LOGGER.error(SPOOL_FULL_MESSAGE, len(lines))
+
+    def adapt_batching(self, count: int, duration: float) -> None:
+        """Adapt the batch size and flush interval to the last write."""
+        if duration > BATCH_WRITE_TARGET:
+            self.batch_size = max(self.batch_size // 2, BATCH_BUFFER_SIZE)
+        elif count >= self.batch_size:
+            self.batch_size = min(self.batch_size * 2, BATCH_BUFFER_SIZE_MAX)
+        # Do not flush more often than InfluxDB can take the writes
+        self.flush_interval = min(max(duration, BATCH_TIMEOUT), BATCH_TIMEOUT_MAX)
+
+    def write_to_influxdb(self, lines: list[bytes]) -> None:
+        """Write spooled and encoded events to influxdb, with retry."""
+        try:
+            spooled = self.spool.read(SPOOL_CHUNK_BYTES)
+        except OSError as err:
+            _LOGGER.error(err)
+            self.spool.clear()
+            spooled = b""
+        data = spooled + b"".join(lines)
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
-                break
+        for retry in range(self.max_tries + 1):
+            start = time.monotonic()
+            try:
+                self.influx.write(data)
             except ValueError as err:
+                # Points that are not invalid have been written anyway
                 _LOGGER.error(err)
-                break
+                self.write_failed = False
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
-                else:
-                    if not self.write_errors:
-                        _LOGGER.error(err)
-                    self.write_errors += len(json)
+                    continue
+                if not self.write_failed:
+                    _LOGGER.error(err)
+                self.write_failed = True
+                self.write_errors += len(lines)
+                self.spool_lines(lines)
+                return
+            else:
+                self.write_failed = False
+                self.adapt_batching(len(lines), time.monotonic() - start)
+                if self.write_errors:
+                    _LOGGER.warning(RESUMED_MESSAGE, self.write_errors)
+                    self.write_errors = 0
+                _LOGGER.debug(WROTE_MESSAGE, len(lines))
+            self.spool.consume(len(spooled))
+            return
 
     def run(self):
         """Process incoming events."""
+        try:
+            self.spool.load()
+        except OSError as err:
+            _LOGGER.error(err)
         while not self.shutdown:
-            _, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            lines, waiters = self.get_events_lines()
+            if lines or (self.spool and not self.write_failed):
+                self.write_to_influxdb(lines)
+            for waiter in waiters:
+                waiter.set()
 
     def block_till_done(self):
         """Block till all events processed.
@@ -77,7 +77,13 @@ RETRY_DELAY = 20
 QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
+BATCH_TIMEOUT_MAX = 10
 BATCH_BUFFER_SIZE = 100
+BATCH_BUFFER_SIZE_MAX = 5000
+BATCH_WRITE_TARGET = 1  # seconds
+SPOOL_FILE = "influxdb_spool"
+SPOOL_MAX_BYTES = 50 * 1024 * 1024
+SPOOL_CHUNK_BYTES = 1024 * 1024
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -117,8 +123,10 @@ QUERY_ERROR = (
     "Could not execute query '%s' due to '%s'. Check the syntax of your query."
 )
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
-CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
-RESUMED_MESSAGE = "Resumed, lost %d events."
+CATCHING_UP_MESSAGE = "Catching up, spooled %d old events."
+RESUMED_MESSAGE = "Resumed, backfilling %d spooled events."
+SPOOL_FULL_MESSAGE = "Spool is full, dropped %d events."
+SPOOL_ERROR_MESSAGE = "Could not spool %d events due to '%s'."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
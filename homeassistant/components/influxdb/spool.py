@@ -0,0 +1,91 @@
+"""Bounded on-disk spool of line protocol that could not be written yet.
+
+While InfluxDB is unreachable the writer appends the encoded lines to the
+spool instead of dropping them and writes them back in chunks, oldest
+first, once the server accepts writes again. The read position is only
+kept in memory, so after a restart the spool is written from the start
+again. InfluxDB overwrites points with the same series and timestamp, so
+writing a line twice does not duplicate data.
+
+The spool is only used from the writer thread.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+import os
+
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+class InfluxSpool:
+    """File of encoded lines waiting to be written."""
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self._offset = 0
+        self._size = 0
+
+    def __bool__(self) -> bool:
+        """Return if lines are waiting to be written."""
+        return self._offset < self._size
+
+    def load(self) -> None:
+        """Pick up the lines spooled before a restart.
+
+        A line torn by a crash while it was appended is cut off.
+        """
+        try:
+            with open(self.path, "rb+") as file:
+                size = file.seek(0, os.SEEK_END)
+                end = size
+                while end:
+                    start = max(end - TAIL_BLOCK_SIZE, 0)
+                    file.seek(start)
+                    newline = file.read(end - start).rfind(b"\n")
+                    if newline != -1:
+                        end = start + newline + 1
+                        break
+                    end = start
+                if end != size:
+                    file.truncate(end)
+        except FileNotFoundError:
+            end = 0
+        self._offset = 0
+        self._size = end
+
+    def append(self, lines: list[bytes]) -> bool:
+        """Append lines to the spool, return False if the spool is full."""
+        data = b"".join(lines)
+        if self._size + len(data) > self.max_bytes:
+            return False
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "ab") as file:
+            file.write(data)
+        self._size += len(data)
+        return True
+
+    def read(self, max_bytes: int) -> bytes:
+        """Return the oldest spooled lines, about max_bytes in total."""
+        if not self:
+            return b""
+        with open(self.path, "rb") as file:
+            file.seek(self._offset)
+            data = file.read(max_bytes)
+            if not data.endswith(b"\n"):
+                data += file.readline()
+        return data
+
+    def consume(self, size: int) -> None:
+        """Drop the given number of bytes that have been written."""
+        self._offset += size
+        if self._offset >= self._size:
+            self.clear()
+
+    def clear(self) -> None:
+        """Remove all spooled lines."""
+        self._offset = self._size = 0
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -36,6 +37,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.collection import chunked_or_all
 import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
@@ -81,6 +83,7 @@ from .models import (
 )
 from .queries import statement_for_request
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
+from .queries.context import context_origins_stmt
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -180,9 +183,36 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            rows = execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            if self.entity_ids or self.device_ids:
+                # The rows that started the contexts are not part of the
+                # result of entity and device queries
+                rows = list(rows)
+                self._load_context_origins(session, rows)
+            return self.humanify(rows)
+
+    def _load_context_origins(self, session: Session, rows: list[Row]) -> None:
+        """Load the rows that started the contexts the rows reference."""
+        context_lookup = self.logbook_run.context_lookup
+        context_ids_bin = {
+            context_id_bin
+            for row in rows
+            for context_id_bin in (
+                row[CONTEXT_ID_BIN_POS],
+                row[CONTEXT_PARENT_ID_BIN_POS],
             )
+            if context_id_bin not in context_lookup
+        }
+        # Each chunk is bound twice, once for the events and once for the states
+        for context_ids_chunk in chunked_or_all(
+            context_ids_bin, get_instance(self.hass).max_bind_vars // 2
+        ):
+            for row in execute_stmt_lambda_element(
+                session, context_origins_stmt(list(context_ids_chunk)), orm_rows=False
+            ):
+                # Rows are ordered by time so the first row started the context
+                if (context_id_bin := row[CONTEXT_ID_BIN_POS]) not in context_lookup:
+                    context_lookup[context_id_bin] = row
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -0,0 +1,73 @@
+"""Context queries for logbook."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import func, lambda_stmt, select, union_all
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.sql.selectable import Select
+
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    select_events_context_only,
+    select_states_context_only,
+)
+
+CONTEXT_EVENTS = aliased(Events, name="context_events")
+CONTEXT_STATES = aliased(States, name="context_states")
+
+
+def context_origins_stmt(context_ids_bin: Collection[bytes]) -> StatementLambdaElement:
+    """Generate a query for the rows that started the given contexts.
+
+    The first event and the first state of each context are looked up
+    with the context_id_bin indices, the earlier of both started it.
+    """
+    return lambda_stmt(
+        lambda: union_all(
+            _select_events_context_origins(context_ids_bin),
+            _select_states_context_origins(context_ids_bin),
+        ).order_by("time_fired_ts")
+    )
+
+
+def _select_events_context_origins(context_ids_bin: Collection[bytes]) -> Select:
+    """Generate a select for the first event of each context."""
+    return apply_events_context_hints(
+        select_events_context_only()
+        .where(Events.context_id_bin.in_(context_ids_bin))
+        .where(
+            Events.time_fired_ts
+            == select(func.min(CONTEXT_EVENTS.time_fired_ts))
+            .where(CONTEXT_EVENTS.context_id_bin == Events.context_id_bin)
+            .scalar_subquery()
+        )
+        .outerjoin(EventTypes, (Events.event_type_id == EventTypes.event_type_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id))
+    )
+
+
+def _select_states_context_origins(context_ids_bin: Collection[bytes]) -> Select:
+    """Generate a select for the first state of each context."""
+    return apply_states_context_hints(
+        select_states_context_only()
+        .where(States.context_id_bin.in_(context_ids_bin))
+        .where(
+            States.last_updated_ts
+            == select(func.min(CONTEXT_STATES.last_updated_ts))
+            .where(CONTEXT_STATES.context_id_bin == States.context_id_bin)
+            .scalar_subquery()
+        )
+        .outerjoin(StatesMeta, (States.metadata_id == StatesMeta.metadata_id))
+    )
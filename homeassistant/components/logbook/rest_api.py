@@ -16,9 +16,13 @@ from homeassistant.components.recorder.filters import Filters
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.integration_platform import (
+    async_load_deferred_integration_platforms,
+)
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
+from .const import DOMAIN
 from .helpers import async_determine_event_types
 from .processor import EventProcessor
 
@@ -56,6 +60,7 @@ class LogbookView(HomeAssistantView):
         self, request: web.Request, datetime: str | None = None
     ) -> web.Response:
         """Retrieve logbook entries."""
+        await async_load_deferred_integration_platforms(request.app[KEY_HASS], DOMAIN)
         if datetime:
             if (datetime_dt := dt_util.parse_datetime(datetime)) is None:
                 return self.json_message("Invalid datetime", HTTPStatus.BAD_REQUEST)
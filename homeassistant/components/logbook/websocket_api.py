@@ -17,6 +17,9 @@ from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.integration_platform import (
+    async_load_deferred_integration_platforms,
+)
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
@@ -259,6 +262,7 @@ async def ws_event_stream(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle logbook stream events websocket command."""
+    await async_load_deferred_integration_platforms(hass, DOMAIN)
     start_time_str = msg["start_time"]
     msg_id: int = msg["id"]
     utc_now = dt_util.utcnow()
@@ -457,6 +461,7 @@ async def ws_get_events(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle logbook get events websocket command."""
+    await async_load_deferred_integration_platforms(hass, DOMAIN)
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
     utc_now = dt_util.utcnow()
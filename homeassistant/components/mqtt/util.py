@@ -145,6 +145,97 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """A node in a topic trie, one per topic level."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: set[_T] = set()
+
+
+class TopicTrie[_T]:
+    """Index values by MQTT topic filter for fast matching.
+
+    Filters are stored level by level, so matching a topic only walks
+    the branches for the levels of the topic and the `+` and `#`
+    wildcards, instead of testing every filter that is stored.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values.add(value)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value for a topic filter.
+
+        Raises KeyError if the value is not stored for the filter.
+        Empty branches are pruned.
+        """
+        node = self._root
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+        while path and not node.values and not node.children:
+            node, level = path.pop()
+            del node.children[level]
+
+    def __contains__(self, topic_filter: str) -> bool:
+        """Return if values are stored for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def matches(self, topic: str) -> list[_T]:
+        """Return the values of all filters matching a topic.
+
+        Wildcards on the first level do not match topics starting with `$`.
+        A wildcard filter passed as topic matches the identical filter once.
+        """
+        levels = topic.split("/")
+        depth = len(levels)
+        wildcards_first_level = not topic.startswith("$")
+        matches: list[_T] = []
+        pending: list[tuple[_TopicTrieNode[_T], int]] = [(self._root, 0)]
+        while pending:
+            node, index = pending.pop()
+            children = node.children
+            wildcards = index > 0 or wildcards_first_level
+            if wildcards and (multi_level := children.get("#")) is not None:
+                matches.extend(multi_level.values)
+            if index == depth:
+                matches.extend(node.values)
+                continue
+            level = levels[index]
+            if level != "#" and (child := children.get(level)) is not None:
+                pending.append((child, index + 1))
+            if (
+                wildcards
+                and level != "+"
+                and (single_level := children.get("+")) is not None
+            ):
+                pending.append((single_level, index + 1))
+        return matches
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
@@ -8,9 +8,8 @@ import logging
 import string
 from typing import Any, cast
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
-from prometheus_client.metrics import MetricWrapperBase
 import voluptuous as vol
 
 from homeassistant import core as hacore
@@ -70,7 +69,13 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers import entityfilter, state as state_helper
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_registry import (
@@ -82,6 +87,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import Counter, Gauge, MetricFamily, MetricsExposition
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -126,10 +133,8 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
-def setup(hass: HomeAssistant, config: ConfigType) -> bool:
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -151,13 +156,17 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
-    hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
-    hass.bus.listen(
+    hass.http.register_view(
+        PrometheusView(conf[CONF_REQUIRES_AUTH], metrics.exposition)
+    )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
+    hass.bus.async_listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
         metrics.handle_entity_registry_updated,
     )
 
-    for state in hass.states.all():
+    for state in hass.states.async_all():
         if entity_filter(state.entity_id):
             metrics.handle_state(state)
 
@@ -196,9 +205,11 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
-        self._metrics: dict[str, MetricWrapperBase] = {}
+        self._metrics: dict[str, MetricFamily] = {}
         self._climate_units = climate_units
+        self.exposition = MetricsExposition()
 
+    @callback
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
         """Handle new messages from the bus."""
         if (state := event.data.get("new_state")) is None:
@@ -230,24 +241,25 @@ class PrometheusMetrics:
 
         labels = self._labels(state)
         state_change = self._metric(
-            "state_change", prometheus_client.Counter, "The number of state changes"
+            "state_change", Counter, "The number of state changes"
         )
         state_change.labels(**labels).inc()
 
         entity_available = self._metric(
             "entity_available",
-            prometheus_client.Gauge,
+            Gauge,
             "Entity is available (not in the unavailable or unknown state)",
         )
         entity_available.labels(**labels).set(float(state.state not in ignored_states))
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
-            prometheus_client.Gauge,
+            Gauge,
             "The last_updated timestamp",
         )
         last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
 
+    @callback
     def handle_entity_registry_updated(
         self, event: Event[EventEntityRegistryUpdatedData]
     ) -> None:
@@ -277,26 +289,15 @@ class PrometheusMetrics:
         self, entity_id: str, friendly_name: str | None = None
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
-        for metric in list(self._metrics.values()):
-            for sample in cast(list[prometheus_client.Metric], metric.collect())[
-                0
-            ].samples:
-                if sample.labels["entity"] == entity_id and (
-                    not friendly_name or sample.labels["friendly_name"] == friendly_name
-                ):
-                    _LOGGER.debug(
-                        "Removing labelset from %s for entity_id: %s",
-                        sample.name,
-                        entity_id,
-                    )
-                    with suppress(KeyError):
-                        metric.remove(*sample.labels.values())
+        _LOGGER.debug("Removing labelsets for entity_id: %s", entity_id)
+        for metric in self._metrics.values():
+            metric.remove_entity(entity_id, friendly_name)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
             metric = self._metric(
                 f"{state.domain}_attr_{key.lower()}",
-                prometheus_client.Gauge,
+                Gauge,
                 f"{key} attribute of {state.domain} entity",
             )
 
@@ -306,28 +307,27 @@ class PrometheusMetrics:
             except (ValueError, TypeError):
                 pass
 
-    def _metric[_MetricBaseT: MetricWrapperBase](
+    def _metric[_MetricBaseT: MetricFamily](
         self,
         metric: str,
         factory: type[_MetricBaseT],
         documentation: str,
         extra_labels: list[str] | None = None,
     ) -> _MetricBaseT:
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
         try:
             return cast(_MetricBaseT, self._metrics[metric])
         except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
             self._metrics[metric] = factory(
+                self.exposition,
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
             )
             return cast(_MetricBaseT, self._metrics[metric])
 
@@ -367,7 +367,7 @@ class PrometheusMetrics:
         if (battery_level := state.attributes.get(ATTR_BATTERY_LEVEL)) is not None:
             metric = self._metric(
                 "battery_level_percent",
-                prometheus_client.Gauge,
+                Gauge,
                 "Battery level as a percentage of its capacity",
             )
             try:
@@ -379,7 +379,7 @@ class PrometheusMetrics:
     def _handle_binary_sensor(self, state: State) -> None:
         metric = self._metric(
             "binary_sensor_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
@@ -388,7 +388,7 @@ class PrometheusMetrics:
     def _handle_input_boolean(self, state: State) -> None:
         metric = self._metric(
             "input_boolean_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
@@ -398,13 +398,13 @@ class PrometheusMetrics:
         if unit := self._unit_string(state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)):
             metric = self._metric(
                 f"{domain}_state_{unit}",
-                prometheus_client.Gauge,
+                Gauge,
                 f"State of the {title} measured in {unit}",
             )
         else:
             metric = self._metric(
                 f"{domain}_state",
-                prometheus_client.Gauge,
+                Gauge,
                 f"State of the {title}",
             )
 
@@ -428,23 +428,21 @@ class PrometheusMetrics:
     def _handle_device_tracker(self, state: State) -> None:
         metric = self._metric(
             "device_tracker_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
     def _handle_person(self, state: State) -> None:
-        metric = self._metric(
-            "person_state", prometheus_client.Gauge, "State of the person (0/1)"
-        )
+        metric = self._metric("person_state", Gauge, "State of the person (0/1)")
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
     def _handle_cover(self, state: State) -> None:
         metric = self._metric(
             "cover_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the cover (0/1)",
             ["state"],
         )
@@ -459,7 +457,7 @@ class PrometheusMetrics:
         if position is not None:
             position_metric = self._metric(
                 "cover_position",
-                prometheus_client.Gauge,
+                Gauge,
                 "Position of the cover (0-100)",
             )
             position_metric.labels(**self._labels(state)).set(float(position))
@@ -468,7 +466,7 @@ class PrometheusMetrics:
         if tilt_position is not None:
             tilt_position_metric = self._metric(
                 "cover_tilt_position",
-                prometheus_client.Gauge,
+                Gauge,
                 "Tilt Position of the cover (0-100)",
             )
             tilt_position_metric.labels(**self._labels(state)).set(float(tilt_position))
@@ -476,7 +474,7 @@ class PrometheusMetrics:
     def _handle_light(self, state: State) -> None:
         metric = self._metric(
             "light_brightness_percent",
-            prometheus_client.Gauge,
+            Gauge,
             "Light brightness percentage (0..100)",
         )
 
@@ -492,9 +490,7 @@ class PrometheusMetrics:
             pass
 
     def _handle_lock(self, state: State) -> None:
-        metric = self._metric(
-            "lock_state", prometheus_client.Gauge, "State of the lock (0/1)"
-        )
+        metric = self._metric("lock_state", Gauge, "State of the lock (0/1)")
         value = self.state_as_number(state)
         metric.labels(**self._labels(state)).set(value)
 
@@ -508,7 +504,7 @@ class PrometheusMetrics:
                 )
             metric = self._metric(
                 metric_name,
-                prometheus_client.Gauge,
+                Gauge,
                 metric_description,
             )
             metric.labels(**self._labels(state)).set(temp)
@@ -542,7 +538,7 @@ class PrometheusMetrics:
         if current_action := state.attributes.get(ATTR_HVAC_ACTION):
             metric = self._metric(
                 "climate_action",
-                prometheus_client.Gauge,
+                Gauge,
                 "HVAC action",
                 ["action"],
             )
@@ -556,7 +552,7 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "climate_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "HVAC mode",
                 ["mode"],
             )
@@ -570,7 +566,7 @@ class PrometheusMetrics:
         if preset_mode and available_preset_modes:
             preset_metric = self._metric(
                 "climate_preset_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Preset mode enum",
                 ["mode"],
             )
@@ -584,7 +580,7 @@ class PrometheusMetrics:
         if fan_mode and available_fan_modes:
             fan_mode_metric = self._metric(
                 "climate_fan_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Fan mode enum",
                 ["mode"],
             )
@@ -598,14 +594,14 @@ class PrometheusMetrics:
         if humidifier_target_humidity_percent:
             metric = self._metric(
                 "humidifier_target_humidity_percent",
-                prometheus_client.Gauge,
+                Gauge,
                 "Target Relative Humidity",
             )
             metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
-            prometheus_client.Gauge,
+            Gauge,
             "State of the humidifier (0/1)",
         )
         try:
@@ -619,7 +615,7 @@ class PrometheusMetrics:
         if current_mode and available_modes:
             metric = self._metric(
                 "humidifier_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Humidifier Mode",
                 ["mode"],
             )
@@ -641,7 +637,7 @@ class PrometheusMetrics:
             if unit:
                 documentation = f"Sensor data measured in {unit}"
 
-            _metric = self._metric(metric, prometheus_client.Gauge, documentation)
+            _metric = self._metric(metric, Gauge, documentation)
 
             try:
                 value = self.state_as_number(state)
@@ -718,9 +714,7 @@ class PrometheusMetrics:
         return units.get(unit, default)
 
     def _handle_switch(self, state: State) -> None:
-        metric = self._metric(
-            "switch_state", prometheus_client.Gauge, "State of the switch (0/1)"
-        )
+        metric = self._metric("switch_state", Gauge, "State of the switch (0/1)")
 
         try:
             value = self.state_as_number(state)
@@ -731,9 +725,7 @@ class PrometheusMetrics:
         self._handle_attributes(state)
 
     def _handle_fan(self, state: State) -> None:
-        metric = self._metric(
-            "fan_state", prometheus_client.Gauge, "State of the fan (0/1)"
-        )
+        metric = self._metric("fan_state", Gauge, "State of the fan (0/1)")
 
         try:
             value = self.state_as_number(state)
@@ -745,7 +737,7 @@ class PrometheusMetrics:
         if fan_speed_percent is not None:
             fan_speed_metric = self._metric(
                 "fan_speed_percent",
-                prometheus_client.Gauge,
+                Gauge,
                 "Fan speed percent (0-100)",
             )
             fan_speed_metric.labels(**self._labels(state)).set(float(fan_speed_percent))
@@ -754,7 +746,7 @@ class PrometheusMetrics:
         if fan_is_oscillating is not None:
             fan_oscillating_metric = self._metric(
                 "fan_is_oscillating",
-                prometheus_client.Gauge,
+                Gauge,
                 "Whether the fan is oscillating (0/1)",
             )
             fan_oscillating_metric.labels(**self._labels(state)).set(
@@ -766,7 +758,7 @@ class PrometheusMetrics:
         if fan_preset_mode and available_modes:
             fan_preset_metric = self._metric(
                 "fan_preset_mode",
-                prometheus_client.Gauge,
+                Gauge,
                 "Fan preset mode enum",
                 ["mode"],
             )
@@ -779,7 +771,7 @@ class PrometheusMetrics:
         if fan_direction is not None:
             fan_direction_metric = self._metric(
                 "fan_direction_reversed",
-                prometheus_client.Gauge,
+                Gauge,
                 "Fan direction reversed (bool)",
             )
             if fan_direction == DIRECTION_FORWARD:
@@ -793,7 +785,7 @@ class PrometheusMetrics:
     def _handle_automation(self, state: State) -> None:
         metric = self._metric(
             "automation_triggered_count",
-            prometheus_client.Counter,
+            Counter,
             "Count of times an automation has been triggered",
         )
 
@@ -802,7 +794,7 @@ class PrometheusMetrics:
     def _handle_counter(self, state: State) -> None:
         metric = self._metric(
             "counter_value",
-            prometheus_client.Gauge,
+            Gauge,
             "Value of counter entities",
         )
 
@@ -811,7 +803,7 @@ class PrometheusMetrics:
     def _handle_update(self, state: State) -> None:
         metric = self._metric(
             "update_state",
-            prometheus_client.Gauge,
+            Gauge,
             "Update state, indicating if an update is available (0/1)",
         )
         value = self.state_as_number(state)
@@ -823,7 +815,7 @@ class PrometheusMetrics:
         if current_state:
             metric = self._metric(
                 "alarm_control_panel_state",
-                prometheus_client.Gauge,
+                Gauge,
                 "State of the alarm control panel (0/1)",
                 ["state"],
             )
@@ -853,19 +845,42 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, exposition: MetricsExposition) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._exposition = exposition
 
     async def get(self, request: web.Request) -> web.Response:
-        """Handle request for Prometheus metrics."""
+        """Handle request for Prometheus metrics.
+
+        The Home Assistant metrics are served from the cached exposition,
+        followed by the metrics of the collectors in the prometheus_client
+        registry, like the process and platform collectors.
+        """
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
-        body = await hass.async_add_executor_job(
+        version, body = self._exposition.render()
+        if "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, ""):
+            return web.Response(
+                body=await hass.async_add_executor_job(
+                    self._gzip_latest, version, body
+                ),
+                content_type=CONTENT_TYPE_TEXT_PLAIN,
+                headers={hdrs.CONTENT_ENCODING: "gzip"},
+            )
+        body += await hass.async_add_executor_job(
             prometheus_client.generate_latest, prometheus_client.REGISTRY
         )
         return web.Response(
             body=body,
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
+
+    def _gzip_latest(self, version: int, body: bytes) -> bytes:
+        """Return the compressed body followed by the registry metrics."""
+        return self._exposition.gzip(
+            version,
+            body,
+            prometheus_client.generate_latest(prometheus_client.REGISTRY),
+        )
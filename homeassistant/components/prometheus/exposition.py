@@ -0,0 +1,265 @@
+"""Pre-rendered Prometheus text exposition of the Home Assistant metrics.
+
+Every sample of a metric belongs to an entity. The samples of an entity are
+rendered to exposition lines when they are scraped after they changed, so
+a scrape only renders the entities which changed since the previous scrape
+and otherwise joins cached byte chunks.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+import zlib
+
+from prometheus_client.utils import floatToGoString
+
+GZIP_LEVEL = 6
+
+# Magic, deflate, no flags, no mtime, no extra flags, unknown OS
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_documentation(documentation: str) -> str:
+    """Escape the documentation of a metric."""
+    return documentation.replace("\\", r"\\").replace("\n", r"\n")
+
+
+class MetricChild:
+    """Samples of a metric with the same label values."""
+
+    __slots__ = ("_entity_id", "_family", "_label_values")
+
+    def __init__(
+        self, family: MetricFamily, entity_id: str, label_values: tuple[str, ...]
+    ) -> None:
+        """Initialize the child."""
+        self._family = family
+        self._entity_id = entity_id
+        self._label_values = label_values
+
+    def set(self, value: float) -> None:
+        """Set the value of a gauge."""
+        self._family.set_value(self._entity_id, self._label_values, float(value))
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the value of a counter."""
+        self._family.inc_value(self._entity_id, self._label_values, float(amount))
+
+
+class MetricFamily:
+    """Metric which keeps its exposition lines rendered per entity."""
+
+    __slots__ = (
+        "_exposition",
+        "_header",
+        "_label_order",
+        "_labelnames",
+        "_rendered",
+        "_values",
+        "name",
+    )
+
+    # The suffixes and types of the metrics exposed for the family
+    _sections: tuple[tuple[str, str], ...] = (("", "gauge"),)
+
+    def __init__(
+        self,
+        exposition: MetricsExposition,
+        name: str,
+        documentation: str,
+        labelnames: list[str],
+    ) -> None:
+        """Initialize the metric."""
+        self._exposition = exposition
+        self.name = name
+        self._labelnames = tuple(labelnames)
+        # Labels are exposed in the order of their names
+        self._label_order = sorted(range(len(labelnames)), key=labelnames.__getitem__)
+        self._values: dict[str, dict[tuple[str, ...], list[float]]] = {}
+        self._rendered: dict[str, tuple[bytes, ...]] = {}
+        documentation = _escape_documentation(documentation)
+        self._header = tuple(
+            (
+                f"# HELP {name}{suffix} {documentation}\n"
+                f"# TYPE {name}{suffix} {metric_type}\n"
+            ).encode()
+            for suffix, metric_type in self._sections
+        )
+        exposition.add_family(self)
+
+    def labels(self, **labelkwargs: object) -> MetricChild:
+        """Return the samples with the given label values."""
+        return MetricChild(
+            self,
+            str(labelkwargs["entity"]),
+            tuple(str(labelkwargs[name]) for name in self._labelnames),
+        )
+
+    def set_value(
+        self, entity_id: str, label_values: tuple[str, ...], value: float
+    ) -> None:
+        """Set the value of the samples with the given label values."""
+        self._sample(entity_id, label_values)[0] = value
+        self._changed(entity_id)
+
+    def inc_value(
+        self, entity_id: str, label_values: tuple[str, ...], amount: float
+    ) -> None:
+        """Increment the value of the samples with the given label values."""
+        self._sample(entity_id, label_values)[0] += amount
+        self._changed(entity_id)
+
+    def remove_entity(self, entity_id: str, friendly_name: str | None = None) -> None:
+        """Remove the samples of an entity.
+
+        If a friendly name is given only the samples labeled with that
+        friendly name are removed.
+        """
+        if (entity_values := self._values.get(entity_id)) is None:
+            return
+        if friendly_name:
+            index = self._labelnames.index("friendly_name")
+            for label_values in [
+                label_values
+                for label_values in entity_values
+                if label_values[index] == friendly_name
+            ]:
+                del entity_values[label_values]
+        else:
+            entity_values.clear()
+        if not entity_values:
+            del self._values[entity_id]
+        self._changed(entity_id)
+
+    def _sample(self, entity_id: str, label_values: tuple[str, ...]) -> list[float]:
+        """Return the sample of the given label values, creating it if needed."""
+        if (entity_values := self._values.get(entity_id)) is None:
+            entity_values = self._values[entity_id] = {}
+        if (sample := entity_values.get(label_values)) is None:
+            sample = entity_values[label_values] = self._new_sample()
+        return sample
+
+    def _new_sample(self) -> list[float]:
+        """Return the values of a new sample."""
+        return [0.0]
+
+    def _changed(self, entity_id: str) -> None:
+        """Drop the rendered lines of an entity."""
+        self._rendered.pop(entity_id, None)
+        self._exposition.version += 1
+
+    def _render_entity(self, entity_id: str) -> tuple[bytes, ...]:
+        """Render the exposition lines of an entity."""
+        names = self._labelnames
+        order = self._label_order
+        lines: tuple[list[str], ...] = tuple([] for _ in self._sections)
+        for label_values, sample in self._values[entity_id].items():
+            labels = ",".join(
+                f'{names[i]}="{_escape_label_value(label_values[i])}"' for i in order
+            )
+            for (suffix, _), section_lines, value in zip(
+                self._sections, lines, sample, strict=True
+            ):
+                section_lines.append(
+                    f"{self.name}{suffix}{{{labels}}} {floatToGoString(value)}\n"
+                )
+        return tuple("".join(section_lines).encode() for section_lines in lines)
+
+    def render(self) -> list[bytes]:
+        """Return the exposition of the metric as chunks."""
+        if not self._values:
+            return []
+        rendered = self._rendered
+        for entity_id in self._values.keys() - rendered.keys():
+            rendered[entity_id] = self._render_entity(entity_id)
+        chunks: list[bytes] = []
+        for index, header in enumerate(self._header):
+            chunks.append(header)
+            chunks.extend(entity_chunks[index] for entity_chunks in rendered.values())
+        return chunks
+
+
+class Gauge(MetricFamily):
+    """Gauge which keeps its exposition lines rendered per entity."""
+
+    __slots__ = ()
+
+
+class Counter(MetricFamily):
+    """Counter which keeps its exposition lines rendered per entity."""
+
+    __slots__ = ()
+
+    _sections = (("_total", "counter"), ("_created", "gauge"))
+
+    def _new_sample(self) -> list[float]:
+        """Return the count and the creation time of a new sample."""
+        return [0.0, time.time()]
+
+
+class MetricsExposition:
+    """Exposition of the metric families, cached until a metric changes."""
+
+    __slots__ = ("_body", "_compressed", "_families", "version")
+
+    def __init__(self) -> None:
+        """Initialize the exposition."""
+        self._families: list[MetricFamily] = []
+        self._body: tuple[int, bytes] | None = None
+        self._compressed: tuple[int, bytes, int, int] | None = None
+        self.version = 0
+
+    def add_family(self, family: MetricFamily) -> None:
+        """Add a metric family to the exposition."""
+        self._families.append(family)
+        self.version += 1
+
+    def render(self) -> tuple[int, bytes]:
+        """Return the version and the exposition of the metrics."""
+        if self._body is None or self._body[0] != self.version:
+            self._body = (
+                self.version,
+                b"".join(
+                    chunk for family in self._families for chunk in family.render()
+                ),
+            )
+        return self._body
+
+    def gzip(self, version: int, body: bytes, trailer: bytes) -> bytes:
+        """Return a gzip member of the body followed by the trailer.
+
+        The deflated body ends with a sync flush and is cached for as long
+        as the metrics do not change, so only the trailer is compressed for
+        every scrape. Can be called from a thread.
+        """
+        compressed = self._compressed
+        if compressed is None or compressed[0] != version:
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+            compressed = (
+                version,
+                compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH),
+                zlib.crc32(body),
+                len(body),
+            )
+            self._compressed = compressed
+        _, deflated, crc, size = compressed
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+        return b"".join(
+            (
+                _GZIP_HEADER,
+                deflated,
+                compressor.compress(trailer),
+                compressor.flush(),
+                struct.pack(
+                    "<II",
+                    zlib.crc32(trailer, crc),
+                    (size + len(trailer)) & 0xFFFFFFFF,
+                ),
+            )
+        )
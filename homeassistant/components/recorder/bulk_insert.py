@@ -0,0 +1,165 @@
+"""Insert pending events and states with multi-row INSERT statements.
+
+Adding every row to the ORM session makes the unit of work sort, track
+and flush each object one by one, which dominates the recorder thread
+when thousands of states are written per minute. Events and states are
+instead collected as plain objects and written with one executemany
+INSERT per table, which SQLAlchemy sends as multi-row INSERT statements
+returning the new primary keys in order.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm.session import Session
+
+from .db_schema import Events, States
+
+
+def supports_bulk_insert(dialect: Dialect) -> bool:
+    """Return if the dialect can return the ids of a multi-row INSERT in order."""
+    return bool(
+        getattr(dialect, "insert_executemany_returning_sort_by_parameter_order", False)
+    )
+
+
+def bulk_insert_events(session: Session, events: list[Events]) -> None:
+    """Insert events and set their event_id.
+
+    The session must be flushed first so pending event types and
+    event data have been assigned their ids.
+    """
+    if not events:
+        return
+    result = session.execute(
+        insert(Events).returning(Events.event_id, sort_by_parameter_order=True),
+        [_event_to_row(event) for event in events],
+    )
+    for event, event_id in zip(events, result.scalars(), strict=True):
+        event.event_id = event_id
+
+
+def bulk_insert_states(session: Session, states: list[States]) -> list[States]:
+    """Insert states and set their state_id.
+
+    The session must be flushed first so pending state attributes,
+    states meta and states have been assigned their ids.
+
+    The old_state_id of a state can only be set once the state it
+    links to has been inserted, so the states are inserted in rounds,
+    each round containing the states whose old state already has an id.
+    Usually an entity only changes once per commit and all states are
+    inserted in a single round.
+
+    Returns the inserted states, including the old states which were
+    never inserted before.
+    """
+    if not states:
+        return []
+    inserted = batch = _states_with_uninserted_old_states(states)
+    try:
+        while batch:
+            ready: list[States] = []
+            waiting: list[States] = []
+            for state in batch:
+                old_state = state.old_state
+                if old_state is None or old_state.state_id is not None:
+                    ready.append(state)
+                else:
+                    waiting.append(state)
+            result = session.execute(
+                insert(States).returning(States.state_id, sort_by_parameter_order=True),
+                [_state_to_row(state) for state in ready],
+            )
+            for state, state_id in zip(ready, result.scalars(), strict=True):
+                state.state_id = state_id
+            batch = waiting
+    except BaseException:
+        clear_inserted_ids([], inserted)
+        raise
+    return inserted
+
+
+def clear_inserted_ids(events: list[Events], states: list[States]) -> None:
+    """Clear the ids of inserted events and states.
+
+    The ids are not valid if the transaction is rolled back, and the
+    events and states must be inserted again when the commit is retried.
+    """
+    for event in events:
+        event.event_id = None  # type: ignore[assignment]
+    for state in states:
+        state.state_id = None  # type: ignore[assignment]
+
+
+def _states_with_uninserted_old_states(states: list[States]) -> list[States]:
+    """Return the states including old states that were never inserted.
+
+    An old state is not written when its attributes could not be
+    serialized, but the ORM would still insert it when a newer state
+    links to it, so we do the same.
+    """
+    in_batch = {id(state) for state in states}
+    missing: list[States] = []
+    for state in states:
+        old_state = state.old_state
+        while (
+            old_state is not None
+            and old_state.state_id is None
+            and id(old_state) not in in_batch
+        ):
+            in_batch.add(id(old_state))
+            missing.append(old_state)
+            old_state = old_state.old_state
+    if not missing:
+        return states
+    return [*reversed(missing), *states]
+
+
+def _event_to_row(event: Events) -> dict[str, Any]:
+    """Return the columns to insert for an event."""
+    data_id = event.data_id
+    if data_id is None and (event_data := event.event_data_rel) is not None:
+        data_id = event_data.data_id
+    event_type_id = event.event_type_id
+    if event_type_id is None and (event_type := event.event_type_rel) is not None:
+        event_type_id = event_type.event_type_id
+    return {
+        "origin_idx": event.origin_idx,
+        "time_fired_ts": event.time_fired_ts,
+        "data_id": data_id,
+        "context_id_bin": event.context_id_bin,
+        "context_user_id_bin": event.context_user_id_bin,
+        "context_parent_id_bin": event.context_parent_id_bin,
+        "event_type_id": event_type_id,
+    }
+
+
+def _state_to_row(state: States) -> dict[str, Any]:
+    """Return the columns to insert for a state."""
+    old_state_id = state.old_state_id
+    if old_state_id is None and (old_state := state.old_state) is not None:
+        old_state_id = old_state.state_id
+    attributes_id = state.attributes_id
+    if attributes_id is None and (attributes := state.state_attributes) is not None:
+        attributes_id = attributes.attributes_id
+    metadata_id = state.metadata_id
+    if metadata_id is None and (states_meta := state.states_meta_rel) is not None:
+        metadata_id = states_meta.metadata_id
+    return {
+        "entity_id": state.entity_id,
+        "state": state.state,
+        "last_changed_ts": state.last_changed_ts,
+        "last_reported_ts": state.last_reported_ts,
+        "last_updated_ts": state.last_updated_ts,
+        "old_state_id": old_state_id,
+        "attributes_id": attributes_id,
+        "origin_idx": state.origin_idx,
+        "context_id_bin": state.context_id_bin,
+        "context_user_id_bin": state.context_user_id_bin,
+        "context_parent_id_bin": state.context_parent_id_bin,
+        "metadata_id": metadata_id,
+    }
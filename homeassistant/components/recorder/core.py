@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Hashable, Iterable
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
 from functools import cached_property
 import logging
+import os
 import queue
 import sqlite3
 import threading
@@ -50,7 +51,14 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import (
+    bulk_insert_events,
+    bulk_insert_states,
+    clear_inserted_ids,
+    supports_bulk_insert,
+)
 from .const import (
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -78,13 +86,19 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import (
+    DBInterruptibleThreadPoolExecutor,
+    DBReadThreadPoolExecutor,
+    read_queue_key,
+)
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
     EventsContextIDMigration,
     EventTypeIDMigration,
+    PartitionTablesMigration,
     StatesContextIDMigration,
+    StatisticsRollupsMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
@@ -156,6 +170,10 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
+# The read executor runs the history and statistics queries of the
+# frontend, each of its workers has a connection of its own
+MAX_DB_READ_EXECUTOR_WORKERS = min(8, max(2, os.cpu_count() or 2))
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -169,6 +187,7 @@ class Recorder(threading.Thread):
         auto_repack: bool,
         keep_days: int,
         commit_interval: int,
+        partition_tables: bool,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
@@ -187,6 +206,7 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.partition_tables = partition_tables
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -213,6 +233,9 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._supports_bulk_insert = False
+        self._pending_bulk_events: list[Events] = []
+        self._pending_bulk_states: list[States] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -229,8 +252,10 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.use_statistics_rollups = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBReadThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -293,6 +318,12 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBReadThreadPoolExecutor(
+            self.recorder_and_worker_thread_ids,
+            thread_name_prefix=DB_READ_WORKER_PREFIX,
+            max_workers=MAX_DB_READ_EXECUTOR_WORKERS,
+            shutdown_hook=self._shutdown_pool,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -333,9 +364,16 @@ class Recorder(threading.Thread):
             # Unknown what it is.
             queue_put(event)
 
-        self._event_listener = self.hass.bus.async_listen(
+        @callback
+        def _events_listener(events: list[Event]) -> None:
+            """Listen for a batch of new events and put them in the process queue."""
+            for event in events:
+                _event_listener(event)
+
+        self._event_listener = self.hass.bus.async_listen_batch(
             MATCH_ALL,
             _event_listener,
+            _events_listener,
         )
         self._queue_watcher = async_track_time_interval(
             self.hass,
@@ -367,6 +405,29 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self,
+        target: Callable[..., _T],
+        *args: Any,
+        queue_key: Hashable = None,
+    ) -> asyncio.Future[_T]:
+        """Add a read only executor job from within the event loop.
+
+        The jobs of each queue_key, for example a websocket connection,
+        are run in turns so a client which requests a lot of history
+        does not hold back the others. The job must not write to the
+        database, the connections of the read workers of a SQLite
+        database are read only.
+        """
+        if self._db_read_executor is None:
+            return self.async_add_executor_job(target, *args)
+        token = read_queue_key.set(queue_key)
+        try:
+            return self.hass.loop.run_in_executor(self._db_read_executor, target, *args)
+        finally:
+            read_queue_key.reset(token)
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -698,6 +759,27 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    @property
+    def _bulk_insert_active(self) -> bool:
+        """Return if events and states are written with multi-row INSERTs."""
+        return self._supports_bulk_insert and self.schema_version == SCHEMA_VERSION
+
+    def _add_event_to_session(self, session: Session, dbevent: Events) -> None:
+        """Add an event to the session or the pending bulk insert."""
+        if self._bulk_insert_active:
+            self._event_session_has_pending_writes = True
+            self._pending_bulk_events.append(dbevent)
+        else:
+            self._add_to_session(session, dbevent)
+
+    def _add_state_to_session(self, session: Session, dbstate: States) -> None:
+        """Add a state to the session or the pending bulk insert."""
+        if self._bulk_insert_active:
+            self._event_session_has_pending_writes = True
+            self._pending_bulk_states.append(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -813,6 +895,8 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                StatisticsRollupsMigration,
+                PartitionTablesMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -866,6 +950,7 @@ class Recorder(threading.Thread):
 
         assert self.event_session is not None
         session = self.event_session
+        self.state_attributes_manager.warm_up(session)
         self.event_data_manager.load(non_state_change_events, session)
         self.event_type_manager.load(non_state_change_events, session)
         self.states_meta_manager.load(state_change_events, session)
@@ -1059,7 +1144,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(session, dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1084,7 +1169,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(session, dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1149,25 +1234,20 @@ class Recorder(threading.Thread):
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
             dbstate.state_attributes = pending_event_data
         # Matching attributes id found in the cache
-        elif (
-            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
-        ) or (
-            (hash_ := StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes))
-            and (
-                attributes_id := state_attributes_manager.get(
-                    shared_attrs, hash_, session
-                )
-            )
-        ):
+        elif attributes_id := state_attributes_manager.get_from_cache(shared_attrs):
             dbstate.attributes_id = attributes_id
         else:
-            # No matching attributes found, save them in the DB
-            dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
-            state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
-            dbstate.state_attributes = dbstate_attributes
+            # The attributes are looked up in the DB for all states
+            # of the commit at once, and saved if they are not found
+            state_attributes_manager.add_unresolved(
+                StateAttributes(
+                    shared_attrs=shared_attrs,
+                    hash=StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes),
+                ),
+                dbstate,
+            )
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1215,24 +1295,39 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
-        if (
-            pending_last_reported
-            := self.states_manager.get_pending_last_reported_timestamp()
-        ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
-            with session.no_autoflush:
-                session.execute(
-                    update(States),
-                    [
-                        {
-                            "state_id": state_id,
-                            "last_reported_ts": last_reported_timestamp,
-                        }
-                        for state_id, last_reported_timestamp in pending_last_reported.items()
-                    ],
-                )
-        session.commit()
+        self.state_attributes_manager.resolve_unresolved(session)
+        inserted_states: list[States] = []
+        try:
+            if self._pending_bulk_events or self._pending_bulk_states:
+                # Flush first so the rows the events and states
+                # link to have been assigned their ids
+                session.flush()
+                bulk_insert_events(session, self._pending_bulk_events)
+                inserted_states = bulk_insert_states(session, self._pending_bulk_states)
+
+            if (
+                pending_last_reported
+                := self.states_manager.get_pending_last_reported_timestamp()
+            ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
+                with session.no_autoflush:
+                    session.execute(
+                        update(States),
+                        [
+                            {
+                                "state_id": state_id,
+                                "last_reported_ts": last_reported_timestamp,
+                            }
+                            for state_id, last_reported_timestamp in pending_last_reported.items()
+                        ],
+                    )
+            session.commit()
+        except BaseException:
+            clear_inserted_ids(self._pending_bulk_events, inserted_states)
+            raise
 
         self._event_session_has_pending_writes = False
+        self._pending_bulk_events.clear()
+        self._pending_bulk_states.clear()
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1264,6 +1359,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_bulk_events.clear()
+        self._pending_bulk_states.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1391,6 +1488,16 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
+        if self._using_file_sqlite and threading.current_thread().name.startswith(
+            DB_READ_WORKER_PREFIX
+        ):
+            # Only the recorder thread and the db executor write to the
+            # database, the read workers are readers of the WAL
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("PRAGMA query_only = ON")
+            finally:
+                cursor.close()
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
@@ -1404,6 +1511,7 @@ class Recorder(threading.Thread):
             kwargs["pool_reset_on_return"] = None
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
+            kwargs["pool_size"] = POOL_SIZE + MAX_DB_READ_EXECUTOR_WORKERS
             kwargs["recorder_and_worker_thread_ids"] = (
                 self.recorder_and_worker_thread_ids
             )
@@ -1428,6 +1536,9 @@ class Recorder(threading.Thread):
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
+            # The read workers hold connections of their own next
+            # to the recorder thread and the db executor
+            kwargs["pool_size"] = POOL_SIZE + MAX_DB_READ_EXECUTOR_WORKERS
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
@@ -1435,6 +1546,7 @@ class Recorder(threading.Thread):
         assert not self.engine
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        self._supports_bulk_insert = supports_bulk_insert(self.engine.dialect)
         self.__dict__.pop("dialect_name", None)
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
@@ -1499,8 +1611,12 @@ class Recorder(threading.Thread):
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
                 self._db_executor.shutdown(join_threads_or_timeout=False)
+            if self._db_read_executor:
+                self._db_read_executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
             if self._db_executor:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
                 self._db_executor.join_threads_or_timeout()
+            if self._db_read_executor:
+                self._db_read_executor.join_threads_or_timeout()
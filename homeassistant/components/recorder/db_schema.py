@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from datetime import datetime, timedelta
 import logging
 import time
@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 48
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +93,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAY = "statistics_day"
+TABLE_STATISTICS_MONTH = "statistics_month"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +118,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAY,
+    TABLE_STATISTICS_MONTH,
 ]
 
 TABLES_TO_CHECK = [
@@ -595,6 +599,23 @@ class StateAttributes(Base):
             f" attributes='{self.shared_attrs}')>"
         )
 
+    @staticmethod
+    def excluded_attributes(state: State) -> Collection[str]:
+        """Return the attributes of a state which are not recorded."""
+        if not (state_info := state.state_info):
+            return ALL_DOMAIN_EXCLUDE_ATTRS
+        unrecorded_attributes = state_info["unrecorded_attributes"]
+        exclude_attrs = {
+            *ALL_DOMAIN_EXCLUDE_ATTRS,
+            *unrecorded_attributes,
+        }
+        if MATCH_ALL in unrecorded_attributes:
+            # Don't exclude device class, state class, unit of measurement
+            # or friendly name when using the MATCH_ALL exclude constant
+            exclude_attrs.update(state.attributes)
+            exclude_attrs -= _MATCH_ALL_KEEP
+        return exclude_attrs
+
     @staticmethod
     def shared_attrs_bytes_from_event(
         event: Event[EventStateChangedData],
@@ -604,19 +625,7 @@ class StateAttributes(Base):
         # None state means the state was removed from the state machine
         if (state := event.data["new_state"]) is None:
             return b"{}"
-        if state_info := state.state_info:
-            unrecorded_attributes = state_info["unrecorded_attributes"]
-            exclude_attrs = {
-                *ALL_DOMAIN_EXCLUDE_ATTRS,
-                *unrecorded_attributes,
-            }
-            if MATCH_ALL in unrecorded_attributes:
-                # Don't exclude device class, state class, unit of measurement
-                # or friendly name when using the MATCH_ALL exclude constant
-                exclude_attrs.update(state.attributes)
-                exclude_attrs -= _MATCH_ALL_KEEP
-        else:
-            exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
+        exclude_attrs = StateAttributes.excluded_attributes(state)
         encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
         bytes_result = encoder(
             {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
@@ -790,6 +799,51 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class _StatisticsRollup(StatisticsBase):
+    """Long term statistics reduced to a period of the local time zone.
+
+    mean_weight is the number of hourly means the mean is computed from.
+    """
+
+    mean_weight: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDay(Base, _StatisticsRollup):
+    """Long term statistics reduced to days."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_day_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAY
+
+
+class StatisticsMonth(Base, _StatisticsRollup):
+    """Long term statistics reduced to months."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_month_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTH
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
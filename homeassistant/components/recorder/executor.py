@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Hashable
 from concurrent.futures.thread import _threads_queues, _worker
+from contextvars import ContextVar
+from queue import Empty
 import threading
 from typing import Any
 import weakref
 
 from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
+# The key of the queue a job is submitted to the read executor with,
+# for example the websocket connection which requested the job
+read_queue_key: ContextVar[Hashable] = ContextVar("read_queue_key", default=None)
+
 
 def _worker_with_shutdown_hook(
     shutdown_hook: Callable[[], None],
@@ -71,3 +78,83 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+class FairWorkQueue:
+    """A work queue which takes the jobs of the queue keys in turns.
+
+    The queue key of a job is the value of read_queue_key when it is
+    submitted. The jobs of a key are taken in order, but a key with
+    many jobs does not hold back the jobs of the other keys.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the queue."""
+        self._queues: dict[Hashable, deque[Any]] = {}
+        self._size = 0
+        # The None items which stop the workers are only taken once
+        # there are no jobs left
+        self._stops = 0
+        self._not_empty = threading.Condition(threading.Lock())
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        """Put a job on the queue of its key."""
+        with self._not_empty:
+            if item is None:
+                self._stops += 1
+            else:
+                key = read_queue_key.get()
+                if (queue := self._queues.get(key)) is None:
+                    queue = self._queues[key] = deque()
+                queue.append(item)
+                self._size += 1
+            self._not_empty.notify()
+
+    def put_nowait(self, item: Any) -> None:
+        """Put a job on the queue of its key."""
+        self.put(item)
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """Take the next job of the key whose turn it is."""
+        with self._not_empty:
+            if not self._not_empty.wait_for(
+                lambda: self._size or self._stops, timeout if block else 0
+            ):
+                raise Empty
+            if not self._size:
+                self._stops -= 1
+                return None
+            # The key whose turn it is comes first, it is moved
+            # to the end after taking its job
+            key = next(iter(self._queues))
+            queue = self._queues.pop(key)
+            item = queue.popleft()
+            if queue:
+                self._queues[key] = queue
+            self._size -= 1
+            return item
+
+    def get_nowait(self) -> Any:
+        """Take the next job without waiting."""
+        return self.get(block=False)
+
+    def empty(self) -> bool:
+        """Return if there are no jobs."""
+        with self._not_empty:
+            return not self._size and not self._stops
+
+    def qsize(self) -> int:
+        """Return the number of jobs."""
+        with self._not_empty:
+            return self._size
+
+
+class DBReadThreadPoolExecutor(DBInterruptibleThreadPoolExecutor):
+    """A database executor for read only jobs which takes the queue keys in turns."""
+
+    def __init__(
+        self, recorder_and_worker_thread_ids: set[int], *args: Any, **kwargs: Any
+    ) -> None:
+        """Init the executor with a fair work queue."""
+        super().__init__(recorder_and_worker_thread_ids, *args, **kwargs)
+        self._work_queue = FairWorkQueue()  # type: ignore[assignment]
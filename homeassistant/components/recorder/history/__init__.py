@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -13,10 +14,13 @@ from ... import recorder
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    StateColumns,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_significant_state_columns_with_session as _modern_get_significant_state_columns_with_session,
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
+    iter_significant_states_with_session as _modern_iter_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
 
@@ -24,10 +28,13 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "StateColumns",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_significant_state_columns_with_session",
     "get_significant_states",
     "get_significant_states_with_session",
+    "iter_significant_states_with_session",
     "state_changes_during_period",
 ]
 
@@ -115,6 +122,40 @@ def get_significant_states(
     )
 
 
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    significant_changes_only: bool = True,
+) -> dict[str, StateColumns]:
+    """Return a dict of significant states during a time period as columns."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_state_columns_with_session(
+            hass, session, start_time, end_time, entity_ids, significant_changes_only
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_full_significant_states_with_session as _legacy_get_full_significant_states_with_session,
+    )
+
+    return {
+        entity_id: StateColumns(
+            [state.state for state in states],
+            [state.last_updated.timestamp() for state in states],
+            [state.attributes for state in states],
+        )
+        for entity_id, states in _legacy_get_full_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            significant_changes_only=significant_changes_only,
+        ).items()
+    }
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -152,6 +193,56 @@ def get_significant_states_with_session(
     )
 
 
+def iter_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    chunk_size: int,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield significant states during a time period in chunks per entity."""
+    if recorder.get_instance(hass).states_meta_manager.active:
+        yield from _modern_iter_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            chunk_size,
+        )
+        return
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    )
+
+    # The legacy schema does not support streaming, yield the whole
+    # result per entity
+    yield from _legacy_get_significant_states_with_session(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    ).items()
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
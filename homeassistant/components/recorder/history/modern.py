@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
-from itertools import groupby
+from itertools import batched, groupby
 from operator import itemgetter
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from sqlalchemy import (
     CompoundSelect,
@@ -37,6 +37,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -45,6 +46,15 @@ from .const import (
     STATE_KEY,
 )
 
+
+class StateColumns(NamedTuple):
+    """States of an entity as columns, ordered by last_updated."""
+
+    state: list[str]
+    last_updated_ts: list[float]
+    attributes: list[dict[str, Any]]
+
+
 _FIELD_MAP = {
     "metadata_id": 0,
     "state": 1,
@@ -229,6 +239,154 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def iter_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    chunk_size: int,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states during UTC period start_time - end_time in chunks.
+
+    This returns the same states as get_significant_states_with_session,
+    but reads the rows from the database as they are consumed and yields
+    them as chunks of at most chunk_size states of a single entity, so the
+    memory used does not depend on the length of the period.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            stream_rows=True,
+        )
+    ):
+        return
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    yield from _sorted_states_to_chunks(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+        chunk_size,
+    )
+
+
+def get_significant_state_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    significant_changes_only: bool = True,
+) -> dict[str, StateColumns]:
+    """Return the significant states during UTC period start_time - end_time as columns.
+
+    This returns the same states as get_full_significant_states_with_session,
+    including the state at the start time, but does not create a State
+    object for each row.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        significant_states := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            True,
+            significant_changes_only,
+            False,
+        )
+    ):
+        return {}
+    rows, entity_id_to_metadata_id, start_time_ts = significant_states
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    # The attributes are always the last column
+    attributes_idx = -1
+    attr_cache: dict[str, dict[str, Any]] = {}
+    result: dict[str, StateColumns] = {}
+    for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        states: list[str] = []
+        last_updated_ts: list[float] = []
+        attributes: list[dict[str, Any]] = []
+        for row in group:
+            states.append(row[state_idx] or "")
+            # The start time states do not have a last_updated_ts
+            last_updated_ts.append(row[last_updated_ts_idx] or start_time_ts)
+            attributes.append(
+                decode_attributes_from_source(row[attributes_idx], attr_cache)
+            )
+        result[metadata_id_to_entity_id[metadata_id]] = StateColumns(
+            states, last_updated_ts, attributes
+        )
+    return result
+
+
+def _execute_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream_rows: bool = False,
+) -> tuple[Iterable[Row], dict[str, int | None], float | None] | None:
+    """Execute the query for significant states.
+
+    Returns the rows sorted by metadata_id and last_updated, the metadata_id
+    of the entities and the start time to use for the start time states.
+    If stream_rows is set, the rows of long periods are fetched from the
+    cursor in batches as they are consumed.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,7 +395,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +433,18 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        execute_stmt_lambda_element(
+            session,
+            stmt,
+            # Passing the start time fetches the rows in batches
+            # when the period is longer than a day
+            start_time if stream_rows else None,
+            end_time,
+            orm_rows=False,
+        ),
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -692,6 +854,46 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, ent_results in _sorted_states_to_chunks(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+        None,
+    ):
+        result[entity_id].extend(ent_results)
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_chunks(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+    chunk_size: int | None,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into chunks of the states of an entity.
+
+    States must be sorted by entity_id and last_updated. The rows are
+    consumed lazily and each chunk holds at most chunk_size rows, all
+    chunks of an entity are yielded before the chunks of the next one.
+    """
     field_map = _FIELD_MAP
     state_class: Callable[
         [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
@@ -706,10 +908,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
@@ -727,30 +925,35 @@ def _sorted_states_to_dict(
 
     state_idx = field_map["state"]
     last_updated_ts_idx = field_map["last_updated_ts"]
+    _utc_from_timestamp = dt_util.utc_from_timestamp
 
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
+        row_chunks: Iterable[Iterable[Row]] = (
+            (group,) if chunk_size is None else batched(group, chunk_size)
+        )
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
-                [
-                    state_class(
-                        db_state,
-                        attr_cache,
-                        start_time_ts,
-                        entity_id,
-                        db_state[state_idx],
-                        db_state[last_updated_ts_idx],
-                        False,
-                    )
-                    for db_state in group
-                ]
-            )
+            for rows in row_chunks:
+                yield (
+                    entity_id,
+                    [
+                        state_class(
+                            db_state,
+                            attr_cache,
+                            start_time_ts,
+                            entity_id,
+                            db_state[state_idx],
+                            db_state[last_updated_ts_idx],
+                            False,
+                        )
+                        for db_state in rows
+                    ],
+                )
             continue
 
         prev_state: str | None = None
@@ -758,61 +961,57 @@ def _sorted_states_to_dict(
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
-            )
-
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                [
-                    {
-                        attr_state: (prev_state := state),
-                        attr_time: row[last_updated_ts_idx],
-                    }
-                    for row in group
-                    if (state := row[state_idx]) != prev_state
-                ]
-            )
+        if (first_state := next(group, None)) is None:
             continue
+        prev_state = first_state[state_idx]
+        ent_results: list[State | dict[str, Any]] = [
+            state_class(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,  # type: ignore[arg-type]
+                first_state[last_updated_ts_idx],
+                no_attributes,
+            )
+        ]
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            [
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: _utc_from_timestamp(
-                        row[last_updated_ts_idx]
-                    ).isoformat(),
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            ]
-        )
-
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+        for rows in row_chunks:
+            #
+            # minimal_response only makes sense with last_updated == last_updated
+            #
+            # We use last_updated for for last_changed since its the same
+            #
+            # With minimal response we do not care about attribute
+            # changes so we can filter out duplicate states
+            if compressed_state_format:
+                # Compressed state format uses the timestamp directly
+                ent_results.extend(
+                    [
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: row[last_updated_ts_idx],
+                        }
+                        for row in rows
+                        if (state := row[state_idx]) != prev_state
+                    ]
+                )
+            else:
+                # Non-compressed state format returns an ISO formatted string
+                ent_results.extend(
+                    [
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: _utc_from_timestamp(
+                                row[last_updated_ts_idx]
+                            ).isoformat(),
+                        }
+                        for row in rows
+                        if (state := row[state_idx]) != prev_state
+                    ]
+                )
+            if ent_results:
+                yield entity_id, ent_results
+                ent_results = []
+        if ent_results:
+            yield entity_id, ent_results
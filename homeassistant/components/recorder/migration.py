@@ -53,6 +53,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -81,6 +82,12 @@ from .db_schema import (
 )
 from .models import process_timestamp
 from .models.time import datetime_to_timestamp_or_none
+from .partition import (
+    PARTITIONED_TABLES,
+    PartitionedTable,
+    get_partitions,
+    partition_table,
+)
 from .queries import (
     batch_cleanup_entity_ids,
     delete_duplicate_short_term_statistics_row,
@@ -99,7 +106,11 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import (
+    find_statistics_rollups_to_rebuild,
+    get_start_time,
+    rebuild_statistics_rollups,
+)
 from .tasks import (
     CommitTask,
     EntityIDPostMigrationTask,
@@ -123,6 +134,9 @@ if TYPE_CHECKING:
 # Schema version 42 was introduced in HA Core 2023.11
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 42
 
+# The number of statistics to build the rollups of in one migration task
+STATISTICS_ROLLUPS_BATCH_SIZE = 10
+
 MIGRATION_NOTE_OFFLINE = (
     "Note: this may take several hours on large databases and slow machines. "
     "Home Assistant will not start until the upgrade is completed. Please be patient "
@@ -1757,6 +1771,14 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The statistics_day and statistics_month tables are new tables
+        # created by create_all, their rows are built from the hourly
+        # statistics by StatisticsRollupsMigration.
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2698,6 +2720,144 @@ class EventIDPostMigration(BaseRunTimeMigration):
         return NeedsMigrateResult(needs_migrate=False, migration_done=True)
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigration):
+    """Migration to build the day and month rollups of the statistics."""
+
+    required_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION
+    migration_id = "statistics_rollups"
+
+    @staticmethod
+    @retryable_database_job("build statistics rollups")
+    def migrate_data(instance: Recorder) -> bool:
+        """Build the rollups of a batch of statistics, return True if completed."""
+        _LOGGER.debug("Building statistics rollups")
+        with session_scope(session=instance.get_session()) as session:
+            metadata_ids = find_statistics_rollups_to_rebuild(session)
+            for metadata_id in metadata_ids[:STATISTICS_ROLLUPS_BATCH_SIZE]:
+                rebuild_statistics_rollups(session, [metadata_id])
+        is_done = len(metadata_ids) <= STATISTICS_ROLLUPS_BATCH_SIZE
+        _LOGGER.debug("Building statistics rollups: done=%s", is_done)
+        return is_done
+
+    def migration_done(self, instance: Recorder, session: Session | None) -> None:
+        """Will be called after migrate returns True or if migration is not needed."""
+        instance.use_statistics_rollups = True
+
+    def needs_migrate(self, instance: Recorder, session: Session) -> bool:
+        """Return if the rollups need to be built.
+
+        The rollups are checked on every start, and never marked as done
+        in the migration changes table, since they must be rebuilt after
+        the time zone has changed.
+        """
+        if self.schema_version < self.required_schema_version:
+            return True
+        return self.needs_migrate_impl(instance, session).needs_migrate
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> NeedsMigrateResult:
+        """Return if the migration needs to run."""
+        needs_migrate = bool(find_statistics_rollups_to_rebuild(session))
+        return NeedsMigrateResult(
+            needs_migrate=needs_migrate, migration_done=not needs_migrate
+        )
+
+
+class PartitionTablesMigration(BaseRunTimeMigration):
+    """Migration to partition the states and events tables.
+
+    One table is partitioned per task, so the migration continues with the
+    tables which are not partitioned yet when it is interrupted.
+    """
+
+    migration_id = "partition_tables"
+    task = CommitBeforeMigrationTask
+
+    @staticmethod
+    @retryable_database_job("partition tables")
+    def migrate_data(instance: Recorder) -> bool:
+        """Partition the next table, returns True if all tables are partitioned.
+
+        MySQL and MariaDB do not support foreign keys on partitioned tables, the
+        foreign keys of the states and events tables are dropped for all
+        databases and the purge keeps the references intact instead.
+        """
+        dialect = instance.dialect_name
+        assert dialect is not None
+        assert instance.engine is not None
+        session_maker = instance.get_session
+        with session_scope(session=session_maker()) as session:
+            unpartitioned = _get_unpartitioned_tables(session, dialect)
+        if not unpartitioned:
+            return True
+
+        # The foreign keys of all tables are dropped before the first table is
+        # partitioned, since the states table references the events table
+        tables = {partitioned.table for partitioned in unpartitioned}
+        for table, columns, _ in FOREIGN_COLUMNS:
+            if table not in tables:
+                continue
+            for column in columns:
+                _drop_foreign_key_constraints(
+                    session_maker, instance.engine, table, column
+                )
+
+        partitioned = unpartitioned[0]
+        _LOGGER.warning(
+            "Partitioning %s table (%s of %s). "
+            "Note: this can take several minutes on large databases and slow "
+            "machines. Please be patient!",
+            partitioned.table,
+            len(PARTITIONED_TABLES) - len(unpartitioned) + 1,
+            len(PARTITIONED_TABLES),
+        )
+        # The table is partitioned in a single statement on MySQL and MariaDB,
+        # and in a single transaction on PostgreSQL, so an interrupted attempt
+        # leaves it unpartitioned and it is partitioned again by the next task
+        with session_scope(session=session_maker()) as session:
+            try:
+                partition_table(session, dialect, partitioned)
+            except (InternalError, OperationalError):
+                _LOGGER.exception("Could not partition %s table", partitioned.table)
+                raise
+        return len(unpartitioned) == 1
+
+    def needs_migrate(self, instance: Recorder, session: Session) -> bool:
+        """Return if the tables need to be partitioned.
+
+        The tables are only partitioned when the partition_tables option is
+        enabled, and never on SQLite.
+        """
+        if (
+            not instance.partition_tables
+            or instance.dialect_name == SupportedDialect.SQLITE
+        ):
+            return False
+        return super().needs_migrate(instance, session)
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> NeedsMigrateResult:
+        """Return if the migration needs to run."""
+        assert instance.dialect_name is not None
+        needs_migrate = bool(_get_unpartitioned_tables(session, instance.dialect_name))
+        return NeedsMigrateResult(
+            needs_migrate=needs_migrate, migration_done=not needs_migrate
+        )
+
+
+def _get_unpartitioned_tables(
+    session: Session, dialect: SupportedDialect
+) -> list[PartitionedTable]:
+    """Return the tables which are not partitioned yet."""
+    return [
+        partitioned
+        for partitioned in PARTITIONED_TABLES
+        if not get_partitions(session, dialect, partitioned.table)
+    ]
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
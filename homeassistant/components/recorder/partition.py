@@ -0,0 +1,321 @@
+"""Daily partitions of the states and events tables.
+
+When the partition_tables option is enabled the states and events tables of
+MySQL, MariaDB and PostgreSQL databases are partitioned by range on their
+primary key. The open partition, which receives the new rows, is closed
+once a day by the purge, so every closed partition holds about a day of
+rows. The purge drops the oldest partitions once all their rows are older
+than the purge cut off instead of deleting the rows in batches.
+
+MySQL and MariaDB can not partition on the DOUBLE timestamp columns, and
+the partition key must be part of the primary key, so the ids are used as
+partition key. The ids increase with the time the rows are recorded, and
+only the newest timestamp of a partition decides when it is dropped.
+
+The rows recorded before the tables were partitioned are kept in an
+initial partition, which is purged in batches until it is empty.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+import logging
+import re
+from typing import NamedTuple
+
+from sqlalchemy import text
+from sqlalchemy.orm.session import Session
+from sqlalchemy.schema import CreateIndex
+
+from .const import SupportedDialect
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Base
+
+_LOGGER = logging.getLogger(__name__)
+
+INITIAL_PARTITION = "pinitial"
+OPEN_PARTITION = "pmax"
+
+_POSTGRESQL_UPPER_BOUND = re.compile(r"TO \((.+)\)$")
+
+
+class PartitionedTable(NamedTuple):
+    """A table which is partitioned on its id column."""
+
+    table: str
+    id_column: str
+    time_column: str
+
+
+class Partition(NamedTuple):
+    """A partition of a table with the ids lower than upper_bound.
+
+    The upper bound of the open partition is None.
+    """
+
+    name: str
+    upper_bound: int | None
+
+
+PARTITIONED_STATES = PartitionedTable(TABLE_STATES, "state_id", "last_updated_ts")
+PARTITIONED_EVENTS = PartitionedTable(TABLE_EVENTS, "event_id", "time_fired_ts")
+PARTITIONED_TABLES = (PARTITIONED_STATES, PARTITIONED_EVENTS)
+
+
+def partition_name(day: datetime) -> str:
+    """Return the name of the partition closed on the given day."""
+    return f"p{day:%Y%m%d}"
+
+
+def _from_partition(dialect: SupportedDialect, table: str, name: str) -> str:
+    """Return the FROM clause selecting from a single partition."""
+    if dialect == SupportedDialect.MYSQL:
+        return f"{table} PARTITION ({name})"
+    # PostgreSQL partitions are tables of their own
+    return f"{table}_{name}"
+
+
+def _bound(bound: int | None, unbounded: str) -> str:
+    """Return a PostgreSQL partition bound."""
+    return unbounded if bound is None else str(bound)
+
+
+def get_partitions(
+    session: Session, dialect: SupportedDialect, table: str
+) -> list[Partition]:
+    """Return the partitions of a table ordered by their ids.
+
+    An empty list is returned if the table is not partitioned.
+    """
+    partitions: list[Partition] = []
+    if dialect == SupportedDialect.MYSQL:
+        for name, description in session.execute(
+            text(
+                "SELECT PARTITION_NAME, PARTITION_DESCRIPTION"
+                " FROM information_schema.PARTITIONS"
+                " WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+                " AND PARTITION_NAME IS NOT NULL"
+                " ORDER BY PARTITION_ORDINAL_POSITION"
+            ),
+            {"table": table},
+        ):
+            partitions.append(
+                Partition(name, None if description == "MAXVALUE" else int(description))
+            )
+        return partitions
+
+    prefix = f"{table}_"
+    for relation, bound in session.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)"
+            " FROM pg_inherits"
+            " JOIN pg_class child ON child.oid = pg_inherits.inhrelid"
+            " WHERE pg_inherits.inhparent = to_regclass(:table)"
+        ),
+        {"table": table},
+    ):
+        if not (match := _POSTGRESQL_UPPER_BOUND.search(bound)):
+            continue
+        upper_bound = match.group(1).strip("'")
+        partitions.append(
+            Partition(
+                relation.removeprefix(prefix),
+                None if upper_bound == "MAXVALUE" else int(upper_bound),
+            )
+        )
+    partitions.sort(
+        key=lambda partition: (
+            partition.upper_bound is None,
+            partition.upper_bound or 0,
+        )
+    )
+    return partitions
+
+
+def partition_table(
+    session: Session, dialect: SupportedDialect, partitioned: PartitionedTable
+) -> None:
+    """Partition a table, keeping its rows in the initial partition.
+
+    The foreign keys of the table must have been dropped before.
+    """
+    table, id_column, _ = partitioned
+    upper_bound = (
+        session.execute(
+            text(f"SELECT MAX({id_column}) FROM {table}")  # noqa: S608
+        ).scalar()
+        or 0
+    ) + 1
+    if dialect == SupportedDialect.MYSQL:
+        session.execute(
+            text(
+                f"ALTER TABLE {table} PARTITION BY RANGE ({id_column}) ("
+                f"PARTITION {INITIAL_PARTITION} VALUES LESS THAN ({upper_bound}), "
+                f"PARTITION {OPEN_PARTITION} VALUES LESS THAN MAXVALUE)"
+            )
+        )
+        return
+
+    # PostgreSQL can not partition an existing table, so the table becomes
+    # the initial partition of a new partitioned table. Its indices are
+    # renamed to free their names for the indices of the new table.
+    initial = f"{table}_{INITIAL_PARTITION}"
+    session.execute(text(f"ALTER TABLE {table} RENAME TO {initial}"))
+    for (index_name,) in session.execute(
+        text(
+            "SELECT indexname FROM pg_indexes"
+            " WHERE schemaname = current_schema() AND tablename = :table"
+        ),
+        {"table": initial},
+    ).all():
+        session.execute(
+            text(f"ALTER INDEX {index_name} RENAME TO {index_name}_{INITIAL_PARTITION}")
+        )
+    session.execute(
+        text(f"CREATE TABLE {table} (LIKE {initial}) PARTITION BY RANGE ({id_column})")
+    )
+    session.execute(text(f"ALTER TABLE {table} ADD PRIMARY KEY ({id_column})"))
+    session.execute(
+        text(
+            f"ALTER TABLE {table} ALTER COLUMN {id_column} ADD GENERATED BY DEFAULT"
+            f" AS IDENTITY (START WITH {upper_bound})"
+        )
+    )
+    connection = session.connection()
+    for index in Base.metadata.tables[table].indexes:
+        connection.execute(CreateIndex(index))
+    # The existing indices of the initial partition are attached to the
+    # matching indices of the new table
+    session.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {initial}"
+            f" FOR VALUES FROM (MINVALUE) TO ({upper_bound})"
+        )
+    )
+    session.execute(
+        text(
+            f"CREATE TABLE {table}_{OPEN_PARTITION} PARTITION OF {table}"
+            f" FOR VALUES FROM ({upper_bound}) TO (MAXVALUE)"
+        )
+    )
+
+
+def close_open_partition(
+    session: Session,
+    dialect: SupportedDialect,
+    partitioned: PartitionedTable,
+    partitions: list[Partition],
+    name: str,
+) -> list[Partition]:
+    """Move the rows of the open partition to a new partition with the given name.
+
+    Returns the partitions of the table afterwards.
+    """
+    table, id_column, _ = partitioned
+    if any(partition.name == name for partition in partitions):
+        return partitions
+    lower_bound = partitions[-2].upper_bound if len(partitions) > 1 else None
+    max_id = session.execute(
+        text(f"SELECT MAX({id_column}) FROM {table}")  # noqa: S608
+    ).scalar()
+    if max_id is None or (lower_bound is not None and max_id < lower_bound):
+        # The open partition is empty
+        return partitions
+    upper_bound = max_id + 1
+    _LOGGER.debug("Closing partition %s of %s at %s", name, table, upper_bound)
+    if dialect == SupportedDialect.MYSQL:
+        session.execute(
+            text(
+                f"ALTER TABLE {table} REORGANIZE PARTITION {OPEN_PARTITION} INTO ("
+                f"PARTITION {name} VALUES LESS THAN ({upper_bound}), "
+                f"PARTITION {OPEN_PARTITION} VALUES LESS THAN MAXVALUE)"
+            )
+        )
+    else:
+        open_relation = f"{table}_{OPEN_PARTITION}"
+        closed_relation = f"{table}_{name}"
+        session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {open_relation}"))
+        session.execute(
+            text(f"ALTER TABLE {open_relation} RENAME TO {closed_relation}")
+        )
+        session.execute(
+            text(
+                f"ALTER TABLE {table} ATTACH PARTITION {closed_relation} FOR VALUES"
+                f" FROM ({_bound(lower_bound, 'MINVALUE')}) TO ({upper_bound})"
+            )
+        )
+        session.execute(
+            text(
+                f"CREATE TABLE {open_relation} PARTITION OF {table}"
+                f" FOR VALUES FROM ({upper_bound}) TO (MAXVALUE)"
+            )
+        )
+    return [*partitions[:-1], Partition(name, upper_bound), partitions[-1]]
+
+
+def find_old_partitions(
+    session: Session,
+    dialect: SupportedDialect,
+    partitioned: PartitionedTable,
+    partitions: Iterable[Partition],
+    purge_before: float,
+) -> list[Partition]:
+    """Return the oldest closed partitions which only hold rows before purge_before.
+
+    Empty partitions are old as well.
+    """
+    table, _, time_column = partitioned
+    old_partitions: list[Partition] = []
+    for partition in partitions:
+        if partition.upper_bound is None:
+            break
+        newest = session.execute(
+            text(
+                f"SELECT MAX({time_column})"  # noqa: S608
+                f" FROM {_from_partition(dialect, table, partition.name)}"
+            )
+        ).scalar()
+        if newest is not None and newest >= purge_before:
+            break
+        old_partitions.append(partition)
+    return old_partitions
+
+
+def select_partition_ids(
+    session: Session,
+    dialect: SupportedDialect,
+    table: str,
+    partitions: Iterable[Partition],
+    column: str,
+) -> set[int]:
+    """Return the distinct ids in a column of the given partitions."""
+    ids: set[int] = set()
+    for partition in partitions:
+        ids.update(
+            row_id
+            for (row_id,) in session.execute(
+                text(
+                    f"SELECT DISTINCT {column}"  # noqa: S608
+                    f" FROM {_from_partition(dialect, table, partition.name)}"
+                    f" WHERE {column} IS NOT NULL"
+                )
+            )
+        )
+    return ids
+
+
+def drop_partitions(
+    session: Session,
+    dialect: SupportedDialect,
+    table: str,
+    partitions: Iterable[Partition],
+) -> None:
+    """Drop partitions with all their rows."""
+    names = [partition.name for partition in partitions]
+    _LOGGER.debug("Dropping partitions %s of %s", names, table)
+    if dialect == SupportedDialect.MYSQL:
+        session.execute(text(f"ALTER TABLE {table} DROP PARTITION {', '.join(names)}"))
+        return
+    session.execute(
+        text(f"DROP TABLE {', '.join(f'{table}_{name}' for name in names)}")
+    )
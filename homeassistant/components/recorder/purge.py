@@ -11,10 +11,24 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
+from .const import SupportedDialect
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
+from .partition import (
+    INITIAL_PARTITION,
+    PARTITIONED_EVENTS,
+    PARTITIONED_STATES,
+    Partition,
+    close_open_partition,
+    drop_partitions,
+    find_old_partitions,
+    get_partitions,
+    partition_name,
+    select_partition_ids,
+)
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
@@ -30,6 +44,7 @@ from .queries import (
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_before,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -80,6 +95,14 @@ def purge_old_data(
                 " remaining"
             )
             has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+        elif (
+            instance.partition_tables
+            and instance.dialect_name != SupportedDialect.SQLITE
+        ):
+            _LOGGER.debug("Purge running on partitioned tables")
+            has_more_to_purge |= _purge_partitions(
+                instance, session, purge_before, states_batch_size, events_batch_size
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -173,6 +196,91 @@ def _purge_legacy_format(
     )
 
 
+def _purge_partitions(
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    states_batch_size: int,
+    events_batch_size: int,
+) -> bool:
+    """Purge states and events by dropping their old partitions.
+
+    The open partitions are closed first, at most once a day. Tables which
+    are not partitioned yet, or still have rows in their initial partition,
+    are purged in batches as well.
+
+    Returns true if there are more states or events to purge.
+    """
+    dialect = instance.dialect_name
+    assert dialect is not None
+    name = partition_name(dt_util.utcnow())
+    purge_before_ts = purge_before.timestamp()
+    has_more_to_purge = False
+
+    if partitions := get_partitions(session, dialect, PARTITIONED_STATES.table):
+        partitions = close_open_partition(
+            session, dialect, PARTITIONED_STATES, partitions, name
+        )
+    if not partitions or partitions[0].name == INITIAL_PARTITION:
+        has_more_to_purge |= _purge_states_and_attributes_ids(
+            instance, session, states_batch_size, purge_before
+        )
+    if old_partitions := find_old_partitions(
+        session, dialect, PARTITIONED_STATES, partitions, purge_before_ts
+    ):
+        _purge_states_partitions(instance, session, dialect, old_partitions)
+
+    if partitions := get_partitions(session, dialect, PARTITIONED_EVENTS.table):
+        partitions = close_open_partition(
+            session, dialect, PARTITIONED_EVENTS, partitions, name
+        )
+    if not partitions or partitions[0].name == INITIAL_PARTITION:
+        has_more_to_purge |= _purge_events_and_data_ids(
+            instance, session, events_batch_size, purge_before
+        )
+    if old_partitions := find_old_partitions(
+        session, dialect, PARTITIONED_EVENTS, partitions, purge_before_ts
+    ):
+        _purge_events_partitions(instance, session, dialect, old_partitions)
+
+    return has_more_to_purge
+
+
+def _purge_states_partitions(
+    instance: Recorder,
+    session: Session,
+    dialect: SupportedDialect,
+    partitions: list[Partition],
+) -> None:
+    """Drop states partitions and the attributes which only they used."""
+    table = PARTITIONED_STATES.table
+    attributes_ids = select_partition_ids(
+        session, dialect, table, partitions, "attributes_id"
+    )
+    drop_partitions(session, dialect, table, partitions)
+    # The partitioned table has no foreign keys, the states linked to
+    # a dropped state are disconnected here instead
+    upper_bound = partitions[-1].upper_bound
+    assert upper_bound is not None
+    disconnected_rows = session.execute(disconnect_states_rows_before(upper_bound))
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+    instance.states_manager.evict_purged_state_ids_before(upper_bound)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+
+
+def _purge_events_partitions(
+    instance: Recorder,
+    session: Session,
+    dialect: SupportedDialect,
+    partitions: list[Partition],
+) -> None:
+    """Drop events partitions and the event data which only they used."""
+    table = PARTITIONED_EVENTS.table
+    data_ids = select_partition_ids(session, dialect, table, partitions, "data_id")
+    drop_partitions(session, dialect, table, partitions)
+    _purge_unused_data_ids(instance, session, data_ids)
+
+
 def _purge_states_and_attributes_ids(
     instance: Recorder,
     session: Session,
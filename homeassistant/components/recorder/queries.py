@@ -44,6 +44,24 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def get_latest_shared_attributes(limit: int) -> Select:
+    """Load the shared attributes of the latest states from the database.
+
+    This query is intentionally not a lambda statement as it only runs
+    once at startup.
+    """
+    latest_attributes_ids = (
+        select(States.attributes_id)
+        .where(States.attributes_id.is_not(None))
+        .order_by(States.state_id.desc())
+        .limit(limit)
+        .subquery()
+    )
+    return select(StateAttributes.attributes_id, StateAttributes.shared_attrs).where(
+        StateAttributes.attributes_id.in_(select(latest_attributes_ids.c.attributes_id))
+    )
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -540,6 +558,16 @@ def disconnect_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     )
 
 
+def disconnect_states_rows_before(state_id: int) -> StatementLambdaElement:
+    """Disconnect states rows from old states with a lower state_id."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id < state_id)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_states_rows(state_ids: Iterable[int]) -> StatementLambdaElement:
     """Delete states rows."""
     return lambda_stmt(
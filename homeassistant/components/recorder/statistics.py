@@ -11,9 +11,21 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -59,6 +71,9 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDay,
+    StatisticsMeta,
+    StatisticsMonth,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -443,6 +458,10 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    if summary:
+        # Bring the day and month rollups of the hour up to date
+        _update_statistics_rollups(session, list(summary), start_time_ts, start_time_ts)
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -1101,6 +1120,187 @@ def _reduce_statistics_per_month(
     )
 
 
+def _rollup_statistics(
+    rows: Iterable[Row],
+    period_start_end: Callable[[float], tuple[float, float]],
+    created_ts: float,
+) -> list[dict[str, Any]]:
+    """Reduce statistics to rollups of the periods they are in.
+
+    The rows are metadata_id, start_ts, mean, min, max, last_reset_ts, state,
+    sum and mean_weight, ordered by metadata_id and start_ts. The means are
+    weighted with mean_weight, which is 1 for hourly statistics, so the mean
+    of a rollup is the mean of the hourly means like _reduce_statistics.
+    """
+    rollups: list[dict[str, Any]] = []
+    for (metadata_id, start_ts), group in groupby(
+        rows, lambda row: (row[0], period_start_end(row[1])[0])
+    ):
+        period_rows = list(group)
+        weighted_means = [
+            row[2] * row[8] for row in period_rows if row[2] is not None and row[8]
+        ]
+        mean_weight = sum(
+            row[8] for row in period_rows if row[2] is not None and row[8]
+        )
+        min_values = [row[3] for row in period_rows if row[3] is not None]
+        max_values = [row[4] for row in period_rows if row[4] is not None]
+        last_row = period_rows[-1]
+        rollups.append(
+            {
+                "metadata_id": metadata_id,
+                "created_ts": created_ts,
+                "start_ts": start_ts,
+                "mean": sum(weighted_means) / mean_weight if mean_weight else None,
+                "mean_weight": mean_weight,
+                "min": min(min_values) if min_values else None,
+                "max": max(max_values) if max_values else None,
+                "last_reset_ts": last_row[5],
+                "state": last_row[6],
+                "sum": last_row[7],
+            }
+        )
+    return rollups
+
+
+def _rebuild_statistics_rollups_for_table(
+    session: Session,
+    table: type[StatisticsDay | StatisticsMonth],
+    source_table: type[Statistics | StatisticsDay],
+    period_start_end: Callable[[float], tuple[float, float]],
+    metadata_ids: list[int],
+    start_ts: float | None,
+    end_ts: float | None,
+) -> None:
+    """Rebuild the rollups of a table from start_ts to end_ts from the source table."""
+    weight = literal(1) if source_table is Statistics else StatisticsDay.mean_weight
+    stmt = select(
+        source_table.metadata_id,
+        source_table.start_ts,
+        source_table.mean,
+        source_table.min,
+        source_table.max,
+        source_table.last_reset_ts,
+        source_table.state,
+        source_table.sum,
+        weight,
+    ).filter(source_table.metadata_id.in_(metadata_ids))
+    delete_stmt = delete(table).filter(table.metadata_id.in_(metadata_ids))
+    if start_ts is not None:
+        stmt = stmt.filter(source_table.start_ts >= start_ts)
+        delete_stmt = delete_stmt.filter(table.start_ts >= start_ts)
+    if end_ts is not None:
+        stmt = stmt.filter(source_table.start_ts < end_ts)
+        delete_stmt = delete_stmt.filter(table.start_ts < end_ts)
+    rollups = _rollup_statistics(
+        session.execute(stmt.order_by(source_table.metadata_id, source_table.start_ts)),
+        period_start_end,
+        time.time(),
+    )
+    session.execute(delete_stmt, execution_options={"synchronize_session": False})
+    if rollups:
+        session.execute(insert(table), rollups)
+
+
+def _update_statistics_rollups(
+    session: Session,
+    metadata_ids: list[int],
+    first_start_ts: float | None,
+    last_start_ts: float | None,
+) -> None:
+    """Rebuild the day and month rollups of hourly statistics.
+
+    The days and months from the one first_start_ts is in to the one
+    last_start_ts is in are rebuilt. None rebuilds all periods before or
+    after the other bound.
+    """
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    day_start_ts = day_end_ts = month_start_ts = month_end_ts = None
+    if first_start_ts is not None:
+        day_start_ts = day_start_end(first_start_ts)[0]
+        month_start_ts = month_start_end(first_start_ts)[0]
+    if last_start_ts is not None:
+        day_end_ts = day_start_end(last_start_ts)[1]
+        month_end_ts = month_start_end(last_start_ts)[1]
+    _rebuild_statistics_rollups_for_table(
+        session,
+        StatisticsDay,
+        Statistics,
+        day_start_end,
+        metadata_ids,
+        day_start_ts,
+        day_end_ts,
+    )
+    _rebuild_statistics_rollups_for_table(
+        session,
+        StatisticsMonth,
+        StatisticsDay,
+        month_start_end,
+        metadata_ids,
+        month_start_ts,
+        month_end_ts,
+    )
+
+
+def find_statistics_rollups_to_rebuild(session: Session) -> list[int]:
+    """Return the metadata_ids of statistics without up to date rollups.
+
+    The day rollups of a statistic must start on the day of its first
+    hourly statistic and end on the day of its last one, which they do not
+    if they were never built, were not maintained by an older version or
+    were built in another time zone.
+    """
+    _, day_start_end = reduce_day_ts_factory()
+    stmt = select(
+        StatisticsMeta.id,
+        select(func.min(Statistics.start_ts))
+        .filter(Statistics.metadata_id == StatisticsMeta.id)
+        .scalar_subquery(),
+        select(func.max(Statistics.start_ts))
+        .filter(Statistics.metadata_id == StatisticsMeta.id)
+        .scalar_subquery(),
+        select(func.min(StatisticsDay.start_ts))
+        .filter(StatisticsDay.metadata_id == StatisticsMeta.id)
+        .scalar_subquery(),
+        select(func.max(StatisticsDay.start_ts))
+        .filter(StatisticsDay.metadata_id == StatisticsMeta.id)
+        .scalar_subquery(),
+    )
+    return [
+        metadata_id
+        for metadata_id, first_ts, last_ts, first_day_ts, last_day_ts in (
+            session.execute(stmt)
+        )
+        if (
+            (first_ts is None and first_day_ts is not None)
+            or (
+                first_ts is not None
+                and (
+                    first_day_ts != day_start_end(first_ts)[0]
+                    or last_day_ts != day_start_end(last_ts)[0]
+                )
+            )
+        )
+    ]
+
+
+def rebuild_statistics_rollups(session: Session, metadata_ids: list[int]) -> None:
+    """Rebuild all day and month rollups of statistics."""
+    _update_statistics_rollups(session, metadata_ids, None, None)
+
+
+def _rollups_match_time_zone(
+    stats: Sequence[Row],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> bool:
+    """Return if the rollups start at the periods of the current time zone."""
+    return all(
+        period_start_end(start_ts)[0] == start_ts
+        for start_ts in {row.start_ts for row in stats}
+    )
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1756,12 +1956,35 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    stats_table: type[StatisticsBase] = table
+    stats: Sequence[Row] | None = None
+    if period in ("day", "month") and get_instance(hass).use_statistics_rollups:
+        # Read the days and months from the rollups instead of
+        # reducing the hourly statistics, unless the rollups were
+        # built in another time zone and are not rebuilt yet.
+        rollup_table, (_, period_start_end) = (
+            (StatisticsDay, reduce_day_ts_factory())
+            if period == "day"
+            else (StatisticsMonth, reduce_month_ts_factory())
+        )
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, rollup_table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
+        if _rollups_match_time_zone(stats, period_start_end):
+            stats_table = rollup_table
+        else:
+            stats = None
+
+    if stats is None:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -1772,7 +1995,7 @@ def _statistics_during_period_with_session(
         statistic_ids,
         metadata,
         True,
-        table,
+        stats_table,
         units,
         types,
     )
@@ -2354,13 +2577,19 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_timestamps: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        start_timestamps.append(stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
+        if start_timestamps:
+            _update_statistics_rollups(
+                session, [metadata_id], min(start_timestamps), max(start_timestamps)
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2489,6 +2718,13 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        # The sums of all rollups after the adjustment have changed
+        _update_statistics_rollups(
+            session,
+            [metadata[statistic_id][0]],
+            start_time.replace(minute=0).timestamp(),
+            None,
+        )
 
     return True
 
@@ -2550,6 +2786,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDay,
+            StatisticsMonth,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
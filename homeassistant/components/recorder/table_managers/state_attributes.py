@@ -12,8 +12,8 @@ from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
-from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..db_schema import StateAttributes, States
+from ..queries import get_latest_shared_attributes, get_shared_attributes
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -37,6 +37,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._unresolved: dict[str, tuple[StateAttributes, list[States]]] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -67,6 +68,22 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         }:
             self._load_from_hashes(hashes, session)
 
+    def warm_up(self, session: Session) -> None:
+        """Load the attributes of the latest states into memory.
+
+        Called at startup so the first states after a restart find
+        their attributes_ids without a query.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        with session.no_autoflush:
+            for attributes_id, shared_attrs in session.execute(
+                get_latest_shared_attributes(id_map.get_size())
+            ):
+                id_map[shared_attrs] = attributes_id
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -126,6 +143,53 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         shared_attrs: str = db_state_attributes.shared_attrs
         self._pending[shared_attrs] = db_state_attributes
 
+    def add_unresolved(
+        self, db_state_attributes: StateAttributes, db_state: States
+    ) -> None:
+        """Add a state whose shared_attrs were not found in memory.
+
+        The attributes_ids of all unresolved states are looked up with
+        a single query when the session is committed, db_state_attributes
+        is only added if the shared_attrs are not found.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        shared_attrs = cast(str, db_state_attributes.shared_attrs)
+        if (unresolved := self._unresolved.get(shared_attrs)) is None:
+            self._unresolved[shared_attrs] = (db_state_attributes, [db_state])
+        else:
+            unresolved[1].append(db_state)
+
+    def resolve_unresolved(self, session: Session) -> None:
+        """Link the unresolved states to their StateAttributes.
+
+        Attributes which are not in the database yet are added to
+        the session as pending StateAttributes.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (unresolved := self._unresolved):
+            return
+        found = self._load_from_hashes(
+            {
+                cast(int, db_state_attributes.hash)
+                for db_state_attributes, _ in unresolved.values()
+            },
+            session,
+        )
+        for shared_attrs, (db_state_attributes, db_states) in unresolved.items():
+            if (attributes_id := found.get(shared_attrs)) is not None:
+                for db_state in db_states:
+                    db_state.attributes_id = attributes_id
+                continue
+            self.add_pending(db_state_attributes)
+            session.add(db_state_attributes)
+            for db_state in db_states:
+                db_state.state_attributes = db_state_attributes
+        unresolved.clear()
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the attributes_ids of the new StateAttributes into the LRU.
 
@@ -136,6 +200,15 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._unresolved.clear()
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
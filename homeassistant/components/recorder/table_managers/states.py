@@ -93,6 +93,19 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_ids_before(self, state_id: int) -> None:
+        """Evict the committed states with a lower state_id.
+
+        Used after the partitions holding these states have been dropped.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id in [
+            entity_id
+            for entity_id, committed_id in last_committed_ids.items()
+            if committed_id < state_id
+        ]:
+            del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
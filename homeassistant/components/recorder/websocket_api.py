@@ -127,7 +127,7 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -136,6 +136,7 @@ async def ws_get_statistic_during_period(
             msg["statistic_id"],
             msg.get("types"),
             msg.get("units"),
+            queue_key=connection,
         )
     )
 
@@ -195,7 +196,7 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -205,6 +206,7 @@ async def ws_handle_get_statistics_during_period(
             msg.get("period"),
             msg.get("units"),
             types,
+            queue_key=connection,
         )
     )
 
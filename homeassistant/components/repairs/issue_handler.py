@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.integration_platform import (
+    async_load_deferred_integration_platforms,
     async_process_integration_platforms,
 )
 
@@ -103,6 +104,7 @@ async def async_process_repairs_platforms(hass: HomeAssistant) -> None:
     await async_process_integration_platforms(
         hass, DOMAIN, _register_repairs_platform, wait_for_platforms=True
     )
+    await async_load_deferred_integration_platforms(hass, DOMAIN)
 
 
 @callback
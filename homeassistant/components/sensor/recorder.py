@@ -5,10 +5,9 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 import datetime
-import itertools
 import logging
 import math
-from typing import Any
+from typing import Any, NamedTuple
 
 from sqlalchemy.orm.session import Session
 
@@ -47,6 +46,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_EPOCH = dt_util.utc_from_timestamp(0)
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+
 DEFAULT_STATISTICS = {
     SensorStateClass.MEASUREMENT: {"mean", "min", "max"},
     SensorStateClass.TOTAL: {"sum"},
@@ -93,31 +95,53 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     ]
 
 
+class _FloatColumns(NamedTuple):
+    """Valid float states of an entity as columns."""
+
+    values: list[float]
+    timestamps_us: list[int]
+    units: list[str | None]
+
+
+def _timestamp_to_microseconds(timestamp: float) -> int:
+    """Convert a timestamp to microseconds.
+
+    The timestamp is rounded like dt_util.utc_from_timestamp does, so durations
+    match the ones calculated from State.last_updated.
+    """
+    frac, whole = math.modf(timestamp)
+    return int(whole) * 1_000_000 + round(frac * 1e6)
+
+
+def _datetime_to_microseconds(value: datetime.datetime) -> int:
+    """Convert a datetime to microseconds since the epoch."""
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    values: list[float], timestamps_us: list[int], start_us: int, end_us: int
 ) -> float:
     """Calculate a time weighted average.
 
     The average is calculated by weighting the states by duration in seconds between
-    state changes.
+    state changes. Timestamps are in microseconds since the epoch.
     Note: there's no interpolation of values between state changes.
     """
     old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
+    old_start_time: int | None = None
     accumulated = 0.0
 
-    for fstate, state in fstates:
+    for fstate, timestamp_us in zip(values, timestamps_us, strict=True):
         # The recorder will give us the last known state, which may be well
         # before the requested start time for the statistics
-        start_time = max(state.last_updated, start)
+        start_time = max(timestamp_us, start_us)
         if old_start_time is None:
             # Adjust start time, if there was no last known state
-            start = start_time
+            start_us = start_time
         else:
-            duration = start_time - old_start_time
             # Accumulate the value, weighted by duration until next state change
             assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
+            accumulated += old_fstate * ((start_time - old_start_time) / 1_000_000)
 
         old_fstate = fstate
         old_start_time = start_time
@@ -125,10 +149,9 @@ def _time_weighted_average(
     if old_fstate is not None:
         # Accumulate the value, weighted by duration until end of the period
         assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
+        accumulated += old_fstate * ((end_us - old_start_time) / 1_000_000)
 
-    period_seconds = (end - start).total_seconds()
+    period_seconds = (end_us - start_us) / 1_000_000
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -140,11 +163,6 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
-def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
-    """Return a set of all units."""
-    return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
-
-
 def _equivalent_units(units: set[str | None]) -> bool:
     """Return True if the units are equivalent."""
     if len(units) == 1:
@@ -174,6 +192,23 @@ def _entity_history_to_float_and_state(
     return float_states
 
 
+def _state_columns_to_float_columns(columns: history.StateColumns) -> _FloatColumns:
+    """Return the valid float states of the given entity as columns."""
+    values: list[float] = []
+    timestamps_us: list[int] = []
+    units: list[str | None] = []
+    isfinite = math.isfinite
+    for state, timestamp, attributes in zip(*columns, strict=True):
+        try:
+            if isfinite(float_state := float(state)):
+                values.append(float_state)
+                timestamps_us.append(_timestamp_to_microseconds(timestamp))
+                units.append(attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+        except (ValueError, TypeError):
+            pass
+    return _FloatColumns(values, timestamps_us, units)
+
+
 def _normalize_states(
     hass: HomeAssistant,
     old_metadatas: dict[str, tuple[int, StatisticMetaData]],
@@ -181,9 +216,52 @@ def _normalize_states(
     entity_id: str,
 ) -> tuple[str | None, list[tuple[float, State]]]:
     """Normalize units."""
+    statistics_unit, valid_values = _normalize_values(
+        hass,
+        old_metadatas,
+        [fstate for fstate, _ in fstates],
+        [state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) for _, state in fstates],
+        entity_id,
+    )
+    return statistics_unit, [(fstate, fstates[idx][1]) for idx, fstate in valid_values]
+
+
+def _normalize_float_columns(
+    hass: HomeAssistant,
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]],
+    columns: _FloatColumns,
+    entity_id: str,
+) -> tuple[str | None, _FloatColumns]:
+    """Normalize units of float states stored as columns."""
+    statistics_unit, valid_values = _normalize_values(
+        hass, old_metadatas, columns.values, columns.units, entity_id
+    )
+    if not valid_values:
+        return statistics_unit, _FloatColumns([], [], [])
+    timestamps_us = columns.timestamps_us
+    units = columns.units
+    return statistics_unit, _FloatColumns(
+        [fstate for _, fstate in valid_values],
+        [timestamps_us[idx] for idx, _ in valid_values],
+        [units[idx] for idx, _ in valid_values],
+    )
+
+
+def _normalize_values(
+    hass: HomeAssistant,
+    old_metadatas: dict[str, tuple[int, StatisticMetaData]],
+    values: list[float],
+    units: list[str | None],
+    entity_id: str,
+) -> tuple[str | None, list[tuple[int, float]]]:
+    """Normalize units.
+
+    Returns the unit used for statistics and the index and normalized value
+    of the values which can be used for statistics.
+    """
     state_unit: str | None = None
     statistics_unit: str | None
-    state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    state_unit = units[0]
     old_metadata = old_metadatas[entity_id][1] if entity_id in old_metadatas else None
     if not old_metadata:
         # We've not seen this sensor before, the first valid state determines the unit
@@ -196,7 +274,7 @@ def _normalize_states(
     if statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
         # The unit used by this sensor doesn't support unit conversion
 
-        all_units = _get_units(fstates)
+        all_units = set(units)
         if not _equivalent_units(all_units):
             if WARN_UNSTABLE_UNIT not in hass.data:
                 hass.data[WARN_UNSTABLE_UNIT] = set()
@@ -220,17 +298,15 @@ def _normalize_states(
                     LINK_DEV_STATISTICS,
                 )
             return None, []
-        state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-        return state_unit, fstates
+        return state_unit, list(enumerate(values))
 
     converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
-    valid_fstates: list[tuple[float, State]] = []
+    valid_values: list[tuple[int, float]] = []
     convert: Callable[[float], float] | None = None
     last_unit: str | None | object = object()
     valid_units = converter.VALID_UNITS
 
-    for fstate, state in fstates:
-        state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    for idx, (fstate, state_unit) in enumerate(zip(values, units, strict=True)):
         # Exclude states with unsupported unit from statistics
         if state_unit not in valid_units:
             if WARN_UNSUPPORTED_UNIT not in hass.data:
@@ -264,9 +340,9 @@ def _normalize_states(
         if convert is not None:
             fstate = convert(fstate)
 
-        valid_fstates.append((fstate, state))
+        valid_values.append((idx, fstate))
 
-    return statistics_unit, valid_fstates
+    return statistics_unit, valid_values
 
 
 def _suggest_report_issue(hass: HomeAssistant, entity_id: str) -> str:
@@ -413,24 +489,39 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
+    # Entities without sum statistics only need the value and time of each
+    # state, fetch them as columns to avoid creating State objects
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
+    history_columns: dict[str, history.StateColumns] = {}
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
+        history_columns = history.get_significant_state_columns_with_session(
             hass,
             session,
             start - datetime.timedelta.resolution,
             end,
-            entity_ids=entities_significant_history,
+            entities_significant_history,
         )
-        history_list = {**history_list, **_history_list}
 
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    entities_with_float_columns: dict[str, _FloatColumns] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if "sum" not in wanted_statistics[entity_id]:
+            # If there are no recent state changes, the sensor's state may already
+            # be pruned from the recorder. Get the state from the state machine
+            # instead.
+            if not (entity_columns := history_columns.get(entity_id)):
+                entity_columns = history.StateColumns(
+                    [_state.state], [_state.last_updated_timestamp], [_state.attributes]
+                )
+            float_columns = _state_columns_to_float_columns(entity_columns)
+            if float_columns.values:
+                entities_with_float_columns[entity_id] = float_columns
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -444,21 +535,38 @@ def compile_statistics(  # noqa: C901
     # that are not in the metadata table and we are not working
     # with them anyway.
     old_metadatas = statistics.get_metadata_with_session(
-        get_instance(hass), session, statistic_ids=set(entities_with_float_states)
+        get_instance(hass),
+        session,
+        statistic_ids={*entities_with_float_states, *entities_with_float_columns},
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[
+        tuple[str, str | None, str, list[tuple[float, State]] | _FloatColumns]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
-        if not (maybe_float_states := entities_with_float_states.get(entity_id)):
+        valid_float_states: list[tuple[float, State]] | _FloatColumns
+        if maybe_float_columns := entities_with_float_columns.get(entity_id):
+            statistics_unit, valid_float_states = _normalize_float_columns(
+                hass,
+                old_metadatas,
+                maybe_float_columns,
+                entity_id,
+            )
+        elif maybe_float_states := entities_with_float_states.get(entity_id):
+            statistics_unit, valid_float_states = _normalize_states(
+                hass,
+                old_metadatas,
+                maybe_float_states,
+                entity_id,
+            )
+        else:
             continue
-        statistics_unit, valid_float_states = _normalize_states(
-            hass,
-            old_metadatas,
-            maybe_float_states,
-            entity_id,
-        )
-        if not valid_float_states:
+        if not (
+            valid_float_states.values
+            if isinstance(valid_float_states, _FloatColumns)
+            else valid_float_states
+        ):
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
         to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
@@ -468,6 +576,8 @@ def compile_statistics(  # noqa: C901
     last_stats = statistics.get_latest_short_term_statistics_with_session(
         hass, session, to_query, {"last_reset", "state", "sum"}, metadata=old_metadatas
     )
+    start_us = _datetime_to_microseconds(start)
+    end_us = _datetime_to_microseconds(end)
     for (  # pylint: disable=too-many-nested-blocks
         entity_id,
         statistics_unit,
@@ -511,19 +621,18 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+        if isinstance(valid_float_states, _FloatColumns):
+            values = valid_float_states.values
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(values)
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(values)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(
+                    values, valid_float_states.timestamps_us, start_us, end_us
+                )
 
-        if "sum" in wanted_statistics[entity_id]:
+        elif "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
             new_state = old_state = None
             _sum = 0.0
@@ -24,7 +24,6 @@ from async_upnp_client.const import (
     DeviceOrServiceType,
     SsdpSource,
 )
-from async_upnp_client.description_cache import DescriptionCache
 from async_upnp_client.server import UpnpServer, UpnpServerDevice, UpnpServerService
 from async_upnp_client.ssdp import (
     SSDP_PORT,
@@ -52,10 +51,12 @@ from homeassistant.helpers.instance_id import async_get as async_get_instance_id
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.system_info import async_get_system_info
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import async_get_ssdp, bind_hass
+from homeassistant.loader import DiscoveryMatcherIndex, async_get_ssdp, bind_hass
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.logging import catch_log_exception
 
+from .description_cache import DescriptionCache
+
 DOMAIN = "ssdp"
 SSDP_SCANNER = "scanner"
 UPNP_SERVER = "server"
@@ -256,44 +257,33 @@ class IntegrationMatchers:
 
     def __init__(self) -> None:
         """Init optimized integration matching."""
-        self._match_by_key: (
-            dict[str, dict[str, list[tuple[str, dict[str, str]]]]] | None
-        ) = None
+        self._matchers: DiscoveryMatcherIndex[str] | None = None
 
     @core_callback
     def async_setup(
         self, integration_matchers: dict[str, list[dict[str, str]]]
     ) -> None:
-        """Build matchers by key.
+        """Compile the matchers.
 
-        Here we convert the primary match keys into their own
-        dicts so we can do lookups of the primary match
-        key to find the match dict.
+        Only matchers with one of the primary match keys are used,
+        they are indexed by the value of one of their keys so the
+        matchers of a discovery are found with lookups of its values.
         """
-        self._match_by_key = {}
-        for key in PRIMARY_MATCH_KEYS:
-            matchers_by_key = self._match_by_key[key] = {}
-            for domain, matchers in integration_matchers.items():
-                for matcher in matchers:
-                    if match_value := matcher.get(key):
-                        matchers_by_key.setdefault(match_value, []).append(
-                            (domain, matcher)
-                        )
+        self._matchers = DiscoveryMatcherIndex(
+            (
+                (domain, matcher)
+                for domain, matchers in integration_matchers.items()
+                for matcher in matchers
+                if any(matcher.get(key) for key in PRIMARY_MATCH_KEYS)
+            ),
+            glob=False,
+        )
 
     @core_callback
     def async_matching_domains(self, info_with_desc: CaseInsensitiveDict) -> set[str]:
         """Find domains matching the passed CaseInsensitiveDict."""
-        assert self._match_by_key is not None
-        domains = set()
-        for key, matchers_by_key in self._match_by_key.items():
-            if not (match_value := info_with_desc.get(key)):
-                continue
-            for domain, matcher in matchers_by_key.get(match_value, []):
-                if domain in domains:
-                    continue
-                if all(info_with_desc.get(k) == v for (k, v) in matcher.items()):
-                    domains.add(domain)
-        return domains
+        assert self._matchers is not None
+        return set(self._matchers.match(info_with_desc))
 
 
 class Scanner:
@@ -469,7 +459,9 @@ class Scanner:
         assert self._description_cache
 
         location = ssdp_device.location
-        _, info_desc = self._description_cache.peek_description_dict(location)
+        _, info_desc = self._description_cache.peek_description_dict(
+            location, ssdp_device.combined_headers(dst)
+        )
         if info_desc is None:
             # Fetch info desc in separate task and process from there.
             self.hass.async_create_background_task(
@@ -496,7 +488,9 @@ class Scanner:
             ssdp_device,
             dst,
             source,
-            await self._async_get_description_dict(location),
+            await self._async_get_description_dict(
+                location, ssdp_device.combined_headers(dst)
+            ),
         )
 
     def _ssdp_listener_process_callback(
@@ -564,18 +558,21 @@ class Scanner:
             self.hass.config_entries.flow.async_abort(flow["flow_id"])
 
     async def _async_get_description_dict(
-        self, location: str | None
+        self, location: str | None, headers: CaseInsensitiveDict
     ) -> Mapping[str, str]:
         """Get description dict."""
         assert self._description_cache is not None
 
         has_description, description = self._description_cache.peek_description_dict(
-            location
+            location, headers
         )
         if has_description:
             return description or {}
 
-        return await self._description_cache.async_get_description_dict(location) or {}
+        return (
+            await self._description_cache.async_get_description_dict(location, headers)
+            or {}
+        )
 
     async def _async_headers_to_discovery_info(
         self, ssdp_device: SsdpDevice, headers: CaseInsensitiveDict
@@ -587,7 +584,7 @@ class Scanner:
         assert self._description_cache is not None
 
         location = headers["location"]
-        info_desc = await self._async_get_description_dict(location)
+        info_desc = await self._async_get_description_dict(location, headers)
         return discovery_info_from_headers_and_description(
             ssdp_device, headers, info_desc
         )
@@ -0,0 +1,206 @@
+"""Cache of the UPnP descriptions of the discovered devices."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
+from http import HTTPStatus
+import logging
+import time
+from typing import Any
+
+import aiohttp
+from async_upnp_client.client import UpnpRequester
+from async_upnp_client.const import HttpRequest
+from async_upnp_client.exceptions import UpnpError
+from async_upnp_client.ssdp_listener import extract_uncache_after
+from async_upnp_client.utils import etree_to_dict
+import defusedxml.ElementTree as DET
+
+_LOGGER = logging.getLogger(__name__)
+
+# The maximum number of descriptions which are downloaded at the same time
+MAX_CONCURRENT_FETCHES = 8
+
+HEADER_BOOTID = "BOOTID.UPNP.ORG"
+HEADER_CONFIGID = "CONFIGID.UPNP.ORG"
+HEADER_CACHE_CONTROL = "CACHE-CONTROL"
+
+type DescriptionType = Mapping[str, Any] | None
+
+
+@dataclass(slots=True)
+class _CachedDescription:
+    """A description with the announcement and response it was fetched for."""
+
+    boot_id: str | None
+    config_id: str | None
+    expires: float
+    description: DescriptionType
+    xml: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def _description_xml_to_dict(description_xml: str) -> DescriptionType:
+    """Convert description (XML) to dict."""
+    try:
+        tree = DET.fromstring(description_xml)
+    except DET.ParseError as err:
+        _LOGGER.debug("Error parsing %s: %s", description_xml, err)
+        return None
+
+    if (root := etree_to_dict(tree).get("root")) is None:
+        return None
+
+    return root.get("device")
+
+
+def _announcement_ids(
+    headers: Mapping[str, Any] | None,
+) -> tuple[str | None, str | None]:
+    """Return the boot and configuration id of an announcement."""
+    if headers is None:
+        return None, None
+    return headers.get(HEADER_BOOTID), headers.get(HEADER_CONFIGID)
+
+
+class DescriptionCache:
+    """Cache of the parsed descriptions of the devices by their location.
+
+    A description is cached for the BOOTID.UPNP.ORG and CONFIGID.UPNP.ORG
+    headers of the announcement it was fetched for, until the max-age of its
+    CACHE-CONTROL header. It is fetched again when the device announces a new
+    boot or configuration. An expired description is revalidated with a
+    conditional request, and an unchanged description is not parsed again.
+
+    The downloads share the keep-alive connections of the session of the
+    requester, and at most MAX_CONCURRENT_FETCHES run at the same time.
+    """
+
+    def __init__(self, requester: UpnpRequester) -> None:
+        """Initialize the cache."""
+        self._requester = requester
+        self._cache: dict[str, _CachedDescription] = {}
+        self._fetches: dict[str, asyncio.Event] = {}
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    def peek_description_dict(
+        self, location: str | None, headers: Mapping[str, Any] | None = None
+    ) -> tuple[bool, DescriptionType]:
+        """Peek a description as dict, only try the cache."""
+        if location is None:
+            return True, None
+
+        if (
+            (cached := self._cache.get(location)) is None
+            or cached.expires <= time.monotonic()
+            or (
+                headers is not None
+                and (cached.boot_id, cached.config_id) != _announcement_ids(headers)
+            )
+        ):
+            return False, None
+
+        return True, cached.description
+
+    async def async_get_description_dict(
+        self, location: str | None, headers: Mapping[str, Any] | None = None
+    ) -> DescriptionType:
+        """Get a description as dict, either from cache or download it."""
+        has_description, description = self.peek_description_dict(location, headers)
+        if has_description or location is None:
+            return description
+
+        if (fetch := self._fetches.get(location)) is not None:
+            await fetch.wait()
+            if (cached := self._cache.get(location)) is None:
+                return None
+            return cached.description
+
+        fetch = self._fetches[location] = asyncio.Event()
+        try:
+            cached = self._cache[location] = await self._async_fetch(location, headers)
+        finally:
+            del self._fetches[location]
+            fetch.set()
+
+        return cached.description
+
+    async def _async_fetch(
+        self, location: str, headers: Mapping[str, Any] | None
+    ) -> _CachedDescription:
+        """Download and parse a description, or revalidate the cached one."""
+        boot_id, config_id = _announcement_ids(headers)
+        cache_control = "" if headers is None else headers.get(HEADER_CACHE_CONTROL)
+        expires = (
+            time.monotonic()
+            + extract_uncache_after(cache_control or "").total_seconds()
+        )
+
+        request_headers: dict[str, str] = {}
+        if (cached := self._cache.get(location)) is not None and (
+            cached.boot_id,
+            cached.config_id,
+        ) == (boot_id, config_id):
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+        else:
+            cached = None
+
+        try:
+            async with self._semaphore:
+                response = await self._requester.async_http_request(
+                    HttpRequest("GET", location, request_headers, None)
+                )
+        except (UpnpError, aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.debug("Error fetching %s: %s", location, err)
+            return self._failed_fetch(cached, boot_id, config_id, expires)
+        except Exception:
+            # If it fails, cache the failure so we do not keep trying over and over
+            _LOGGER.exception("Failed to fetch description from: %s", location)
+            return self._failed_fetch(cached, boot_id, config_id, expires)
+
+        if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            cached.expires = expires
+            return cached
+
+        if response.status_code != HTTPStatus.OK or not response.body:
+            _LOGGER.debug(
+                "Error fetching %s: status %s", location, response.status_code
+            )
+            return self._failed_fetch(cached, boot_id, config_id, expires)
+
+        if cached is not None and cached.xml == response.body:
+            description = cached.description
+        else:
+            description = _description_xml_to_dict(response.body)
+        return _CachedDescription(
+            boot_id,
+            config_id,
+            expires,
+            description,
+            response.body,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+
+    @staticmethod
+    def _failed_fetch(
+        cached: _CachedDescription | None,
+        boot_id: str | None,
+        config_id: str | None,
+        expires: float,
+    ) -> _CachedDescription:
+        """Return the cache entry after a description could not be fetched.
+
+        The device did not boot again or change its configuration since the
+        cached description was fetched, so it is kept until it is revalidated.
+        """
+        if cached is None:
+            return _CachedDescription(boot_id, config_id, expires, None)
+        cached.expires = expires
+        return cached
@@ -0,0 +1,397 @@
+"""Rolling aggregates for the statistics sensor.
+
+The aggregates are updated incrementally when a sample enters or leaves
+the buffer of the sensor, so computing a characteristic does not need to
+scan the whole buffer.
+"""
+
+from __future__ import annotations
+
+import abc
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+
+class RollingAggregate(abc.ABC):
+    """Base class of an aggregate over the samples in the buffer.
+
+    add() must be called right before a sample is appended to the buffer
+    and remove() right before the oldest sample is removed from it.
+
+    Aggregates which accumulate floating point values drift a little on
+    every removal, so they are rebuilt from the buffer once as many
+    samples have been removed as the buffer holds, which keeps the
+    amortized cost of an update constant.
+    """
+
+    __slots__ = ("_removals",)
+
+    _rebuild_on_drift = True
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        self._removals = 0
+
+    def add(
+        self,
+        states: deque[float | bool],
+        ages: deque[datetime],
+        value: float,
+        age: datetime,
+    ) -> None:
+        """Update the aggregate for a sample about to be appended."""
+        if self._rebuild_on_drift and self._removals > len(states):
+            self.rebuild(states, ages)
+        if states:
+            self._add(value, age, states[-1], ages[-1])
+        else:
+            self._add(value, age, None, None)
+
+    def remove(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Update the aggregate for the oldest sample about to be removed."""
+        self._removals += 1
+        if len(states) == 1:
+            self._reset()
+            return
+        self._remove(states[0], ages[0], states[1], ages[1])
+
+    def rebuild(self, states: deque[float | bool], ages: deque[datetime]) -> None:
+        """Compute the aggregate from scratch."""
+        self._reset()
+        previous_value: float | None = None
+        previous_age: datetime | None = None
+        for value, age in zip(states, ages, strict=True):
+            self._add(value, age, previous_value, previous_age)
+            previous_value = value
+            previous_age = age
+
+    def _reset(self) -> None:
+        """Reset the aggregate to an empty buffer."""
+        self._removals = 0
+
+    @abc.abstractmethod
+    def _add(
+        self,
+        value: float,
+        age: datetime,
+        previous_value: float | None,
+        previous_age: datetime | None,
+    ) -> None:
+        """Add a sample following the previous newest sample."""
+
+    @abc.abstractmethod
+    def _remove(
+        self, value: float, age: datetime, next_value: float, next_age: datetime
+    ) -> None:
+        """Remove the oldest sample, which is followed by the next sample."""
+
+
+class RollingSum(RollingAggregate):
+    """Running sum of the samples, also counts the on samples of a binary sensor."""
+
+    __slots__ = ("total",)
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self.total: float = 0
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.total = 0
+
+    def _add(
+        self,
+        value: float,
+        age: datetime,
+        previous_value: float | None,
+        previous_age: datetime | None,
+    ) -> None:
+        self.total += value
+
+    def _remove(
+        self, value: float, age: datetime, next_value: float, next_age: datetime
+    ) -> None:
+        self.total -= value
+
+
+class RollingMoments(RollingAggregate):
+    """Mean and variance of the samples using Welford's algorithm."""
+
+    __slots__ = ("_count", "_m2", "mean")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._count = 0
+        self._m2: float = 0
+        self.mean: float = 0
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return max(self._m2, 0) / (self._count - 1)
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._count = 0
+        self._m2 = 0
+        self.mean = 0
+
+    def _add(
+        self,
+        value: float,
+        age: datetime,
+        previous_value: float | None,
+        previous_age: datetime | None,
+    ) -> None:
+        self._count += 1
+        delta = value - self.mean
+        self.mean += delta / self._count
+        self._m2 += delta * (value - self.mean)
+
+    def _remove(
+        self, value: float, age: datetime, next_value: float, next_age: datetime
+    ) -> None:
+        self._count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self._count
+        self._m2 -= delta * (value - self.mean)
+
+
+class RollingExtremes(RollingAggregate):
+    """Minimum and maximum of the samples using monotonic queues.
+
+    Each queue holds the samples which can still become the extreme once
+    the samples before them have been removed, in order of insertion. Of
+    samples with the same value the oldest one is the extreme, to match
+    max() and min() on the buffer.
+    """
+
+    __slots__ = ("_added", "_max", "_min", "_removed")
+
+    _rebuild_on_drift = False
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._added = 0
+        self._removed = 0
+        self._max: deque[tuple[float, datetime, int]] = deque()
+        self._min: deque[tuple[float, datetime, int]] = deque()
+
+    @property
+    def max(self) -> tuple[float, datetime]:
+        """Return the maximum value and its age."""
+        value, age, _ = self._max[0]
+        return value, age
+
+    @property
+    def min(self) -> tuple[float, datetime]:
+        """Return the minimum value and its age."""
+        value, age, _ = self._min[0]
+        return value, age
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._added = 0
+        self._removed = 0
+        self._max.clear()
+        self._min.clear()
+
+    def _add(
+        self,
+        value: float,
+        age: datetime,
+        previous_value: float | None,
+        previous_age: datetime | None,
+    ) -> None:
+        sample = (value, age, self._added)
+        self._added += 1
+        while self._max and self._max[-1][0] < value:
+            self._max.pop()
+        self._max.append(sample)
+        while self._min and self._min[-1][0] > value:
+            self._min.pop()
+        self._min.append(sample)
+
+    def _remove(
+        self, value: float, age: datetime, next_value: float, next_age: datetime
+    ) -> None:
+        if self._max[0][2] == self._removed:
+            self._max.popleft()
+        if self._min[0][2] == self._removed:
+            self._min.popleft()
+        self._removed += 1
+
+
+class RollingOrderStatistics(RollingAggregate):
+    """Sorted copy of the samples to look up the median and percentiles."""
+
+    __slots__ = ("_sorted",)
+
+    _rebuild_on_drift = False
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self._sorted: list[float] = []
+
+    @property
+    def median(self) -> float:
+        """Return the median like statistics.median."""
+        data = self._sorted
+        n = len(data)
+        i = n // 2
+        if n % 2 == 1:
+            return data[i]
+        return (data[i - 1] + data[i]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile like statistics.quantiles with the exclusive method.
+
+        Requires at least two samples.
+        """
+        data = self._sorted
+        ld = len(data)
+        m = ld + 1
+        j = percentile * m // 100
+        j = max(1, min(j, ld - 1))
+        delta = percentile * m - j * 100
+        return (data[j - 1] * (100 - delta) + data[j] * delta) / 100
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._sorted.clear()
+
+    def _add(
+        self,
+        value: float,
+        age: datetime,
+        previous_value: float | None,
+        previous_age: datetime | None,
+    ) -> None:
+        insort(self._sorted, value)
+
+    def _remove(
+        self, value: float, age: datetime, next_value: float, next_age: datetime
+    ) -> None:
+        del self._sorted[bisect_left(self._sorted, value)]
+
+
+class RollingDifferences(RollingAggregate):
+    """Sums of the differences between consecutive samples."""
+
+    __slots__ = ("sum_differences", "sum_differences_nonnegative")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self.sum_differences: float = 0
+        self.sum_differences_nonnegative: float = 0
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.sum_differences = 0
+        self.sum_differences_nonnegative = 0
+
+    def _add(
+        self,
+        value: float,
+        age: datetime,
+        previous_value: float | None,
+        previous_age: datetime | None,
+    ) -> None:
+        if previous_value is None:
+            return
+        self.sum_differences += abs(value - previous_value)
+        self.sum_differences_nonnegative += (
+            value - previous_value if value >= previous_value else value
+        )
+
+    def _remove(
+        self, value: float, age: datetime, next_value: float, next_age: datetime
+    ) -> None:
+        self.sum_differences -= abs(next_value - value)
+        self.sum_differences_nonnegative -= (
+            next_value - value if next_value >= value else next_value
+        )
+
+
+class RollingTimeWeightedArea(RollingAggregate):
+    """Areas below the step and the linear interpolation of the samples."""
+
+    __slots__ = ("linear_area", "step_area")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self.linear_area: float = 0
+        self.step_area: float = 0
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.linear_area = 0
+        self.step_area = 0
+
+    def _add(
+        self,
+        value: float,
+        age: datetime,
+        previous_value: float | None,
+        previous_age: datetime | None,
+    ) -> None:
+        if previous_value is None or previous_age is None:
+            return
+        seconds = (age - previous_age).total_seconds()
+        self.linear_area += 0.5 * (value + previous_value) * seconds
+        self.step_area += previous_value * seconds
+
+    def _remove(
+        self, value: float, age: datetime, next_value: float, next_age: datetime
+    ) -> None:
+        seconds = (next_age - age).total_seconds()
+        self.linear_area -= 0.5 * (next_value + value) * seconds
+        self.step_area -= value * seconds
+
+
+class RollingCircularMean(RollingAggregate):
+    """Sums of the sines and cosines of the samples in degrees."""
+
+    __slots__ = ("cos_sum", "sin_sum")
+
+    def __init__(self) -> None:
+        """Initialize the aggregate."""
+        super().__init__()
+        self.cos_sum: float = 0
+        self.sin_sum: float = 0
+
+    @property
+    def mean(self) -> float:
+        """Return the circular mean in degrees."""
+        return (math.degrees(math.atan2(self.sin_sum, self.cos_sum)) + 360) % 360
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.cos_sum = 0
+        self.sin_sum = 0
+
+    def _add(
+        self,
+        value: float,
+        age: datetime,
+        previous_value: float | None,
+        previous_age: datetime | None,
+    ) -> None:
+        radians = math.radians(value)
+        self.sin_sum += math.sin(radians)
+        self.cos_sum += math.cos(radians)
+
+    def _remove(
+        self, value: float, age: datetime, next_value: float, next_age: datetime
+    ) -> None:
+        radians = math.radians(value)
+        self.sin_sum -= math.sin(radians)
+        self.cos_sum -= math.cos(radians)
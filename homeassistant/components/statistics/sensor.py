@@ -8,7 +8,6 @@ import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -56,6 +55,16 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import DOMAIN, PLATFORMS
+from .aggregates import (
+    RollingAggregate,
+    RollingCircularMean,
+    RollingDifferences,
+    RollingExtremes,
+    RollingMoments,
+    RollingOrderStatistics,
+    RollingSum,
+    RollingTimeWeightedArea,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -182,6 +191,39 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Rolling aggregates maintained for a characteristic
+STATS_NUMERIC_AGGREGATES: dict[str, type[RollingAggregate]] = {
+    STAT_AVERAGE_LINEAR: RollingTimeWeightedArea,
+    STAT_AVERAGE_STEP: RollingTimeWeightedArea,
+    STAT_AVERAGE_TIMELESS: RollingMoments,
+    STAT_DATETIME_VALUE_MAX: RollingExtremes,
+    STAT_DATETIME_VALUE_MIN: RollingExtremes,
+    STAT_DISTANCE_95P: RollingMoments,
+    STAT_DISTANCE_99P: RollingMoments,
+    STAT_DISTANCE_ABSOLUTE: RollingExtremes,
+    STAT_MEAN: RollingMoments,
+    STAT_MEAN_CIRCULAR: RollingCircularMean,
+    STAT_MEDIAN: RollingOrderStatistics,
+    STAT_NOISINESS: RollingDifferences,
+    STAT_PERCENTILE: RollingOrderStatistics,
+    STAT_STANDARD_DEVIATION: RollingMoments,
+    STAT_SUM: RollingSum,
+    STAT_SUM_DIFFERENCES: RollingDifferences,
+    STAT_SUM_DIFFERENCES_NONNEGATIVE: RollingDifferences,
+    STAT_TOTAL: RollingSum,
+    STAT_VALUE_MAX: RollingExtremes,
+    STAT_VALUE_MIN: RollingExtremes,
+    STAT_VARIANCE: RollingMoments,
+}
+
+STATS_BINARY_AGGREGATES: dict[str, type[RollingAggregate]] = {
+    STAT_AVERAGE_STEP: RollingTimeWeightedArea,
+    STAT_AVERAGE_TIMELESS: RollingSum,
+    STAT_COUNT_BINARY_ON: RollingSum,
+    STAT_COUNT_BINARY_OFF: RollingSum,
+    STAT_MEAN: RollingSum,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -366,6 +408,13 @@ class StatisticsSensor(SensorEntity):
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
         self.attributes: dict[str, StateType] = {}
 
+        aggregate_type = (
+            STATS_BINARY_AGGREGATES if self.is_binary else STATS_NUMERIC_AGGREGATES
+        ).get(self._state_characteristic)
+        self._aggregate: RollingAggregate | None = (
+            aggregate_type() if aggregate_type else None
+        )
+
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
             self._callable_characteristic_fn(self._state_characteristic)
         )
@@ -417,10 +466,9 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                self._append_sample(new_state.state == "on", new_state.last_updated)
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                self._append_sample(float(new_state.state), new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -433,6 +481,22 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _append_sample(self, value: float | bool, age: datetime) -> None:
+        """Append a sample to the buffer, dropping the oldest one if it is full."""
+        if len(self.states) == self.states.maxlen:
+            self._remove_oldest_sample()
+        if self._aggregate is not None:
+            self._aggregate.add(self.states, self.ages, value, age)
+        self.states.append(value)
+        self.ages.append(age)
+
+    def _remove_oldest_sample(self) -> None:
+        """Remove the oldest sample from the buffer."""
+        if self._aggregate is not None:
+            self._aggregate.remove(self.states, self.ages)
+        self.ages.popleft()
+        self.states.popleft()
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -544,8 +608,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._remove_oldest_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -699,25 +762,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = cast(RollingTimeWeightedArea, self._aggregate).linear_area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
+            area = cast(RollingTimeWeightedArea, self._aggregate).step_area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return area / age_range_seconds
         return None
@@ -757,12 +809,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return cast(RollingExtremes, self._aggregate).max[1]
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return cast(RollingExtremes, self._aggregate).min[1]
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -777,24 +829,23 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            extremes = cast(RollingExtremes, self._aggregate)
+            return extremes.max[0] - extremes.min[0]
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return cast(RollingMoments, self._aggregate).mean
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
-            return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+            return cast(RollingCircularMean, self._aggregate).mean
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            return cast(RollingOrderStatistics, self._aggregate).median
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -804,34 +855,29 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            return cast(RollingOrderStatistics, self._aggregate).percentile(
+                self._percentile
+            )
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(cast(RollingMoments, self._aggregate).variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return cast(RollingSum, self._aggregate).total
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                abs(j - i)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return cast(RollingDifferences, self._aggregate).sum_differences
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            return sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:], strict=False)
-            )
+            return cast(RollingDifferences, self._aggregate).sum_differences_nonnegative
         return None
 
     def _stat_total(self) -> StateType:
@@ -839,27 +885,24 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return cast(RollingExtremes, self._aggregate).max[0]
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return cast(RollingExtremes, self._aggregate).min[0]
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return cast(RollingMoments, self._aggregate).variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            on_seconds = cast(RollingTimeWeightedArea, self._aggregate).step_area
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -871,10 +914,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return int(cast(RollingSum, self._aggregate).total)
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - int(cast(RollingSum, self._aggregate).total)
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -884,5 +927,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * cast(RollingSum, self._aggregate).total
         return None
@@ -12,6 +12,7 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
+from lru import LRU
 import numpy as np
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
@@ -22,12 +23,13 @@ from homeassistant.util.decorator import Registry
 from .const import (
     ATTR_STREAMS,
     DOMAIN,
+    MAX_KEYFRAME_IMAGES,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -77,8 +79,8 @@ class Part:
 
     duration: float
     has_keyframe: bool
-    # video data (moof+mdat)
-    data: bytes
+    # video data (moof+mdat), a view into the segment buffer once it is complete
+    data: bytes | memoryview
 
 
 @dataclass(slots=True)
@@ -102,6 +104,8 @@ class Segment:
     hls_num_parts_rendered: int = 0
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = False
+    # The init and the data of all parts once the segment is complete
+    _buffer: bytes | None = None
 
     def __post_init__(self) -> None:
         """Run after init."""
@@ -128,20 +132,59 @@ class Segment:
         self,
         part: Part,
         duration: float,
+        buffer: bytes | None = None,
     ) -> None:
         """Add a part to the Segment.
 
-        Duration is non zero only for the last part.
+        Duration is non zero only for the last part. The last part also
+        passes the buffer holding the init and the data of all parts. The
+        data of the parts is replaced with views into the buffer, so the
+        copies made for the earlier parts can be freed and the consumers
+        share the buffer instead of joining the parts.
         """
         self.parts.append(part)
+        if buffer is not None:
+            self._async_share_buffer(buffer)
         self.duration = duration
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+    @callback
+    def _async_share_buffer(self, buffer: bytes) -> None:
+        """Replace the data of the parts with views into the segment buffer."""
+        view = memoryview(buffer)
+        # The parts are written back to back up to the end of the buffer
+        offset = len(buffer) - self.data_size
+        for part in self.parts:
+            end = offset + len(part.data)
+            part.data = view[offset:end]
+            offset = end
+        self._buffer = buffer
+
+    def get_data(self) -> bytes | memoryview:
+        """Return reconstructed data for all parts, without init.
+
+        A view into the segment buffer is returned once the segment is complete.
+        """
+        if (buffer := self._buffer) is not None:
+            return memoryview(buffer)[len(buffer) - self.data_size :]
         return b"".join([part.data for part in self.parts])
 
+    def get_data_with_init(self) -> bytes:
+        """Return the init and the data of all parts.
+
+        The segment buffer is returned without a copy once the segment is complete.
+        """
+        if self._buffer is not None:
+            return self._buffer
+        return b"".join([self.init, *(part.data for part in self.parts)])
+
+    def get_data_chunks(self) -> list[bytes | memoryview]:
+        """Return the data of all parts, without init, as chunks to write."""
+        if self._buffer is not None:
+            return [self.get_data()]
+        return [part.data for part in self.parts]
+
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
         """Render the HLS playlist section for the Segment.
 
@@ -423,10 +466,16 @@ class KeyFrameConverter:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
         get_image schedules _generate_image in an executor thread
-        _generate_image will try to create an image from the packet
+        _generate_image will try to decode a frame from the packet
         _generate_image will clear the packet, so there will only be one attempt per packet
+        _generate_image encodes the frame at the requested size
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+
+    The images of the last decoded frame are cached by their size until the
+    next keyframe is decoded, so the frame is only encoded once per size.
+    Only the MAX_KEYFRAME_IMAGES most recently requested sizes are kept.
+    Concurrent requests wait for the image being generated under the lock.
     """
 
     def __init__(
@@ -446,6 +495,8 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        self._images: LRU[tuple[int, int] | None, bytes] = LRU(MAX_KEYFRAME_IMAGES)
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
@@ -484,7 +535,7 @@ class KeyFrameConverter:
         """Transform image to a given orientation."""
         return TRANSFORM_IMAGE_FUNCTION[orientation](image)
 
-    def _generate_image(self, width: int | None, height: int | None) -> None:
+    def _generate_image(self, size: tuple[int, int] | None) -> bytes | None:
         """Generate the keyframe image.
 
         This is run in an executor thread, but since it is called within an
@@ -492,8 +543,30 @@ class KeyFrameConverter:
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
-            return
+        if not self._turbojpeg:
+            return None
+        if self._packet and self._codec_context:
+            self._decode_keyframe()
+        if self._frame is None:
+            return None
+        if (image := self._images.get(size)) is None:
+            frame = self._frame
+            if size:
+                width, height = size
+                if self._dynamic_stream_settings.orientation >= 5:
+                    frame = frame.reformat(width=height, height=width)
+                else:
+                    frame = frame.reformat(width=width, height=height)
+            bgr_array = self.transform_image(
+                frame.to_ndarray(format="bgr24"),
+                self._dynamic_stream_settings.orientation,
+            )
+            image = self._images[size] = bytes(self._turbojpeg.encode(bgr_array))
+        return image
+
+    def _decode_keyframe(self) -> None:
+        """Decode the stashed keyframe packet and invalidate the cached images."""
+        assert self._codec_context
         packet = self._packet
         self._packet = None
         for _ in range(2):  # Retry once if codec context needs to be flushed
@@ -513,17 +586,8 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            self._frame = frames[0]
+            self._images.clear()
 
     async def async_get_image(
         self,
@@ -533,10 +597,17 @@ class KeyFrameConverter:
     ) -> bytes | None:
         """Fetch an image from the Stream and return it as a jpeg in bytes."""
 
-        # Use a lock to ensure only one thread is working on the keyframe at a time
+        size = (width, height) if width and height else None
         if wait_for_next_keyframe:
             self._event.clear()
             await self._event.wait()
+        elif self._packet is None and (image := self._images.get(size)):
+            # The last keyframe was already encoded at this size
+            return image
+        # Use a lock to ensure only one thread is working on the keyframe at a time
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            if image := await self._hass.async_add_executor_job(
+                self._generate_image, size
+            ):
+                self._image = image
         return self._image
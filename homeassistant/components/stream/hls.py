@@ -425,9 +425,17 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
+        # The parts are written one by one instead of being joined, the
+        # transport gathers them when they can not be sent right away.
+        chunks = segment.get_data_chunks()
+        response = web.StreamResponse(
             headers={
                 "Content-Type": "video/iso.segment",
             },
         )
+        response.content_length = sum(len(chunk) for chunk in chunks)
+        await response.prepare(request)
+        for chunk in chunks:
+            await response.write(chunk)
+        await response.write_eof()
+        return response
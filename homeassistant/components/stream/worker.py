@@ -356,7 +356,16 @@ class StreamMuxer:
         if not self._stream_settings.ll_hls:
             adjusted_dts = packet.dts
         assert self._segment
-        self._memory_file.seek(self._memory_file_pos)
+        buffer: bytes | None = None
+        data: bytes | memoryview
+        if last_part:
+            # The buffer of the memory_file is shared instead of copied, as
+            # nothing is written to the memory_file anymore.
+            buffer = self._memory_file.getvalue()
+            data = memoryview(buffer)[self._memory_file_pos :]
+        else:
+            self._memory_file.seek(self._memory_file_pos)
+            data = self._memory_file.read()
         self._hass.loop.call_soon_threadsafe(
             self._segment.async_add_part,
             Part(
@@ -364,7 +373,7 @@ class StreamMuxer:
                     (adjusted_dts - self._part_start_dts) * packet.time_base
                 ),
                 has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.read(),
+                data=data,
             ),
             (
                 segment_duration := float(
@@ -373,6 +382,7 @@ class StreamMuxer:
             )
             if last_part
             else 0,
+            buffer,
         )
         if last_part:
             # If we've written the last part, we can close the memory_file.
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
+from dataclasses import dataclass, field
 import logging
 from typing import Any
 
@@ -12,7 +14,6 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
@@ -21,9 +22,11 @@ from . import websocket_api
 from .const import (
     CONF_STORED_TRACES,
     DATA_TRACE,
+    DATA_TRACE_MEMORY,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
     DEFAULT_STORED_TRACES,
+    MEMORY_BUDGET,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -43,18 +46,36 @@ CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 type TraceData = dict[str, LimitedSizeDict[str, BaseTrace]]
 
 
+@dataclass(slots=True)
+class TraceMemory:
+    """Memory used by the stored traces.
+
+    The sizes of the stopped traces are kept in the order they stopped, the
+    running traces are accounted when they stop.
+    """
+
+    budget: int
+    size: int = 0
+    sizes: OrderedDict[tuple[str, str], int] = field(default_factory=OrderedDict)
+
+
 @callback
 def _get_data(hass: HomeAssistant) -> TraceData:
     return hass.data[DATA_TRACE]  # type: ignore[no-any-return]
 
 
+@callback
+def _get_memory(hass: HomeAssistant) -> TraceMemory:
+    return hass.data[DATA_TRACE_MEMORY]  # type: ignore[no-any-return]
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_MEMORY] = TraceMemory(MEMORY_BUDGET)
     websocket_api.async_setup(hass)
-    store = Store[dict[str, list]](
-        hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
-    )
+    # The traces are saved as JSON fragments made from their compressed JSON
+    store = Store[dict[str, list]](hass, STORAGE_VERSION, STORAGE_KEY)
     hass.data[DATA_TRACE_STORE] = store
 
     async def _async_store_traces_at_stop(_: Event) -> None:
@@ -112,10 +133,20 @@ async def async_list_contexts(
 def _get_debug_traces(hass: HomeAssistant, key: str) -> list[dict[str, Any]]:
     """Return a serializable list of debug traces for a script or automation."""
     if traces_for_key := _get_data(hass).get(key):
-        return [trace.as_short_dict() for trace in traces_for_key.values()]
+        return [
+            {**trace.as_short_dict(), "size": trace.size}
+            for trace in traces_for_key.values()
+        ]
     return []
 
 
+@callback
+def async_get_memory_usage(hass: HomeAssistant) -> dict[str, int]:
+    """Return the memory used by the stopped traces and the memory budget."""
+    memory = _get_memory(hass)
+    return {"size": memory.size, "budget": memory.budget}
+
+
 async def async_list_traces(
     hass: HomeAssistant, wanted_domain: str, wanted_key: str | None
 ) -> list[dict[str, Any]]:
@@ -145,7 +176,47 @@ def async_store_trace(
             traces[key] = LimitedSizeDict(size_limit=stored_traces)
         else:
             traces[key].size_limit = stored_traces
-        traces[key][trace.run_id] = trace
+        traces_for_key = traces[key]
+        while traces_for_key and len(traces_for_key) >= stored_traces:
+            run_id, _ = traces_for_key.popitem(last=False)
+            _async_forget_trace(hass, key, run_id)
+        traces_for_key[trace.run_id] = trace
+
+
+@callback
+def async_finish_trace(hass: HomeAssistant, trace: ActionTrace) -> None:
+    """Finish a trace and account its size in the memory budget."""
+    trace.finished()
+    if (
+        (traces_for_key := _get_data(hass).get(trace.key)) is None
+        or traces_for_key.get(trace.run_id) is not trace
+        or (size := trace.size) is None
+    ):
+        return
+    memory = _get_memory(hass)
+    memory.sizes[(trace.key, trace.run_id)] = size
+    memory.size += size
+    _async_enforce_memory_budget(hass)
+
+
+@callback
+def _async_forget_trace(hass: HomeAssistant, key: str, run_id: str) -> None:
+    """Remove a trace which is no longer stored from the memory accounting."""
+    memory = _get_memory(hass)
+    if (size := memory.sizes.pop((key, run_id), None)) is not None:
+        memory.size -= size
+
+
+@callback
+def _async_enforce_memory_budget(hass: HomeAssistant) -> None:
+    """Remove the oldest stopped traces until the traces fit the memory budget."""
+    memory = _get_memory(hass)
+    traces = _get_data(hass)
+    while memory.size > memory.budget and memory.sizes:
+        (key, run_id), size = memory.sizes.popitem(last=False)
+        memory.size -= size
+        if (traces_for_key := traces.get(key)) is not None:
+            traces_for_key.pop(run_id, None)
 
 
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
@@ -156,6 +227,11 @@ def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> No
         traces[key] = LimitedSizeDict()
     traces[key][trace.run_id] = trace
     traces[key].move_to_end(trace.run_id, last=False)
+    # Restored traces are older than the traces of this run
+    memory = _get_memory(hass)
+    memory.sizes[(key, trace.run_id)] = trace.size
+    memory.sizes.move_to_end((key, trace.run_id), last=False)
+    memory.size += trace.size
 
 
 async def async_restore_traces(hass: HomeAssistant) -> None:
@@ -189,3 +265,5 @@ async def async_restore_traces(hass: HomeAssistant) -> None:
                 _LOGGER.exception("Failed to restore trace")
                 continue
             _async_store_restored_trace(hass, trace)
+
+    _async_enforce_memory_budget(hass)
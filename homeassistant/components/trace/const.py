@@ -2,6 +2,8 @@
 
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_MEMORY = "trace_memory"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+MEMORY_BUDGET = 32 * 1024 * 1024  # Bytes of compressed traces kept in memory
@@ -5,9 +5,15 @@ from __future__ import annotations
 import abc
 from collections import deque
 import datetime as dt
-from typing import Any
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any
+import zlib
+
+import orjson
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import json_encoder_default, json_fragment
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -16,15 +22,55 @@ from homeassistant.helpers.trace import (
     trace_set_child_id,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 import homeassistant.util.uuid as uuid_util
 
+_LOGGER = logging.getLogger(__name__)
+
+
+def _trace_json_encoder_default(obj: Any) -> Any:
+    """Convert objects like the ExtendedJSONEncoder.
+
+    Fall back to repr(obj).
+    """
+    if isinstance(obj, dt.timedelta):
+        return {"__type": str(type(obj)), "total_seconds": obj.total_seconds()}
+    if isinstance(obj, dt.datetime):
+        return obj.isoformat()
+    if isinstance(obj, (dt.date, dt.time)):
+        return {"__type": str(type(obj)), "isoformat": obj.isoformat()}
+    try:
+        return json_encoder_default(obj)
+    except TypeError:
+        return {"__type": str(type(obj)), "repr": repr(obj)}
+
+
+if TYPE_CHECKING:
+
+    def _trace_json_bytes(obj: Any) -> bytes:
+        """Dump a trace as json bytes."""
+
+else:
+    _trace_json_bytes = partial(
+        orjson.dumps,
+        option=orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME,
+        default=_trace_json_encoder_default,
+    )
+
 
 class BaseTrace(abc.ABC):
-    """Base container for a script or automation trace."""
+    """Base container for a script or automation trace.
+
+    Once a trace has stopped, its extended dictionary is kept as compressed
+    JSON instead of the trace elements and variables it was made from.
+    """
 
     context: Context
     key: str
     run_id: str
+    _compressed: bytes | None = None
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
@@ -33,6 +79,38 @@ class BaseTrace(abc.ABC):
             "short_dict": self.as_short_dict(),
         }
 
+    @property
+    def json_fragment(self) -> json_fragment:
+        """Return the trace for saving as a JSON fragment."""
+        if self._compressed is None:
+            return json_fragment(_trace_json_bytes(self.as_dict()))
+        return json_fragment(
+            b'{"extended_dict":'
+            + zlib.decompress(self._compressed)
+            + b',"short_dict":'
+            + _trace_json_bytes(self.as_short_dict())
+            + b"}"
+        )
+
+    @property
+    @abc.abstractmethod
+    def size(self) -> int | None:
+        """Return the size of the compressed trace, None while it is running."""
+
+    def _compress(self, extended_dict: dict[str, Any]) -> bool:
+        """Compress the extended dictionary of a stopped trace."""
+        try:
+            self._compressed = zlib.compress(_trace_json_bytes(extended_dict))
+        except orjson.JSONEncodeError as err:
+            _LOGGER.debug("Failed to compress trace %s: %s", self.key, err)
+            return False
+        return True
+
+    def _decompress(self) -> dict[str, Any]:
+        """Return the extended dictionary of a compressed trace."""
+        assert self._compressed is not None
+        return json_loads(zlib.decompress(self._compressed))  # type: ignore[return-value]
+
     @abc.abstractmethod
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
@@ -81,13 +159,28 @@ class ActionTrace(BaseTrace):
         self._error = ex
 
     def finished(self) -> None:
-        """Set finish time."""
+        """Set finish time and compress the trace."""
         self._timestamp_finish = dt_util.utcnow()
         self._state = "stopped"
         self._script_execution = script_execution_get()
+        if self._compress(self.as_extended_dict()):
+            # The short dictionary was saved by as_extended_dict
+            self._trace = None
+            self._config = None
+            self._blueprint_inputs = None
+            self._dict = None
+
+    @property
+    def size(self) -> int | None:
+        """Return the size of the compressed trace, None while it is running."""
+        if self._state != "stopped":
+            return None
+        return 0 if self._compressed is None else len(self._compressed)
 
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
+        if self._compressed is not None:
+            return self._decompress()
         if self._dict:
             return self._dict
 
@@ -159,12 +252,21 @@ class RestoredTrace(BaseTrace):
         self.context = context
         self.key = f"{extended_dict['domain']}.{extended_dict['item_id']}"
         self.run_id = extended_dict["run_id"]
-        self._dict = extended_dict
+        self._dict: dict[str, Any] | None = None
+        if not self._compress(extended_dict):
+            self._dict = extended_dict
         self._short_dict = short_dict
 
+    @property
+    def size(self) -> int:
+        """Return the size of the compressed trace."""
+        return 0 if self._compressed is None else len(self._compressed)
+
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this RestoredTrace."""
-        return self._dict  # type: ignore[no-any-return]
+        if self._compressed is not None:
+            return self._decompress()
+        return self._dict  # type: ignore[return-value]
 
     def as_short_dict(self) -> dict[str, Any]:
         """Return a brief dictionary version of this RestoredTrace."""
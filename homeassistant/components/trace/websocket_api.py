@@ -86,6 +86,7 @@ async def websocket_trace_get(
         vol.Required("type"): "trace/list",
         vol.Required("domain", "id"): vol.In(TRACE_DOMAINS),
         vol.Optional("item_id", "id"): str,
+        vol.Optional("memory", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -100,6 +101,11 @@ async def websocket_trace_list(
 
     traces = await trace.async_list_traces(hass, wanted_domain, key)
 
+    if msg["memory"]:
+        connection.send_result(
+            msg["id"], {"traces": traces, "memory": trace.async_get_memory_usage(hass)}
+        )
+        return
     connection.send_result(msg["id"], traces)
 
 
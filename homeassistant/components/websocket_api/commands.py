@@ -51,6 +51,7 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import (
     IntegrationNotFound,
+    async_get_import_profile,
     async_get_integration,
     async_get_integration_descriptions,
     async_get_integrations,
@@ -82,6 +83,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_import_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -387,6 +389,37 @@ def _forward_entity_changes(
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
+@callback
+def _forward_entity_changes_batch(
+    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    entity_ids: set[str],
+    user: User,
+    message_id_as_bytes: bytes,
+    events: list[Event[EventStateChangedData]],
+) -> None:
+    """Forward a batch of entity state changed events to websocket."""
+    if entity_ids:
+        events = [event for event in events if event.data["entity_id"] in entity_ids]
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    if not user.is_admin and not permissions.access_all_entities(POLICY_READ):
+        events = [
+            event
+            for event in events
+            if permissions.check_entity(event.data["entity_id"], POLICY_READ)
+        ]
+    if not events:
+        return
+    entity_ids_in_batch = {event.data["entity_id"] for event in events}
+    if len(events) == 1 or len(entity_ids_in_batch) != len(events):
+        # Diffs of the same entity can't be merged into one message
+        for event in events:
+            send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+        return
+    send_message(messages.state_diff_batch_message(message_id_as_bytes, events))
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -404,7 +437,7 @@ def handle_subscribe_entities(
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
     message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen_batch(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
@@ -413,6 +446,13 @@ def handle_subscribe_entities(
             connection.user,
             message_id_as_bytes,
         ),
+        partial(
+            _forward_entity_changes_batch,
+            connection.send_message,
+            entity_ids,
+            connection.user,
+            message_id_as_bytes,
+        ),
     )
     connection.send_result(msg["id"])
 
@@ -547,6 +587,20 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration import info command."""
+    if (import_profile := async_get_import_profile(hass)) is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "Import profiling is not enabled"
+        )
+        return
+    connection.send_result(msg["id"], import_profile)
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
@@ -45,6 +46,7 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "_wait_sent",
     )
 
     def __init__(
@@ -54,6 +56,7 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_sent: Callable[[], asyncio.Future[None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
@@ -69,6 +72,7 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self._wait_sent = wait_sent
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -123,6 +127,19 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    @callback
+    def async_wait_sent(self) -> asyncio.Future[None]:
+        """Return a future which is done once the queued messages were sent.
+
+        This lets a command producing many messages wait for a slow client
+        instead of queueing all of them.
+        """
+        if self._wait_sent is not None:
+            return self._wait_sent()
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        future.set_result(None)
+        return future
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -82,6 +82,9 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_queued_message_count",
+        "_sent_message_count",
+        "_sent_waiters",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -105,6 +108,11 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Messages are counted as they are queued and sent, so a waiter
+        # is released once the messages queued before it were sent.
+        self._queued_message_count = 0
+        self._sent_message_count = 0
+        self._sent_waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -158,13 +166,16 @@ class WebSocketHandler:
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
+                    self._async_messages_sent(1)
                     continue
 
+                coalesced_count = len(message_queue)
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_bytes_text(coalesced_messages)
+                self._async_messages_sent(coalesced_count)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -174,6 +185,38 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            # Nothing is sent anymore, do not keep the waiters waiting
+            self._async_release_sent_waiters(self._queued_message_count)
+
+    @callback
+    def _async_messages_sent(self, count: int) -> None:
+        """Count the sent messages and release the waiters for them."""
+        self._sent_message_count += count
+        if self._sent_waiters:
+            self._async_release_sent_waiters(self._sent_message_count)
+
+    @callback
+    def _async_release_sent_waiters(self, sent_message_count: int) -> None:
+        """Release the waiters for the messages queued before they waited."""
+        sent_waiters = self._sent_waiters
+        while sent_waiters and sent_waiters[0][0] <= sent_message_count:
+            _, future = sent_waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+
+    @callback
+    def _async_wait_sent(self) -> asyncio.Future[None]:
+        """Return a future which is done once the queued messages were sent."""
+        future: asyncio.Future[None] = self._loop.create_future()
+        if (
+            self._closing
+            or (self._writer_task is not None and self._writer_task.done())
+            or self._sent_message_count >= self._queued_message_count
+        ):
+            future.set_result(None)
+        else:
+            self._sent_waiters.append((self._queued_message_count, future))
+        return future
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -203,6 +246,7 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
+        self._queued_message_count += 1
         if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
             self._logger.error(
                 (
@@ -330,7 +374,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(writer.send, binary=False)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_wait_sent,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
@@ -177,6 +177,34 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def state_diff_batch_message(
+    message_id_as_bytes: bytes, events: list[Event[EventStateChangedData]]
+) -> bytes:
+    """Return an event message with the state diffs of a batch of events.
+
+    The diffs are merged into a single message, so every entity
+    must only appear once in the batch.
+    """
+    merged: dict[str, Any] = {}
+    for event in events:
+        for key, value in _state_diff_event(event).items():
+            if key == ENTITY_EVENT_REMOVE:
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, {}).update(value)
+    return b"".join(
+        (
+            (
+                _message_to_json_bytes_or_none({"type": "event", "event": merged})
+                or INVALID_JSON_PARTIAL_MESSAGE
+            )[:-1],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
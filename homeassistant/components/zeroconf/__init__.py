@@ -36,6 +36,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import (
+    DiscoveryMatcherIndex,
     HomeKitDiscoveredIntegration,
     ZeroconfMatcher,
     async_get_homekit,
@@ -324,13 +325,23 @@ async def _async_register_hass_zc_service(
     await aio_zc.async_register_service(info, allow_name_change=True)
 
 
-def _match_against_props(matcher: dict[str, str], props: dict[str, str | None]) -> bool:
-    """Check a matcher to ensure all values in props."""
-    for key, value in matcher.items():
-        prop_val = props.get(key)
-        if prop_val is None or not _memorized_fnmatch(prop_val.lower(), value):
-            return False
-    return True
+def _compile_zeroconf_matchers(
+    matchers: list[ZeroconfMatcher],
+) -> DiscoveryMatcherIndex[str]:
+    """Compile the matchers of a service type to match domains."""
+    return DiscoveryMatcherIndex(
+        (
+            matcher[ATTR_DOMAIN],
+            {
+                **({ATTR_NAME: matcher[ATTR_NAME]} if ATTR_NAME in matcher else {}),
+                **{
+                    f"{ATTR_PROPERTIES}.{key}": value
+                    for key, value in matcher.get(ATTR_PROPERTIES, {}).items()
+                },
+            },
+        )
+        for matcher in matchers
+    )
 
 
 def is_homekit_paired(props: dict[str, Any]) -> bool:
@@ -361,6 +372,10 @@ class ZeroconfDiscovery:
         self.zeroconf_types = zeroconf_types
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
+        self._matchers_by_type = {
+            service_type: _compile_zeroconf_matchers(matchers)
+            for service_type, matchers in zeroconf_types.items()
+        }
         self.async_service_browser: AsyncServiceBrowser | None = None
 
     async def async_setup(self) -> None:
@@ -485,23 +500,18 @@ class ZeroconfDiscovery:
                 # discover it, we can stop here.
                 return
 
-        if not (matchers := self.zeroconf_types.get(service_type)):
-            return
-
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
-        for matcher in matchers:
-            if len(matcher) > 1:
-                if ATTR_NAME in matcher and not _memorized_fnmatch(
-                    info.name.lower(), matcher[ATTR_NAME]
-                ):
-                    continue
-                if ATTR_PROPERTIES in matcher and not _match_against_props(
-                    matcher[ATTR_PROPERTIES], props
-                ):
-                    continue
-
-            matcher_domain = matcher[ATTR_DOMAIN]
+        if not (matchers := self._matchers_by_type.get(service_type)):
+            return
+
+        values = {
+            f"{ATTR_PROPERTIES}.{key}": value.lower()
+            for key, value in props.items()
+            if value is not None
+        }
+        values[ATTR_NAME] = info.name.lower()
+        for matcher_domain in matchers.match(values):
             context = {
                 "source": config_entries.SOURCE_ZEROCONF,
             }
@@ -618,18 +628,3 @@ def _truncate_location_name_to_valid(location_name: str) -> str:
 def _compile_fnmatch(pattern: str) -> re.Pattern:
     """Compile a fnmatch pattern."""
     return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
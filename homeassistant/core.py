@@ -15,6 +15,7 @@ from collections.abc import (
     Iterable,
     KeysView,
     Mapping,
+    Sequence,
     ValuesView,
 )
 import concurrent.futures
@@ -1405,6 +1406,21 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+_FilterableBatchJobType = tuple[
+    HassJob[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],  # batch job
+    Callable[[_DataT], bool] | None,  # event_filter
+]
+
+# Jobs of keyed listeners by the value of the key in the event data
+_KeyedJobsType = dict[
+    Any, tuple[HassJob[[Event[Any]], Coroutine[Any, Any, None] | None], ...]
+]
+
+_DispatchType = tuple[
+    tuple[_FilterableJobType[Any], ...],  # listeners including match all
+    tuple[tuple[str, _KeyedJobsType], ...],  # keyed listeners by key
+]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1432,6 +1448,10 @@ class _OneTimeListener(Generic[_DataT]):
 
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
+# Empty dict, used by EventBus.async_fire_batch_internal
+EMPTY_DICT: dict[Any, Any] = {}
+# Empty tuple, used by EventBus.async_fire_internal
+EMPTY_TUPLE: tuple[Any, ...] = ()
 
 
 @functools.lru_cache
@@ -1444,7 +1464,15 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_debug",
+        "_dispatch",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1453,6 +1481,20 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Batch jobs by the job of the listener that receives the
+        # events one by one
+        self._batch_listeners: defaultdict[
+            EventType[Any] | str,
+            dict[HassJob[..., Any], _FilterableBatchJobType[Any]],
+        ] = defaultdict(dict)
+        # Listeners that only want events with specific values of a key
+        # of the event data, by event type and key
+        self._keyed_listeners: defaultdict[
+            EventType[Any] | str, dict[str, _KeyedJobsType]
+        ] = defaultdict(dict)
+        # The listeners to call for an event type, built when an event
+        # type is fired for the first time after its listeners changed
+        self._dispatch: dict[EventType[Any] | str, _DispatchType] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1468,7 +1510,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(jobs)
+                for keyed_jobs in keyed_listeners.values()
+                for jobs in keyed_jobs.values()
+            )
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1533,14 +1582,12 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+        if (dispatch := self._dispatch.get(event_type)) is None:
+            dispatch = self._async_build_dispatch(event_type)
+        listeners, keyed_listeners = dispatch
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        for job, event_filter in listeners:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1563,6 +1610,154 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if not keyed_listeners or event_data is None:
+            return
+        for key, keyed_jobs in keyed_listeners:
+            try:
+                if not (jobs := keyed_jobs.get(event_data.get(key), EMPTY_TUPLE)):
+                    continue
+            except TypeError:
+                # The value is not hashable, so no listener can match it
+                continue
+            if not event:
+                event = Event(
+                    event_type,
+                    event_data,
+                    origin,
+                    time_fired,
+                    context,
+                )
+            for job in jobs:
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def _async_build_dispatch(
+        self, event_type: EventType[_DataT] | str
+    ) -> _DispatchType:
+        """Build the listeners to call for an event type."""
+        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            listeners = listeners + self._match_all_listeners
+        keyed_listeners = self._keyed_listeners.get(event_type, EMPTY_DICT)
+        dispatch = self._dispatch[event_type] = (
+            tuple(listeners),
+            tuple(keyed_listeners.items()),
+        )
+        return dispatch
+
+    @callback
+    def _async_listeners_changed(self, event_type: EventType[_DataT] | str) -> None:
+        """Drop the listeners to call for an event type after they changed."""
+        if event_type == MATCH_ALL:
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
+
+    @callback
+    def async_fire_batch_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        events_data: Sequence[_DataT],
+        origin: EventOrigin = EventOrigin.local,
+        context: Context | None = None,
+        time_fired: float | None = None,
+    ) -> None:
+        """Fire multiple events of the same type at once, for internal use only.
+
+        Listeners registered with async_listen_batch receive all the events
+        that pass their filter in a single call, all other listeners are
+        called once per event, just like with async_fire_internal.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        batch_listeners = self._batch_listeners
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_batch_listeners = batch_listeners.get(MATCH_ALL, EMPTY_DICT)
+        else:
+            match_all_batch_listeners = EMPTY_DICT
+        batch_jobs = batch_listeners.get(event_type, EMPTY_DICT)
+        if match_all_batch_listeners:
+            batch_jobs = batch_jobs | match_all_batch_listeners
+
+        if not batch_jobs:
+            for event_data in events_data:
+                self.async_fire_internal(
+                    event_type, event_data, origin, context, time_fired
+                )
+            return
+
+        if self._debug:
+            for event_data in events_data:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
+                )
+
+        events = [
+            Event(event_type, event_data, origin, time_fired, context)
+            for event_data in events_data
+        ]
+        # The dispatch tuples are not changed by listeners which subscribe
+        # or unsubscribe while the events are processed
+        all_listeners, keyed_listeners = self._dispatch.get(
+            event_type
+        ) or self._async_build_dispatch(event_type)
+        listeners = [
+            filterable_job
+            for filterable_job in all_listeners
+            if filterable_job[0] not in batch_jobs
+        ]
+        for event_data, event in zip(events_data, events, strict=True):
+            for job, event_filter in listeners:
+                if event_filter is not None:
+                    try:
+                        if event_data is None or not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+            if not keyed_listeners or event_data is None:
+                continue
+            for key, keyed_jobs in keyed_listeners:
+                try:
+                    jobs = keyed_jobs.get(event_data.get(key), EMPTY_TUPLE)
+                except TypeError:
+                    continue
+                for job in jobs:
+                    try:
+                        self._hass.async_run_hass_job(job, event)
+                    except Exception:
+                        _LOGGER.exception("Error running job: %s", job)
+
+        for batch_job, event_filter in batch_jobs.values():
+            if event_filter is None:
+                batch = events
+            else:
+                batch = []
+                for event_data, event in zip(events_data, events, strict=True):
+                    try:
+                        if event_data is not None and event_filter(event_data):
+                            batch.append(event)
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                if not batch:
+                    continue
+            try:
+                self._hass.async_run_hass_job(batch_job, batch)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", batch_job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1626,6 +1821,38 @@ class EventBus:
                 )
         return self._async_listen_filterable_job(event_type, filterable_job)
 
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        batch_listener: Callable[
+            [list[Event[_DataT]]], Coroutine[Any, Any, None] | None
+        ],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type, accepting batches of events.
+
+        Events fired one by one are passed to listener. Events fired together
+        with async_fire_batch_internal, for example state changes written with
+        StateMachine.async_set_many, are passed to batch_listener in a single
+        call with the list of events that pass the optional event_filter.
+
+        This method must be run in the event loop.
+        """
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
+        self._batch_listeners[event_type][filterable_job[0]] = (
+            HassJob(batch_listener, f"listen batch {event_type}"),
+            event_filter,
+        )
+        self._listeners[event_type].append(filterable_job)
+        self._async_listeners_changed(event_type)
+        return functools.partial(
+            self._async_remove_listener, event_type, filterable_job
+        )
+
     @callback
     def _async_listen_filterable_job(
         self,
@@ -1634,10 +1861,79 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._async_listeners_changed(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        values: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with given values of a key.
+
+        The listener runs for events whose data has one of the values at
+        key, for example the entity_id of a state_changed event or the
+        domain of a call_service event. Keyed listeners are looked up by
+        the value when the event is fired, so unlike listeners with an
+        event_filter they cost nothing for events with other values.
+        Keyed listeners run after the other listeners of the event.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners need a specific event type")
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None] = HassJob(
+            listener, f"listen {event_type} by {key}"
+        )
+        values = (values,) if isinstance(values, str) else tuple(values)
+        keyed_listeners = self._keyed_listeners[event_type]
+        if (keyed_jobs := keyed_listeners.get(key)) is None:
+            keyed_jobs = keyed_listeners[key] = {}
+            self._async_listeners_changed(event_type)
+        # The tuples are replaced instead of changed, so adding or removing
+        # a listener while an event is dispatched does not affect it
+        for value in values:
+            keyed_jobs[value] = (*keyed_jobs.get(value, EMPTY_TUPLE), job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, key, values, job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        values: tuple[str, ...],
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a keyed listener.
+
+        This method must be run in the event loop.
+        """
+        keyed_listeners = self._keyed_listeners.get(event_type, EMPTY_DICT)
+        if (keyed_jobs := keyed_listeners.get(key)) is None or not all(
+            job in keyed_jobs.get(value, EMPTY_TUPLE) for value in values
+        ):
+            _LOGGER.error("Unable to remove unknown keyed job listener %s", job)
+            return
+        for value in values:
+            jobs = keyed_jobs[value]
+            index = jobs.index(job)
+            if remaining := jobs[:index] + jobs[index + 1 :]:
+                keyed_jobs[value] = remaining
+            else:
+                del keyed_jobs[value]
+        if not keyed_jobs:
+            del keyed_listeners[key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
+            self._async_listeners_changed(event_type)
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1715,10 +2011,15 @@ class EventBus:
         """
         try:
             self._listeners[event_type].remove(filterable_job)
+            self._async_listeners_changed(event_type)
 
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
                 self._listeners.pop(event_type)
+            if batch_jobs := self._batch_listeners.get(event_type):
+                batch_jobs.pop(filterable_job[0], None)
+                if not batch_jobs:
+                    del self._batch_listeners[event_type]
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -2271,6 +2572,87 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        if (
+            state_changed_data := self._async_write_state(
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                context,
+                state_info,
+                timestamp,
+            )
+        ) is not None:
+            self._bus.async_fire_internal(
+                EVENT_STATE_CHANGED,
+                state_changed_data,
+                context=context,
+                time_fired=timestamp,
+            )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities that do not exist.
+
+        States is an iterable of (entity_id, state, attributes) tuples. All
+        states share the context and the timestamp and their state_changed
+        events are fired together, so listeners registered with
+        EventBus.async_listen_batch handle all of them in a single call.
+
+        This method must be run in the event loop.
+        """
+        timestamp = timestamp or time.time()
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        state_changes: list[EventStateChangedData] = []
+        try:
+            for entity_id, new_state, attributes in states:
+                if (
+                    state_changed_data := self._async_write_state(
+                        entity_id.lower(),
+                        str(new_state),
+                        attributes or {},
+                        force_update,
+                        context,
+                        None,
+                        timestamp,
+                    )
+                ) is not None:
+                    state_changes.append(state_changed_data)
+        finally:
+            # States written before an invalid one must still be announced
+            if state_changes:
+                self._bus.async_fire_batch_internal(
+                    EVENT_STATE_CHANGED,
+                    state_changes,
+                    context=context,
+                    time_fired=timestamp,
+                )
+
+    @callback
+    def _async_write_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context,
+        state_info: StateInfo | None,
+        timestamp: float,
+    ) -> EventStateChangedData | None:
+        """Write the state of an entity to the state machine.
+
+        Returns the data of the state_changed event to fire, or None if
+        only EVENT_STATE_REPORTED was fired because nothing changed.
+        """
         # Most cases the key will be in the dict
         # so we optimize for the happy path as
         # python 3.11+ has near zero overhead for
@@ -2301,9 +2683,6 @@ class StateMachine:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
         now = dt_util.utc_from_timestamp(timestamp)
 
-        if context is None:
-            context = Context(id=ulid_at_time(timestamp))
-
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
@@ -2320,7 +2699,7 @@ class StateMachine:
                 context=context,
                 time_fired=timestamp,
             )
-            return
+            return None
 
         if same_attr:
             if TYPE_CHECKING:
@@ -2344,17 +2723,11 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
-        state_changed_data: EventStateChangedData = {
+        return {
             "entity_id": entity_id,
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
 
 
 class SupportsResponse(enum.StrEnum):
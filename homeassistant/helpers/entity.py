@@ -60,6 +60,7 @@ from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
+from .dispatcher import SignalType, async_dispatcher_send_internal
 from .event import (
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
@@ -75,6 +76,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+SIGNAL_ENTITY_SOURCES_CHANGED: SignalType[str] = SignalType("entity_sources_changed")
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -1455,6 +1457,9 @@ class Entity(
             entity_info["config_entry"] = self.platform.config_entry.entry_id
 
         entity_sources(self.hass)[self.entity_id] = entity_info
+        async_dispatcher_send_internal(
+            self.hass, SIGNAL_ENTITY_SOURCES_CHANGED, self.entity_id
+        )
 
         self._state_info = {
             "unrecorded_attributes": self.__combined_unrecorded_attributes
@@ -1485,6 +1490,9 @@ class Entity(
         # EntityComponent and can be removed in HA Core 2024.1
         if self.platform:
             del entity_sources(self.hass)[self.entity_id]
+            async_dispatcher_send_internal(
+                self.hass, SIGNAL_ENTITY_SOURCES_CHANGED, self.entity_id
+            )
 
     @callback
     def _async_registry_updated(
@@ -115,6 +115,17 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         bool,
     ]
+    batch_dispatcher_callable: (
+        Callable[
+            [
+                HomeAssistant,
+                dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+                list[Event[_TypedDictT]],
+            ],
+            None,
+        ]
+        | None
+    ) = None
 
 
 @dataclass(slots=True, frozen=True)
@@ -358,6 +369,27 @@ def _async_dispatch_entity_id_event(
             )
 
 
+@callback
+def _async_dispatch_entity_id_events_soon(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    events: list[Event[_StateEventDataT]],
+) -> None:
+    """Dispatch a batch of events to listeners soon in a single loop iteration."""
+    hass.loop.call_soon(_async_dispatch_entity_id_events, hass, callbacks, events)
+
+
+@callback
+def _async_dispatch_entity_id_events(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
+    events: list[Event[_StateEventDataT]],
+) -> None:
+    """Dispatch a batch of events to listeners."""
+    for event in events:
+        _async_dispatch_entity_id_event(hass, callbacks, event)
+
+
 @callback
 def _async_state_filter(
     hass: HomeAssistant,
@@ -373,6 +405,7 @@ _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
     filter_callable=_async_state_filter,
+    batch_dispatcher_callable=_async_dispatch_entity_id_events_soon,
 )
 
 
@@ -455,11 +488,19 @@ def _async_track_event(
         callbacks = event_data.callbacks
     else:
         callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
+        if tracker.batch_dispatcher_callable is None:
+            listener = hass.bus.async_listen(
+                tracker.event_type,
+                partial(tracker.dispatcher_callable, hass, callbacks),
+                event_filter=partial(tracker.filter_callable, hass, callbacks),
+            )
+        else:
+            listener = hass.bus.async_listen_batch(
+                tracker.event_type,
+                partial(tracker.dispatcher_callable, hass, callbacks),
+                partial(tracker.batch_dispatcher_callable, hass, callbacks),
+                event_filter=partial(tracker.filter_callable, hass, callbacks),
+            )
         event_data = _KeyedEventData(listener, callbacks)
         hass_data[tracker_key] = event_data
 
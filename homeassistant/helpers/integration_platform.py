@@ -13,9 +13,11 @@ from typing import Any
 from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import Event, HassJob, HomeAssistant, callback
 from homeassistant.loader import (
+    DATA_DEFERRED_PLATFORMS,
     Integration,
     async_get_integrations,
     async_get_loaded_integration,
+    async_is_platform_import_deferred,
     async_register_preload_platform,
     bind_hass,
 )
@@ -27,6 +29,9 @@ _LOGGER = logging.getLogger(__name__)
 DATA_INTEGRATION_PLATFORMS: HassKey[list[IntegrationPlatform]] = HassKey(
     "integration_platforms"
 )
+DATA_DEFERRED_INTEGRATION_PLATFORMS: HassKey[
+    dict[str, list[HassJob] | asyncio.Task[None]]
+] = HassKey("deferred_integration_platforms")
 
 
 @dataclass(slots=True, frozen=True)
@@ -161,7 +166,36 @@ async def async_process_integration_platforms(
     process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
     wait_for_platforms: bool = False,
 ) -> None:
-    """Process a specific platform for all current and future loaded integrations."""
+    """Process a specific platform for all current and future loaded integrations.
+
+    If the import of the platform is deferred, it is processed once
+    async_load_deferred_integration_platforms is called for it.
+    """
+    process_job = HassJob(
+        catch_log_exception(
+            process_platform,
+            partial(_format_err, str(process_platform), platform_name),
+        ),
+        f"process_platform {platform_name}",
+    )
+    if async_is_platform_import_deferred(hass, platform_name):
+        deferred = hass.data.setdefault(DATA_DEFERRED_INTEGRATION_PLATFORMS, {})
+        pending = deferred.setdefault(platform_name, [])
+        if isinstance(pending, list):
+            pending.append(process_job)
+            return
+    await _async_register_integration_platform(
+        hass, platform_name, process_job, wait_for_platforms
+    )
+
+
+async def _async_register_integration_platform(
+    hass: HomeAssistant,
+    platform_name: str,
+    process_job: HassJob,
+    wait_for_platforms: bool,
+) -> None:
+    """Register an integration platform and process the loaded integrations."""
     if DATA_INTEGRATION_PLATFORMS not in hass.data:
         integration_platforms = hass.data[DATA_INTEGRATION_PLATFORMS] = []
         hass.bus.async_listen(
@@ -177,13 +211,6 @@ async def async_process_integration_platforms(
 
     async_register_preload_platform(hass, platform_name)
     top_level_components = hass.config.top_level_components.copy()
-    process_job = HassJob(
-        catch_log_exception(
-            process_platform,
-            partial(_format_err, str(process_platform), platform_name),
-        ),
-        f"process_platform {platform_name}",
-    )
     integration_platform = IntegrationPlatform(
         platform_name, process_job, top_level_components
     )
@@ -218,6 +245,64 @@ async def async_process_integration_platforms(
         await future
 
 
+async def async_load_deferred_integration_platforms(
+    hass: HomeAssistant, platform_name: str
+) -> None:
+    """Process a deferred integration platform on its first use.
+
+    The platform of all loaded integrations is imported and processed, the
+    platform of integrations loaded later is processed as they are loaded.
+    This is a no-op if the platform is not deferred or already processed.
+    """
+    if (deferred := hass.data.get(DATA_DEFERRED_INTEGRATION_PLATFORMS)) is None or (
+        pending := deferred.get(platform_name)
+    ) is None:
+        return
+    if isinstance(pending, list):
+        hass.data[DATA_DEFERRED_PLATFORMS].discard(platform_name)
+        pending = hass.async_create_task_internal(
+            _async_register_deferred_integration_platforms(
+                hass, platform_name, pending
+            ),
+            f"load deferred {platform_name} platforms",
+            eager_start=True,
+        )
+        # The task may already be done when it is started eagerly
+        if not pending.done():
+            deferred[platform_name] = pending
+    await pending
+
+
+async def _async_register_deferred_integration_platforms(
+    hass: HomeAssistant, platform_name: str, process_jobs: list[HassJob]
+) -> None:
+    """Register deferred integration platforms and wait for their processing.
+
+    If this fails, the platforms which were not processed are deferred again
+    so they are retried on the next use.
+    """
+    deferred = hass.data[DATA_DEFERRED_INTEGRATION_PLATFORMS]
+    try:
+        while process_jobs:
+            await _async_register_integration_platform(
+                hass, platform_name, process_jobs[0], True
+            )
+            del process_jobs[0]
+    except BaseException:
+        # The failed platform is registered again on the next use
+        failed_job = process_jobs[0]
+        if integration_platforms := hass.data.get(DATA_INTEGRATION_PLATFORMS):
+            integration_platforms[:] = [
+                integration_platform
+                for integration_platform in integration_platforms
+                if integration_platform.process_job is not failed_job
+            ]
+        deferred[platform_name] = process_jobs
+        hass.data[DATA_DEFERRED_PLATFORMS].add(platform_name)
+        raise
+    deferred.pop(platform_name, None)
+
+
 async def _async_process_integration_platforms(
     hass: HomeAssistant,
     platform_name: str,
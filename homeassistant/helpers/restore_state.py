@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import Iterable
+from contextlib import suppress
+import dataclasses
 from datetime import datetime, timedelta
 import logging
+import os
 from typing import Any, Self, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
@@ -12,15 +17,15 @@ from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 from homeassistant.util.hass_dict import HassKey
-from homeassistant.util.json import json_loads
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes
 from .singleton import singleton
-from .storage import Store
+from .storage import STORAGE_DIR, Store
 
 DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 
@@ -28,6 +33,7 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+JOURNAL_KEY = f"{STORAGE_KEY}.journal"
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -35,6 +41,11 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the journal of changed states may grow before it is compacted
+# into the base snapshot, both in time and relative to the stored states
+JOURNAL_COMPACT_INTERVAL = timedelta(days=1)
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -96,6 +107,111 @@ class StoredState:
         )
 
 
+def _last_seen(record: dict[str, Any]) -> datetime:
+    """Return when the entity of a stored state record was last seen."""
+    last_seen = record["last_seen"]
+    if isinstance(last_seen, str):
+        return dt_util.parse_datetime(last_seen, raise_on_error=True)
+    return cast(datetime, last_seen)
+
+
+# The state, extra data, converted and serialized extra data of a dumped record
+type _DumpKey = tuple[Any, ExtraStoredData | None, dict[str, Any] | None, bytes | None]
+
+
+def _same_extra_data(
+    previous: ExtraStoredData | None, extra_data: ExtraStoredData | None
+) -> bool:
+    """Return if the extra data equals the extra data of the last dump.
+
+    Only new dataclass instances are compared, other extra data may have
+    been changed in place and is always converted again.
+    """
+    if extra_data is None:
+        return previous is None
+    return (
+        previous is not None
+        and extra_data is not previous
+        and dataclasses.is_dataclass(extra_data)
+        and extra_data == previous
+    )
+
+
+class RestoreStateJournal:
+    """Append-only log of the stored states changed since the base snapshot.
+
+    Each line holds the JSON of a stored state, or of a record with the
+    entity_id under "removed" when the stored state has been dropped.
+    Later lines replace earlier lines of the same entity.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the journal."""
+        self.hass = hass
+        self.key = key
+
+    @property
+    def path(self) -> str:
+        """Return the path of the journal."""
+        return self.hass.config.path(STORAGE_DIR, self.key)
+
+    async def async_read(self) -> list[dict[str, Any]]:
+        """Read the records of the journal."""
+        return await self.hass.async_add_executor_job(self._read)
+
+    async def async_append(self, records: Iterable[dict[str, Any]]) -> None:
+        """Append records to the journal."""
+        data = b"".join(json_bytes(record) + b"\n" for record in records)
+        if data:
+            await self.hass.async_add_executor_job(self._append, data)
+
+    async def async_remove(self) -> None:
+        """Remove the journal."""
+        await self.hass.async_add_executor_job(self._remove)
+
+    def _read(self) -> list[dict[str, Any]]:
+        """Read the records of the journal line by line.
+
+        A line without a newline is what is left of an append that was
+        interrupted, it is cut off so the next append starts a new line.
+        """
+        records: list[dict[str, Any]] = []
+        try:
+            with open(self.path, "rb+") as file:
+                offset = 0
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        _LOGGER.warning(
+                            "Discarding incomplete record at the end of %s", self.path
+                        )
+                        file.truncate(offset)
+                        break
+                    offset += len(line)
+                    try:
+                        record = json_loads(line)
+                    except JSON_DECODE_EXCEPTIONS:
+                        _LOGGER.warning("Discarding invalid record in %s", self.path)
+                        continue
+                    if isinstance(record, dict):
+                        records.append(record)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            _LOGGER.error("Error reading %s: %s", self.path, err)
+        return records
+
+    def _append(self, data: bytes) -> None:
+        """Append data to the journal."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "ab") as file:
+            file.write(data)
+
+    def _remove(self) -> None:
+        """Remove the journal."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -137,8 +253,17 @@ class RestoreStateData:
         self.store = Store[list[dict[str, Any]]](
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.journal = RestoreStateJournal(hass, JOURNAL_KEY)
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Loaded records which have not been restored by an entity yet,
+        # they are only turned into a StoredState when they are restored
+        self._restored_records: dict[str, dict[str, Any]] = {}
+        # What the last dump stored for each entity, to find the changes
+        self._dumped: dict[str, _DumpKey] = {}
+        self._dump_lock = asyncio.Lock()
+        self._journal_records = 0
+        self._last_compaction: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -152,23 +277,67 @@ class RestoreStateData:
         start.async_at_start(self.hass, hass_start)
 
     async def async_load(self) -> None:
-        """Load the instance of this data helper."""
+        """Load the instance of this data helper.
+
+        The journal is applied on top of the base snapshot. A record of the
+        journal which is older than the record in the snapshot is left over
+        from an interrupted compaction and ignored.
+        """
         try:
             stored_states = await self.store.async_load()
         except HomeAssistantError as exc:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
-        if stored_states is None:
+        journal = await self.journal.async_read()
+        records: dict[str, dict[str, Any]] = {
+            item["state"]["entity_id"]: item for item in stored_states or ()
+        }
+        for record in journal:
+            try:
+                entity_id = record.get("removed") or record["state"]["entity_id"]
+                if (current := records.get(entity_id)) is not None and (
+                    _last_seen(current) > _last_seen(record)
+                ):
+                    continue
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.warning("Discarding invalid journal record %s", record)
+                continue
+            if "removed" in record:
+                records.pop(entity_id, None)
+            else:
+                records[entity_id] = record
+
+        self.last_states = {}
+        self._dumped = {}
+        self._journal_records = len(journal)
+        self._last_compaction = None
+        if not records:
             _LOGGER.debug("Not creating cache - no saved states found")
-            self.last_states = {}
+            self._restored_records = {}
         else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
-                for item in stored_states
-                if valid_entity_id(item["state"]["entity_id"])
+            self._restored_records = {
+                entity_id: record
+                for entity_id, record in records.items()
+                if valid_entity_id(entity_id)
             }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            _LOGGER.debug("Created cache with %s", list(self._restored_records))
+
+    @callback
+    def async_get_restored_state(self, entity_id: str) -> StoredState | None:
+        """Get the stored state of an entity from the previous run, if any."""
+        if (record := self._restored_records.pop(entity_id, None)) is not None:
+            self.last_states[entity_id] = StoredState.from_dict(record)
+        return self.last_states.get(entity_id)
+
+    @callback
+    def _async_get_current_states(self) -> dict[str, State]:
+        """Get the current states which are backed by an entity object."""
+        return {
+            state.entity_id: state
+            for state in self.hass.states.async_all()
+            if not state.attributes.get(ATTR_RESTORED)
+        }
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -179,13 +348,8 @@ class RestoreStateData:
         entities on this run, and have not expired.
         """
         now = dt_util.utcnow()
-        all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
-        current_states_by_entity_id = {
-            state.entity_id: state
-            for state in all_states
-            if not state.attributes.get(ATTR_RESTORED)
-        }
+        current_states_by_entity_id = self._async_get_current_states()
 
         # Start with the currently registered states
         stored_states = [
@@ -212,20 +376,128 @@ class RestoreStateData:
 
             stored_states.append(stored_state)
 
+        stored_states.extend(
+            StoredState.from_dict(record)
+            for entity_id, record in self._restored_records.items()
+            if entity_id not in current_states_by_entity_id
+            and _last_seen(record) >= expiration_time
+        )
         return stored_states
 
+    @callback
+    def _async_get_records(
+        self, now: datetime
+    ) -> dict[str, tuple[_DumpKey, dict[str, Any]]]:
+        """Get the records of the states which should be stored.
+
+        Selects the same states as async_get_stored_states, along with what
+        identifies the content of each record to find the changed ones.
+        Records which have not been restored are stored as they were loaded.
+
+        The extra data of an entity is only converted and serialized again
+        when its state or extra data changed since the last dump.
+        """
+        current_states_by_entity_id = self._async_get_current_states()
+        dumped = self._dumped
+        records: dict[str, tuple[_DumpKey, dict[str, Any]]] = {}
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            if (
+                (previous := dumped.get(entity_id)) is not None
+                and previous[0] is state
+                and _same_extra_data(previous[1], extra_data)
+            ):
+                extra_data_dict, extra_data_json = previous[2], previous[3]
+            else:
+                extra_data_dict = extra_data.as_dict() if extra_data else None
+                try:
+                    extra_data_json = json_bytes(extra_data_dict)
+                except TypeError as err:
+                    _LOGGER.error(
+                        "Error serializing extra restore state data of %s: %s",
+                        entity_id,
+                        err,
+                    )
+                    continue
+            records[entity_id] = (
+                (state, extra_data, extra_data_dict, extra_data_json),
+                {
+                    "state": state.json_fragment,
+                    "extra_data": extra_data_dict,
+                    "last_seen": now,
+                },
+            )
+
+        expiration_time = now - STATE_EXPIRATION
+        for entity_id, stored_state in self.last_states.items():
+            if (
+                entity_id not in current_states_by_entity_id
+                and stored_state.last_seen >= expiration_time
+            ):
+                records[entity_id] = (
+                    (stored_state, None, None, None),
+                    stored_state.as_dict(),
+                )
+
+        for entity_id, record in self._restored_records.items():
+            if (
+                entity_id not in current_states_by_entity_id
+                and _last_seen(record) >= expiration_time
+            ):
+                records[entity_id] = ((record, None, None, None), record)
+
+        return records
+
+    @callback
+    def _async_should_compact(self, now: datetime, stored_states: int) -> bool:
+        """Return if the journal should be compacted into the base snapshot."""
+        return (
+            self._last_compaction is None
+            or now - self._last_compaction >= JOURNAL_COMPACT_INTERVAL
+            or self._journal_records > stored_states * JOURNAL_COMPACT_RATIO
+        )
+
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only the states which changed since the last dump are appended to
+        the journal. The journal is compacted into the base snapshot on the
+        first dump of a run and when it has grown too large or too old.
+        """
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
-        except HomeAssistantError as exc:
-            _LOGGER.error("Error saving current states", exc_info=exc)
+        async with self._dump_lock:
+            now = dt_util.utcnow()
+            records = self._async_get_records(now)
+            try:
+                if self._async_should_compact(now, len(records)):
+                    await self.store.async_save(
+                        [record for _, record in records.values()]
+                    )
+                    await self.journal.async_remove()
+                    self._journal_records = 0
+                    self._last_compaction = now
+                else:
+                    dumped = self._dumped
+                    changes = [
+                        record
+                        for entity_id, (key, record) in records.items()
+                        if (previous := dumped.get(entity_id)) is None
+                        or previous[0] is not key[0]
+                        or previous[3] != key[3]
+                    ]
+                    changes.extend(
+                        {"removed": entity_id, "last_seen": now}
+                        for entity_id in dumped
+                        if entity_id not in records
+                    )
+                    await self.journal.async_append(changes)
+                    self._journal_records += len(changes)
+            except (HomeAssistantError, OSError, TypeError) as exc:
+                _LOGGER.error("Error saving current states", exc_info=exc)
+                return
+            self._dumped = {entity_id: key for entity_id, (key, _) in records.items()}
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -277,6 +549,7 @@ class RestoreStateData:
         if state is not None:
             state = State.from_dict(json_loads(state.as_dict_json))  # type: ignore[arg-type]
         if state is not None:
+            self._restored_records.pop(entity_id, None)
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
@@ -308,7 +581,7 @@ class RestoreEntity(Entity):
                 "Cannot get last state. Entity not added to hass"
             )
             return None
-        return async_get(self.hass).last_states.get(self.entity_id)
+        return async_get(self.hass).async_get_restored_state(self.entity_id)
 
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
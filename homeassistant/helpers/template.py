@@ -21,6 +21,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -29,6 +30,7 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
+from jinja2.bccache import Bucket
 from jinja2.runtime import AsyncLoopContext, LoopContext
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
@@ -47,6 +49,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
@@ -81,6 +84,7 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -97,8 +101,15 @@ _ENVIRONMENT_LIMITED: HassKey[TemplateEnvironment] = HassKey(
 _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+_LOOKUP_CACHE: HassKey[TemplateLookupCache] = HassKey("template.lookup_cache")
 _HASS_LOADER = "template.hass_loader"
 
+BYTECODE_CACHE_STORAGE_KEY = "core.template_bytecode"
+BYTECODE_CACHE_STORAGE_VERSION = 1
+BYTECODE_CACHE_SAVE_DELAY = 60
+MAX_BYTECODE_CACHE_SIZE = 4096
+
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
 
@@ -1249,6 +1260,118 @@ def result_as_boolean(template_result: Any | None) -> bool:
     return forgiving_boolean(template_result, default=False)
 
 
+class TemplateLookupCache:
+    """Cache the entity ids of areas, devices, integrations and labels.
+
+    Looking up the entities of an area or integration walks the registries
+    or all entity sources, which adds up when many templates are rendered
+    on every state change. The results only change when a registry, a
+    config entry or the set of entities changes, so they are shared by all
+    renders until then.
+    """
+
+    __slots__ = ("_hass", "_lookups", "hits", "invalidations", "misses")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._lookups: dict[str, dict[str, list[str]]] = {
+            "area": {},
+            "device": {},
+            "integration": {},
+            "label": {},
+        }
+        self.hits: collections.Counter[str] = collections.Counter()
+        self.misses: collections.Counter[str] = collections.Counter()
+        self.invalidations = 0
+
+    @property
+    def lookups(self) -> int:
+        """Return the number of lookups made by template renders."""
+        return self.hits.total() + self.misses.total()
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups answered from the cache."""
+        if not (lookups := self.lookups):
+            return 0.0
+        return self.hits.total() / lookups
+
+    @callback
+    def async_setup(self) -> None:
+        """Clear the cached lookups when their sources change."""
+        # pylint: disable-next=import-outside-toplevel
+        from homeassistant.config_entries import SIGNAL_CONFIG_ENTRY_CHANGED
+
+        # pylint: disable-next=import-outside-toplevel
+        from .dispatcher import async_dispatcher_connect
+
+        # pylint: disable-next=import-outside-toplevel
+        from .entity import SIGNAL_ENTITY_SOURCES_CHANGED
+
+        hass = self._hass
+        clear_all = partial(self._async_clear, *self._lookups)
+        clear_integration = partial(self._async_clear, "integration")
+        hass.bus.async_listen(
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            callback(lambda _: clear_all()),
+        )
+        hass.bus.async_listen(
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            callback(lambda _: self._async_clear("area")),
+        )
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_CONFIG_ENTRY_CHANGED,
+            callback(lambda *_: clear_integration()),
+        )
+        async_dispatcher_connect(
+            hass,
+            SIGNAL_ENTITY_SOURCES_CHANGED,
+            callback(lambda _: clear_integration()),
+        )
+
+    @callback
+    def _async_clear(self, *kinds: str) -> None:
+        """Clear the cached lookups of the given kinds."""
+        cleared = [kind for kind in kinds if self._lookups[kind]]
+        for kind in cleared:
+            self._lookups[kind].clear()
+            self.invalidations += 1
+        if cleared and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Cleared the template %s lookups; %s lookups, %s hits (%.1f%%), "
+                "%s invalidations so far",
+                ", ".join(cleared),
+                self.lookups,
+                self.hits.total(),
+                self.hit_rate * 100,
+                self.invalidations,
+            )
+
+    @callback
+    def async_get(
+        self, kind: str, key: str, compute: Callable[[], list[str]]
+    ) -> list[str]:
+        """Return the entity ids of a lookup, computing them on a miss."""
+        lookups = self._lookups[kind]
+        if (entity_ids := lookups.get(key)) is None:
+            self.misses[kind] += 1
+            entity_ids = lookups[key] = compute()
+        else:
+            self.hits[kind] += 1
+        return list(entity_ids)
+
+
+@callback
+def async_get_lookup_cache(hass: HomeAssistant) -> TemplateLookupCache:
+    """Return the lookup cache shared by all templates."""
+    if (lookup_cache := hass.data.get(_LOOKUP_CACHE)) is None:
+        lookup_cache = hass.data[_LOOKUP_CACHE] = TemplateLookupCache(hass)
+        lookup_cache.async_setup()
+    return lookup_cache
+
+
 def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
     """Expand out any groups and zones into entity states."""
     # circular import.
@@ -1294,6 +1417,13 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
 
 def device_entities(hass: HomeAssistant, _device_id: str) -> Iterable[str]:
     """Get entity ids for entities tied to a device."""
+    return async_get_lookup_cache(hass).async_get(
+        "device", _device_id, partial(_device_entities, hass, _device_id)
+    )
+
+
+def _device_entities(hass: HomeAssistant, _device_id: str) -> list[str]:
+    """Look up the entity ids tied to a device in the entity registry."""
     entity_reg = entity_registry.async_get(hass)
     entries = entity_registry.async_entries_for_device(entity_reg, _device_id)
     return [entry.entity_id for entry in entries]
@@ -1311,6 +1441,13 @@ def integration_entities(hass: HomeAssistant, entry_name: str) -> Iterable[str]:
     if not entry_name:
         return []
 
+    return async_get_lookup_cache(hass).async_get(
+        "integration", entry_name, partial(_integration_entities, hass, entry_name)
+    )
+
+
+def _integration_entities(hass: HomeAssistant, entry_name: str) -> list[str]:
+    """Look up the entity ids of a config entry title or a domain."""
     # first try if there are any config entries with a matching title
     entities: list[str] = []
     ent_reg = entity_registry.async_get(hass)
@@ -1564,6 +1701,13 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
         _area_id = area_id_or_name
     if _area_id is None:
         return []
+    return async_get_lookup_cache(hass).async_get(
+        "area", _area_id, partial(_area_entities, hass, _area_id)
+    )
+
+
+def _area_entities(hass: HomeAssistant, _area_id: str) -> list[str]:
+    """Look up the entity ids in an area, including those of its devices."""
     ent_reg = entity_registry.async_get(hass)
     entity_ids = [
         entry.entity_id
@@ -1680,6 +1824,13 @@ def label_entities(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     """Return entities for a given label ID or name."""
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
+    return async_get_lookup_cache(hass).async_get(
+        "label", _label_id, partial(_label_entities, hass, _label_id)
+    )
+
+
+def _label_entities(hass: HomeAssistant, _label_id: str) -> list[str]:
+    """Look up the entity ids with a label in the entity registry."""
     ent_reg = entity_registry.async_get(hass)
     entries = entity_registry.async_entries_for_label(ent_reg, _label_id)
     return [entry.entity_id for entry in entries]
@@ -2711,6 +2862,96 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the bytecode of the templates compiled before the last restart."""
+    bytecode_cache = TemplateBytecodeCache(hass)
+    await bytecode_cache.async_load()
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+
+class TemplateBytecodeCache(jinja2.BytecodeCache):
+    """Persist the bytecode of compiled templates in .storage.
+
+    Parsing and compiling templates makes up a noticeable part of startup
+    on installs with many templates. The compiled code is kept keyed by
+    the kind of environment and the checksum of the source, and the least
+    recently used entries are evicted. The whole cache is discarded when
+    Home Assistant or jinja is updated, as the available filters, tests
+    and the generated code may have changed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the bytecode cache."""
+        self._hass = hass
+        self._store = Store[dict[str, Any]](
+            hass,
+            BYTECODE_CACHE_STORAGE_VERSION,
+            BYTECODE_CACHE_STORAGE_KEY,
+            private=True,
+        )
+        self._buckets: LRU[str, str] = LRU(MAX_BYTECODE_CACHE_SIZE)
+        self._version = f"{__version__}-{jinja2.__version__}"
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load the stored bytecode."""
+        data = await self._store.async_load()
+        self._loaded = True
+        if not data or data.get("version") != self._version:
+            return
+        # Stored most recently used first
+        for key, bytecode in reversed(data["bytecode"].items()):
+            self._buckets[key] = bytecode
+
+    def get_code(
+        self,
+        environment: TemplateEnvironment,
+        kind: str,
+        source: str,
+        compile_source: Callable[[str], CodeType],
+    ) -> CodeType:
+        """Return the code of a template, compiling it if it is not cached."""
+        checksum = self.get_source_checksum(source)
+        bucket = Bucket(environment, f"{kind}-{checksum}", checksum)
+        self.load_bytecode(bucket)
+        if bucket.code is None:
+            bucket.code = compile_source(source)
+            self.dump_bytecode(bucket)
+        return bucket.code
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load the bytecode of a bucket if it is cached."""
+        if (bytecode := self._buckets.get(bucket.key)) is not None:
+            bucket.bytecode_from_string(base64.b64decode(bytecode))
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Cache the bytecode of a bucket."""
+        self._buckets[bucket.key] = base64.b64encode(
+            bucket.bytecode_to_string()
+        ).decode()
+        # Never overwrite the stored bytecode before it has been loaded
+        if not self._loaded:
+            return
+        if self._hass.loop_thread_id == threading.get_ident():
+            self._async_schedule_save()
+        else:
+            self._hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._buckets.clear()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the bytecode."""
+        self._store.async_delay_save(self._data_to_save, BYTECODE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the bytecode to store, most recently used first."""
+        return {"version": self._version, "bytecode": dict(self._buckets.items())}
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2757,6 +2998,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self.bytecode_kind = "limited" if limited else "strict" if strict else "full"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3111,7 +3353,16 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is not None
+            and isinstance(source, str)
+            and (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is not None
+        ):
+            compiled = bytecode_cache.get_code(
+                self, self.bytecode_kind, source, super().compile
+            )
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
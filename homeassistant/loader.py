@@ -7,15 +7,18 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
+import fnmatch
 import functools as ft
 from functools import cached_property
 import importlib
 import logging
+from operator import attrgetter
 import os
 import pathlib
+import re
 import sys
 import time
 from types import ModuleType
@@ -42,6 +45,7 @@ from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
+from .util.import_profiler import ImportProfiler
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
 
 if TYPE_CHECKING:
@@ -80,6 +84,18 @@ BASE_PRELOAD_PLATFORMS = [
     "trigger",
 ]
 
+# Rarely used platforms which are only imported on their first use
+# instead of being preloaded when the deferred platform import mode
+# is enabled with async_defer_platform_imports.
+DEFERRED_PLATFORMS = (
+    "diagnostics",
+    "logbook",
+    "repairs",
+)
+
+# The characters which start a wildcard of a fnmatch pattern
+_GLOB_SPECIAL_CHARS = re.compile(r"[*?[]")
+
 
 @dataclass
 class BlockedIntegration:
@@ -132,6 +148,8 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_DEFERRED_PLATFORMS: HassKey[set[str]] = HassKey("deferred_platforms")
+DATA_IMPORT_PROFILER: HassKey[ImportProfiler] = HassKey("import_profiler")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -643,6 +661,138 @@ async def async_get_mqtt(hass: HomeAssistant) -> dict[str, list[str]]:
     return mqtt
 
 
+@dataclass(slots=True, frozen=True)
+class _CompiledMatcher[_T]:
+    """A matcher with its compiled patterns."""
+
+    order: int
+    patterns: tuple[tuple[str, re.Pattern[str]], ...]
+    value: _T
+
+
+def _matcher_literal_prefix(pattern: str, glob: bool) -> str:
+    """Return the literal prefix every value matching a pattern starts with."""
+    if glob and (match := _GLOB_SPECIAL_CHARS.search(pattern)):
+        return pattern[: match.start()]
+    return pattern
+
+
+def _translate_matcher_pattern(pattern: str, glob: bool) -> str:
+    """Translate a matcher pattern to a regular expression."""
+    if glob:
+        return fnmatch.translate(pattern)
+    return rf"{re.escape(pattern)}\Z"
+
+
+class DiscoveryMatcherIndex[_T]:
+    """Compiled index of the manifest matchers of a discovery protocol.
+
+    A matcher maps fields to patterns which must all match the values of a
+    discovery. The patterns are fnmatch globs, or strings which must be equal
+    to the value when glob is False.
+
+    Every matcher is indexed by the literal prefix of its pattern with the
+    longest one, so a discovery is matched with a dict lookup per distinct
+    prefix length of each field, and only the matchers found that way are
+    checked against their compiled patterns. The matchers of a field without
+    a literal prefix, like *-hub*, are rejected together by a single
+    combined regex of their patterns. When glob is False, every matcher is
+    indexed by the full value of its longest pattern instead, and a discovery
+    is matched with a single dict lookup per field.
+    """
+
+    def __init__(
+        self, matchers: Iterable[tuple[_T, Mapping[str, str]]], glob: bool = True
+    ) -> None:
+        """Compile the matchers."""
+        self._unconditional: list[_CompiledMatcher[_T]] = []
+        self._by_value: dict[str, dict[str, list[_CompiledMatcher[_T]]]] = {}
+        self._prefix_lengths: dict[str, list[int]] = {}
+        self._by_prefix: dict[tuple[str, str], list[_CompiledMatcher[_T]]] = {}
+        self._unprefixed: dict[
+            str, tuple[re.Pattern[str], list[_CompiledMatcher[_T]]]
+        ] = {}
+        unprefixed: dict[str, list[tuple[str, _CompiledMatcher[_T]]]] = {}
+        for order, (value, patterns) in enumerate(matchers):
+            compiled = _CompiledMatcher(
+                order,
+                tuple(
+                    (field, re.compile(_translate_matcher_pattern(pattern, glob)))
+                    for field, pattern in patterns.items()
+                ),
+                value,
+            )
+            if not patterns:
+                self._unconditional.append(compiled)
+                continue
+            field, pattern, prefix = max(
+                (
+                    (field, pattern, _matcher_literal_prefix(pattern, glob))
+                    for field, pattern in patterns.items()
+                ),
+                key=lambda item: len(item[2]),
+            )
+            if not glob:
+                self._by_value.setdefault(field, {}).setdefault(pattern, []).append(
+                    compiled
+                )
+                continue
+            if not prefix:
+                unprefixed.setdefault(field, []).append((pattern, compiled))
+                continue
+            self._by_prefix.setdefault((field, prefix), []).append(compiled)
+            lengths = self._prefix_lengths.setdefault(field, [])
+            if len(prefix) not in lengths:
+                lengths.append(len(prefix))
+        for lengths in self._prefix_lengths.values():
+            lengths.sort()
+        for field, field_matchers in unprefixed.items():
+            combined = "|".join(
+                _translate_matcher_pattern(pattern, glob)
+                for pattern, _ in field_matchers
+            )
+            self._unprefixed[field] = (
+                re.compile(combined),
+                [compiled for _, compiled in field_matchers],
+            )
+
+    def match(self, values: Mapping[str, Any]) -> list[_T]:
+        """Return the values of the matchers matching a discovery.
+
+        The values are returned in the order the matchers were passed in.
+        """
+        candidates: list[_CompiledMatcher[_T]] = []
+        for field, by_value in self._by_value.items():
+            if isinstance(value := values.get(field), str) and (
+                bucket := by_value.get(value)
+            ):
+                candidates.extend(bucket)
+        for field, lengths in self._prefix_lengths.items():
+            if not isinstance(value := values.get(field), str):
+                continue
+            for length in lengths:
+                if length > len(value):
+                    break
+                if bucket := self._by_prefix.get((field, value[:length])):
+                    candidates.extend(bucket)
+        for field, (combined, field_matchers) in self._unprefixed.items():
+            if isinstance(value := values.get(field), str) and combined.match(value):
+                candidates.extend(field_matchers)
+        if not candidates:
+            return [compiled.value for compiled in self._unconditional]
+        candidates = [
+            compiled
+            for compiled in candidates
+            if all(
+                isinstance(value := values.get(field), str) and pattern.match(value)
+                for field, pattern in compiled.patterns
+            )
+        ]
+        candidates.extend(self._unconditional)
+        candidates.sort(key=attrgetter("order"))
+        return [compiled.value for compiled in candidates]
+
+
 @callback
 def async_register_preload_platform(hass: HomeAssistant, platform_name: str) -> None:
     """Register a platform to be preloaded."""
@@ -651,6 +801,48 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+@callback
+def async_defer_platform_imports(hass: HomeAssistant) -> None:
+    """Import the deferred platforms on their first use instead of preloading them.
+
+    The integration platforms helper processes the deferred platforms once
+    async_load_deferred_integration_platforms is called for them.
+    """
+    preload_platforms = hass.data[DATA_PRELOAD_PLATFORMS]
+    preload_platforms[:] = [
+        platform_name
+        for platform_name in preload_platforms
+        if platform_name not in DEFERRED_PLATFORMS
+    ]
+    hass.data[DATA_DEFERRED_PLATFORMS] = set(DEFERRED_PLATFORMS)
+
+
+@callback
+def async_is_platform_import_deferred(hass: HomeAssistant, platform_name: str) -> bool:
+    """Return if the import of a platform is deferred until its first use."""
+    deferred_platforms = hass.data.get(DATA_DEFERRED_PLATFORMS)
+    return deferred_platforms is not None and platform_name in deferred_platforms
+
+
+@callback
+def async_enable_import_profiler(hass: HomeAssistant) -> ImportProfiler:
+    """Enable recording the time spent importing integrations and modules.
+
+    The profiler is started and stopped around the setup of the integrations.
+    """
+    if (profiler := hass.data.get(DATA_IMPORT_PROFILER)) is None:
+        profiler = hass.data[DATA_IMPORT_PROFILER] = ImportProfiler()
+    return profiler
+
+
+@callback
+def async_get_import_profile(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return the recorded import timings or None if profiling is disabled."""
+    if (profiler := hass.data.get(DATA_IMPORT_PROFILER)) is None:
+        return None
+    return profiler.as_dict()
+
+
 class Integration:
     """An integration in Home Assistant."""
 
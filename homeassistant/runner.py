@@ -57,6 +57,9 @@ class RuntimeConfig:
 
     safe_mode: bool = False
 
+    profile_imports: bool = False
+    defer_platform_imports: bool = False
+
 
 def can_use_pidfd() -> bool:
     """Check if pidfd_open is available.
@@ -6,11 +6,17 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+import json
 import logging
+from pathlib import Path
+import platform
+import statistics
+import time
 from timeit import default_timer as timer
+from typing import Any
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_STATE_CHANGED, __version__
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -30,25 +36,144 @@ def run(args):
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
 
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
-    parser.add_argument("name", choices=BENCHMARKS)
+    parser.add_argument("name", nargs="+", choices=[*BENCHMARKS, "all"])
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--runs",
+        type=_positive_int,
+        help="Run each benchmark this many times and report statistics"
+        " instead of running until interrupted",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Runs before the measured runs that are discarded",
+    )
+    parser.add_argument("--json", metavar="FILE", help="Write the results as JSON")
+    parser.add_argument(
+        "--compare",
+        metavar="FILE",
+        help="Compare the results with the JSON results of a baseline run",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10,
+        help="Percentage the median may be slower than the baseline",
+    )
 
     args = parser.parse_args()
 
-    bench = BENCHMARKS[args.name]
+    names = list(BENCHMARKS) if "all" in args.name else args.name
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
 
-    with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
+    if args.runs is None:
+        with suppress(KeyboardInterrupt):
+            while True:
+                for name in names:
+                    asyncio.run(run_benchmark(BENCHMARKS[name]))
+        return 0
+
+    results = {}
+    for name in names:
+        bench = BENCHMARKS[name]
+        for _ in range(args.warmup):
+            asyncio.run(run_benchmark(bench, report=False))
+        runtimes = [
+            asyncio.run(run_benchmark(bench, report=False)) for _ in range(args.runs)
+        ]
+        results[name] = _summarize(runtimes)
+        print(_format_summary(name, results[name]))
+
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps(
+                {
+                    "version": __version__,
+                    "python": platform.python_version(),
+                    "benchmarks": results,
+                },
+                indent=2,
+            )
+        )
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())["benchmarks"]
+        return _compare(results, baseline, args.threshold)
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    """Parse a positive number of runs."""
+    if (number := int(value)) < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _summarize(runtimes: list[float]) -> dict[str, Any]:
+    """Return statistics of the runtimes of a benchmark."""
+    percentiles = (
+        statistics.quantiles(runtimes, n=100, method="inclusive")
+        if len(runtimes) > 1
+        else runtimes * 99
+    )
+    return {
+        "runs": runtimes,
+        "min": min(runtimes),
+        "max": max(runtimes),
+        "mean": statistics.fmean(runtimes),
+        "stdev": statistics.stdev(runtimes) if len(runtimes) > 1 else 0.0,
+        "median": statistics.median(runtimes),
+        "p90": percentiles[89],
+        "p99": percentiles[98],
+    }
+
 
+def _format_summary(name: str, summary: dict[str, Any]) -> str:
+    """Format the statistics of a benchmark."""
+    return (
+        f"Benchmark {name}: median {summary['median']:.6f}s"
+        f" min {summary['min']:.6f}s p90 {summary['p90']:.6f}s"
+        f" p99 {summary['p99']:.6f}s max {summary['max']:.6f}s"
+        f" over {len(summary['runs'])} runs"
+    )
 
-async def run_benchmark(bench):
+
+def _compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> int:
+    """Print the change of the medians and return 1 on a regression."""
+    regressions = 0
+    for name, summary in results.items():
+        if name not in baseline:
+            print(f"Benchmark {name}: not in baseline")
+            continue
+        base_median = baseline[name]["median"]
+        if base_median <= 0:
+            print(f"Benchmark {name}: baseline median is {base_median}, not compared")
+            continue
+        change = (summary["median"] - base_median) / base_median * 100
+        regression = change > threshold
+        regressions += regression
+        print(
+            f"Benchmark {name}: median {summary['median']:.6f}s"
+            f" vs {base_median:.6f}s ({change:+.1f}%)"
+            f"{' REGRESSION' if regression else ''}"
+        )
+    return 1 if regressions else 0
+
+
+async def run_benchmark(bench, report=True):
     """Run a benchmark."""
     hass = core.HomeAssistant("")
     runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
+    if report:
+        print(f"Benchmark {bench.__name__} done in {runtime}s")
     await hass.async_stop()
+    return runtime
 
 
 def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
@@ -223,6 +348,295 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_internal_with_filters(hass):
+    """Fire 100k events to 100 listeners of which all but one filter them."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    listeners = 100
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        hass.bus.async_listen(
+            event_name,
+            listener,
+            event_filter=core.callback(lambda data, idx=idx: data["idx"] == idx),
+        )
+    events_data = [{"idx": idx % listeners} for idx in range(events_to_fire)]
+
+    start = timer()
+
+    for event_data in events_data:
+        hass.bus.async_fire_internal(event_name, event_data)
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def fire_events_internal_keyed(hass):
+    """Fire 100k events to 100 listeners keyed by a value of the event data."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    listeners = 100
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        hass.bus.async_listen_keyed(event_name, "idx", str(idx), listener)
+    events_data = [{"idx": str(idx % listeners)} for idx in range(events_to_fire)]
+
+    start = timer()
+
+    for event_data in events_data:
+        hass.bus.async_fire_internal(event_name, event_data)
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def state_machine_set_internal(hass):
+    """Set 100k states of 1000 entities with attributes."""
+    entities = 1000
+    updates = 10**5
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(entities)]
+    attributes = {
+        "friendly_name": "Benchmark",
+        "device_class": "power",
+        "unit_of_measurement": "W",
+    }
+
+    start = timer()
+
+    for idx in range(updates):
+        hass.states.async_set_internal(
+            entity_ids[idx % entities],
+            str(idx),
+            attributes,
+            False,
+            None,
+            None,
+            time.time(),
+        )
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def state_changed_event_fan_out(hass):
+    """Set 100k states of 1000 entities each tracked by 10 listeners."""
+    count = 0
+    entities = 1000
+    listeners_per_entity = 10
+    updates = 10**5
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(entities)]
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for entity_id in entity_ids:
+        for _ in range(listeners_per_entity):
+            async_track_state_change_event(hass, entity_id, listener)
+
+    start = timer()
+
+    for idx in range(updates):
+        hass.states.async_set(entity_ids[idx % entities], str(idx))
+    await hass.async_block_till_done()
+
+    assert count == updates * listeners_per_entity
+
+    return timer() - start
+
+
+@benchmark
+async def track_template_result_rerender(hass):
+    """Re-render 100 tracked templates on 100 changes of the state each uses."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+    from homeassistant.helpers.template import Template
+
+    # pylint: enable=import-outside-toplevel
+
+    count = 0
+    templates = 100
+    rounds = 100
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(templates)]
+
+    @core.callback
+    def listener(*args):
+        """Handle template result change."""
+        nonlocal count
+        count += 1
+
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0")
+        template = Template(f"{{{{ states('{entity_id}') | int + 1 }}}}", hass)
+        async_track_template_result(hass, [TrackTemplate(template, None)], listener)
+    await hass.async_block_till_done()
+    count = 0
+
+    start = timer()
+
+    for idx in range(1, rounds + 1):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(idx))
+        # The templates are rendered with the latest state once they run
+        await hass.async_block_till_done()
+
+    assert count == rounds * templates
+
+    return timer() - start
+
+
+def _state_changed_events(count: int, entities: int) -> list[core.Event]:
+    """Return state_changed events of entities with changing attributes."""
+    events = []
+    for idx in range(count):
+        entity_id = f"sensor.benchmark_{idx % entities}"
+        old_state = core.State(
+            entity_id,
+            str(idx - entities),
+            {"friendly_name": "Benchmark", "value": idx - entities},
+        )
+        new_state = core.State(
+            entity_id, str(idx), {"friendly_name": "Benchmark", "value": idx}
+        )
+        events.append(
+            core.Event(
+                EVENT_STATE_CHANGED,
+                {
+                    "entity_id": entity_id,
+                    "old_state": old_state,
+                    "new_state": new_state,
+                },
+            )
+        )
+    return events
+
+
+@benchmark
+async def websocket_cached_state_diff_message(hass):
+    """Serialize 100k state_changed events for 5 websocket subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.messages import (
+        cached_state_diff_message,
+    )
+
+    events = _state_changed_events(10**5, 1000)
+    message_ids = [str(idx).encode() for idx in range(1, 6)]
+
+    start = timer()
+
+    for event in events:
+        for message_id in message_ids:
+            cached_state_diff_message(message_id, event)
+
+    return timer() - start
+
+
+@benchmark
+async def recorder_process_state_changed_events(hass):
+    """Convert 100k state_changed events into recorder rows."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder.const import SupportedDialect
+    from homeassistant.components.recorder.db_schema import StateAttributes, States
+
+    # pylint: enable=import-outside-toplevel
+
+    events = _state_changed_events(10**5, 1000)
+
+    start = timer()
+
+    for event in events:
+        States.from_event(event)
+        shared_attrs_bytes = StateAttributes.shared_attrs_bytes_from_event(
+            event, SupportedDialect.SQLITE
+        )
+        StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
+
+    return timer() - start
+
+
+@benchmark
+async def recorder_commit_state_changed_events(hass):
+    """Record and commit 10k state changes with the recorder into a SQLite file."""
+    # pylint: disable=import-outside-toplevel
+    from tempfile import TemporaryDirectory
+
+    from homeassistant import config_entries, loader
+    from homeassistant.components import recorder
+    from homeassistant.components.recorder.db_schema import States
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    # pylint: enable=import-outside-toplevel
+
+    rounds = 10
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(1000)]
+
+    with TemporaryDirectory() as tmp_dir:
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        recorder_helper.async_initialize_recorder(hass)
+        db_url = f"sqlite:///{Path(tmp_dir) / 'benchmark.db'}"
+        assert await async_setup_component(
+            hass, recorder.DOMAIN, {recorder.DOMAIN: {recorder.CONF_DB_URL: db_url}}
+        )
+        # The recorder waits for Home Assistant to start before it records
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        assert await instance.async_db_ready
+        await instance.async_block_till_done()
+
+        start = timer()
+
+        for idx in range(rounds):
+            for entity_id in entity_ids:
+                hass.states.async_set(
+                    entity_id, str(idx), {"friendly_name": "Benchmark", "value": idx}
+                )
+        await hass.async_block_till_done()
+        # Wait until the recorder thread has written and committed all states
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+
+        def _count_states() -> int:
+            with session_scope(hass=hass, read_only=True) as session:
+                return session.query(States).count()
+
+        assert await instance.async_add_executor_job(_count_states) == rounds * len(
+            entity_ids
+        )
+
+        # The recorder must close the database before it is removed
+        await hass.async_stop()
+
+    return runtime
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -308,3 +722,235 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 100k MQTT messages against 10k wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.util import TopicTrie
+
+    subscriptions = 10**4
+    messages = 10**5
+    trie = TopicTrie()
+    for idx in range(subscriptions):
+        trie.add(f"zigbee2mqtt/device_{idx}/+", idx)
+    trie.add("zigbee2mqtt/#", -1)
+    topics = [
+        f"zigbee2mqtt/device_{idx % subscriptions}/state" for idx in range(messages)
+    ]
+
+    start = timer()
+    matched = sum(len(trie.matches(topic)) for topic in topics)
+    assert matched == messages * 2
+    return timer() - start
+
+
+def _recorder_insert_states(bulk: bool) -> float:
+    """Insert 100k chained states into a SQLite file and return the runtime."""
+    # pylint: disable=import-outside-toplevel
+    from tempfile import TemporaryDirectory
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_insert import bulk_insert_states
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    # pylint: enable=import-outside-toplevel
+
+    entities = 10**3
+    states_per_entity = 10**2
+    with TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{Path(tmp_dir) / 'benchmark.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            attributes = StateAttributes(shared_attrs="{}", hash=1)
+            metas = [
+                StatesMeta(entity_id=f"sensor.benchmark_{idx}")
+                for idx in range(entities)
+            ]
+            session.add(attributes)
+            session.add_all(metas)
+            session.commit()
+
+            old_state_ids: list[int | None] = [None] * entities
+            start = timer()
+            for _ in range(states_per_entity):
+                # One commit per recorder commit interval, each entity changes once
+                now = time.time()
+                states = [
+                    States(
+                        state="on",
+                        last_updated_ts=now,
+                        old_state_id=old_state_id,
+                        metadata_id=meta.metadata_id,
+                        attributes_id=attributes.attributes_id,
+                    )
+                    for meta, old_state_id in zip(metas, old_state_ids, strict=True)
+                ]
+                if bulk:
+                    bulk_insert_states(session, states)
+                else:
+                    session.add_all(states)
+                session.commit()
+                old_state_ids = [state.state_id for state in states]
+            runtime = timer() - start
+        engine.dispose()
+    return runtime
+
+
+@benchmark
+async def recorder_insert_states_orm(hass):
+    """Insert 100k states into a SQLite file with the ORM."""
+    return await hass.async_add_executor_job(_recorder_insert_states, False)
+
+
+@benchmark
+async def recorder_insert_states_bulk(hass):
+    """Insert 100k states into a SQLite file with multi-row INSERTs."""
+    return await hass.async_add_executor_job(_recorder_insert_states, True)
+
+
+def _sensor_compile_measurements(columnar: bool) -> float:
+    """Compile 5-minute mean, min and max of 2k sensors and return the runtime."""
+    # pylint: disable=import-outside-toplevel
+    from collections import namedtuple
+    from datetime import timedelta
+
+    from homeassistant.components.recorder.history import StateColumns
+    from homeassistant.components.recorder.models import LazyState
+    from homeassistant.components.sensor import recorder as sensor_recorder
+    from homeassistant.util import dt as dt_util
+
+    # pylint: enable=import-outside-toplevel
+
+    entities = 2 * 10**3
+    states_per_entity = 30
+    end = dt_util.utcnow().replace(second=0, microsecond=0)
+    start = end - timedelta(minutes=5)
+    start_ts = start.timestamp()
+    attributes = '{"state_class":"measurement","unit_of_measurement":"W"}'
+    # The history decodes each distinct attributes string once
+    unit_attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+    row_type = namedtuple("row_type", "metadata_id state last_updated_ts attributes")  # noqa: PYI024
+    rows = {
+        f"sensor.benchmark_{idx}": [
+            row_type(idx, str(idx + step / 10), start_ts + step * 10, attributes)
+            for step in range(states_per_entity)
+        ]
+        for idx in range(entities)
+    }
+
+    def time_weighted_average(fstates, start, end):
+        """Calculate the average from State objects like before columns were used."""
+        old_fstate = old_start_time = None
+        accumulated = 0.0
+        for fstate, state in fstates:
+            start_time = max(state.last_updated, start)
+            if old_start_time is None:
+                start = start_time
+            else:
+                accumulated += (
+                    old_fstate * (start_time - old_start_time).total_seconds()
+                )
+            old_fstate = fstate
+            old_start_time = start_time
+        accumulated += old_fstate * (end - old_start_time).total_seconds()
+        return accumulated / (end - start).total_seconds()
+
+    start_us = sensor_recorder._datetime_to_microseconds(start)  # noqa: SLF001
+    end_us = sensor_recorder._datetime_to_microseconds(end)  # noqa: SLF001
+    begin = timer()
+    results = []
+    for entity_id, entity_rows in rows.items():
+        attr_cache: dict = {}
+        if columnar:
+            columns = StateColumns(
+                [row.state for row in entity_rows],
+                [row.last_updated_ts for row in entity_rows],
+                [unit_attributes] * len(entity_rows),
+            )
+            float_columns = sensor_recorder._state_columns_to_float_columns(columns)  # noqa: SLF001
+            values = float_columns.values
+            results.append(
+                (
+                    min(values),
+                    max(values),
+                    sensor_recorder._time_weighted_average(  # noqa: SLF001
+                        values, float_columns.timestamps_us, start_us, end_us
+                    ),
+                )
+            )
+            continue
+        states = [
+            LazyState(row, attr_cache, start_ts, entity_id, row.state, row[2], False)
+            for row in entity_rows
+        ]
+        fstates = sensor_recorder._entity_history_to_float_and_state(states)  # noqa: SLF001
+        units = {state.attributes.get("unit_of_measurement") for _, state in fstates}
+        assert len(units) == 1
+        values = [fstate for fstate, _ in fstates]
+        results.append(
+            (min(values), max(values), time_weighted_average(fstates, start, end))
+        )
+    assert len(results) == entities
+    return timer() - begin
+
+
+@benchmark
+async def sensor_compile_measurements_states(hass):
+    """Compile statistics of 2k measurement sensors from State objects."""
+    return _sensor_compile_measurements(False)
+
+
+@benchmark
+async def sensor_compile_measurements_columns(hass):
+    """Compile statistics of 2k measurement sensors from state columns."""
+    return _sensor_compile_measurements(True)
+
+
+def _template_compile(hass: core.HomeAssistant, bytecode_cached: bool) -> float:
+    """Compile 2k templates in a fresh environment, like at startup."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from homeassistant.helpers import template
+
+    sources = [
+        f"{{% set value = states('sensor.benchmark_{i}') | float(0) %}}"
+        f"{{% if value > {i} and is_state('switch.benchmark_{i}', 'on') %}}"
+        f"{{{{ (value * 1.8 + 32) | round(1) }}}}"
+        f"{{% elif state_attr('sensor.benchmark_{i}', 'unit') == '°F' %}}"
+        f"{{{{ value | round(1) }}}}"
+        "{% else %}{{ iif(value, 'unknown', 'off') }}{% endif %}"
+        for i in range(2000)
+    ]
+    if bytecode_cached:
+        # Fill the cache like the previous run before the restart did
+        bytecode_cache = template.TemplateBytecodeCache(hass)
+        hass.data[template._BYTECODE_CACHE] = bytecode_cache  # noqa: SLF001
+        environment = template.TemplateEnvironment(hass)
+        for source in sources:
+            environment.compile(source)
+
+    environment = template.TemplateEnvironment(hass)
+    start = timer()
+    for source in sources:
+        environment.compile(source)
+    return timer() - start
+
+
+@benchmark
+async def template_compile(hass):
+    """Compile 2k templates without the bytecode cache."""
+    return _template_compile(hass, False)
+
+
+@benchmark
+async def template_compile_bytecode_cached(hass):
+    """Compile 2k templates with the bytecode of the previous run."""
+    return _template_compile(hass, True)
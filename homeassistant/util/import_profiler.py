@@ -0,0 +1,188 @@
+"""Profile the wall and CPU time spent importing modules."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import importlib.abc
+import importlib.machinery
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any
+
+INTEGRATION_PACKAGES = ("homeassistant.components.", "custom_components.")
+
+
+@dataclass(slots=True)
+class ImportTiming:
+    """Timing of a single module import.
+
+    The wall and cpu times include the time spent importing the modules
+    imported by this module, the self times do not.
+    """
+
+    module: str
+    parent: str | None
+    thread: str
+    wall: float = 0
+    cpu: float = 0
+    self_wall: float = 0
+    self_cpu: float = 0
+    children_wall: float = field(default=0, repr=False)
+    children_cpu: float = field(default=0, repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the timing."""
+        return {
+            "module": self.module,
+            "parent": self.parent,
+            "thread": self.thread,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "self_wall": self.self_wall,
+            "self_cpu": self.self_cpu,
+        }
+
+
+def _integration_key(module: str) -> str:
+    """Return the integration or platform a module belongs to.
+
+    Modules outside of integrations are attributed to their top level package.
+    """
+    for package in INTEGRATION_PACKAGES:
+        if module.startswith(package):
+            return ".".join(module.removeprefix(package).split(".")[:2])
+    return module.partition(".")[0]
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """Record the time spent executing every module imported while started.
+
+    The profiler is installed as the first finder of sys.meta_path. It finds
+    the spec with the other finders and times the exec_module call of its
+    loader, so imports done by importlib.import_module, import statements and
+    imports in executor threads are all recorded, including the transitive
+    imports of third party libraries. The cpu time is the time of the
+    importing thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.timings: list[ImportTiming] = []
+
+    @property
+    def started(self) -> bool:
+        """Return if the profiler is recording imports."""
+        return self in sys.meta_path
+
+    def start(self) -> None:
+        """Start recording imports."""
+        if not self.started:
+            sys.meta_path.insert(0, self)
+
+    def stop(self) -> None:
+        """Stop recording imports."""
+        if self.started:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> importlib.machinery.ModuleSpec | None:
+        """Find the spec with the other finders and time its loader."""
+        local = self._local
+        if getattr(local, "finding", False):
+            return None
+        local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                if (spec := finder.find_spec(fullname, path, target)) is not None:
+                    break
+            else:
+                return None
+        finally:
+            local.finding = False
+
+        loader = spec.loader
+        # Loaders which are classes, like the builtin and frozen importers,
+        # are shared between all modules and can not be wrapped.
+        if (
+            loader is None
+            or isinstance(loader, type)
+            or not hasattr(loader, "exec_module")
+            or not hasattr(loader, "__dict__")
+        ):
+            return spec
+
+        exec_module = loader.exec_module
+
+        def _timed_exec_module(module: ModuleType) -> None:
+            """Execute the module and record the time it took."""
+            del loader.exec_module
+            self._exec_module(exec_module, module)
+
+        loader.exec_module = _timed_exec_module  # type: ignore[method-assign]
+        return spec
+
+    def _exec_module(self, exec_module: Any, module: ModuleType) -> None:
+        """Execute a module and record its timing."""
+        local = self._local
+        if (stack := getattr(local, "stack", None)) is None:
+            stack = local.stack = []
+        timing = ImportTiming(
+            module.__name__,
+            stack[-1].module if stack else None,
+            threading.current_thread().name,
+        )
+        stack.append(timing)
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            exec_module(module)
+        finally:
+            timing.wall = time.perf_counter() - start_wall
+            timing.cpu = time.thread_time() - start_cpu
+            timing.self_wall = timing.wall - timing.children_wall
+            timing.self_cpu = timing.cpu - timing.children_cpu
+            stack.pop()
+            if stack:
+                stack[-1].children_wall += timing.wall
+                stack[-1].children_cpu += timing.cpu
+            with self._lock:
+                self.timings.append(timing)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the recorded timings.
+
+        The integrations are the integrations and platforms imported by the
+        loader with the time of their transitive imports, the modules are
+        every imported module. Both are sorted by their wall time.
+        """
+        with self._lock:
+            timings = sorted(self.timings, key=lambda timing: -timing.wall)
+        integrations: defaultdict[str, dict[str, float]] = defaultdict(
+            lambda: {"wall": 0, "cpu": 0}
+        )
+        for timing in timings:
+            if timing.parent is None:
+                integration = integrations[_integration_key(timing.module)]
+                integration["wall"] += timing.wall
+                integration["cpu"] += timing.cpu
+        return {
+            "integrations": [
+                {"name": name, **integration}
+                for name, integration in sorted(
+                    integrations.items(), key=lambda item: -item[1]["wall"]
+                )
+            ],
+            "modules": [timing.as_dict() for timing in timings],
+        }
@@ -1322,6 +1322,8 @@ def mock_storage(data: dict[str, Any] | None = None) -> Generator[dict[str, Any]
     Data is a dict {'key': {'version': version, 'data': data}}
 
     Written data will be converted to JSON to ensure JSON parsing works.
+
+    The restore state journal is kept as the appended bytes under its key.
     """
     if data is None:
         data = {}
@@ -1376,6 +1378,20 @@ def mock_storage(data: dict[str, Any] | None = None) -> Generator[dict[str, Any]
         """Remove data."""
         data.pop(store.key, None)
 
+    def mock_read_journal(journal: rs.RestoreStateJournal) -> list[dict[str, Any]]:
+        """Mock version of reading the restore state journal."""
+        return [json_loads(line) for line in data.get(journal.key, b"").splitlines()]
+
+    def mock_append_journal(
+        journal: rs.RestoreStateJournal, journal_data: bytes
+    ) -> None:
+        """Mock version of appending to the restore state journal."""
+        data[journal.key] = data.get(journal.key, b"") + journal_data
+
+    def mock_remove_journal(journal: rs.RestoreStateJournal) -> None:
+        """Mock version of removing the restore state journal."""
+        data.pop(journal.key, None)
+
     with (
         patch(
             "homeassistant.helpers.storage.Store._async_load",
@@ -1392,6 +1408,24 @@ def mock_storage(data: dict[str, Any] | None = None) -> Generator[dict[str, Any]
             side_effect=mock_remove,
             autospec=True,
         ),
+        patch.object(
+            rs.RestoreStateJournal,
+            "_read",
+            side_effect=mock_read_journal,
+            autospec=True,
+        ),
+        patch.object(
+            rs.RestoreStateJournal,
+            "_append",
+            side_effect=mock_append_journal,
+            autospec=True,
+        ),
+        patch.object(
+            rs.RestoreStateJournal,
+            "_remove",
+            side_effect=mock_remove_journal,
+            autospec=True,
+        ),
     ):
         yield data
 
@@ -7,6 +7,8 @@ from turbojpeg import TurboJPEG
 
 from homeassistant.components.camera import Image
 from homeassistant.components.camera.img_util import (
+    MAX_SCALED_IMAGES,
+    ScaledJpegCache,
     TurboJPEGSingleton,
     find_supported_scaling_factor,
     scale_jpeg_camera_image,
@@ -82,6 +84,35 @@ def test_scale_jpeg_camera_image() -> None:
     assert jpeg_bytes == EMPTY_16_12_JPEG
 
 
+def test_scaled_jpeg_cache() -> None:
+    """Test the scaled images are cached until the camera image changes."""
+    cache = ScaledJpegCache()
+    with patch(
+        "homeassistant.components.camera.img_util.scale_jpeg_camera_image",
+        side_effect=lambda image, width, height: f"{width}x{height}".encode(),
+    ) as mock_scale:
+        camera_image = Image("image/jpeg", EMPTY_16_12_JPEG)
+        assert cache.scale(camera_image, 8, 6) == b"8x6"
+        assert cache.scale(camera_image, 4, 3) == b"4x3"
+        assert cache.scale(Image("image/jpeg", EMPTY_16_12_JPEG), 8, 6) == b"8x6"
+        assert mock_scale.call_count == 2
+
+        assert cache.scale(Image("image/jpeg", EMPTY_8_6_JPEG), 8, 6) == b"8x6"
+        assert mock_scale.call_count == 3
+
+        # Only the most recently requested sizes are kept
+        camera_image = Image("image/jpeg", EMPTY_8_6_JPEG)
+        for width in range(MAX_SCALED_IMAGES):
+            cache.scale(camera_image, width, 1)
+        mock_scale.reset_mock()
+        assert cache.scale(camera_image, MAX_SCALED_IMAGES - 1, 1) == (
+            f"{MAX_SCALED_IMAGES - 1}x1".encode()
+        )
+        assert mock_scale.call_count == 0
+        assert cache.scale(camera_image, 8, 6) == b"8x6"
+        assert mock_scale.call_count == 1
+
+
 def test_turbojpeg_load_failure() -> None:
     """Handle libjpegturbo not being installed."""
     _clear_turbojpeg_singleton()
@@ -5,11 +5,14 @@ from datetime import timedelta
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -427,6 +430,133 @@ async def test_history_during_period_bad_start_time(
     assert response["error"]["code"] == "invalid_start_time"
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+async def test_history_during_period_chunked(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    minimal_response: bool,
+) -> None:
+    """Test history_during_period sends the same states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for i in range(7):
+        hass.states.async_set("sensor.one", str(i), attributes={"any": i})
+        hass.states.async_set("sensor.two", str(i % 2), attributes={"any": i})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "significant_changes_only": False,
+        "minimal_response": minimal_response,
+    }
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, **request})
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["sensor.one"]) == 7
+
+    with patch.object(websocket_api, "HISTORY_CHUNK_SIZE", 3):
+        await client.send_json({"id": 2, "chunked": True, **request})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 2
+        assert response["result"] is None
+
+        states: dict[str, list[dict]] = {}
+        chunks = 0
+        while not (response := await client.receive_json())["event"].get("done"):
+            assert response["id"] == 2
+            assert response["type"] == "event"
+            assert sum(map(len, response["event"]["states"].values())) <= 4
+            for entity_id, chunk in response["event"]["states"].items():
+                states.setdefault(entity_id, []).extend(chunk)
+            chunks += 1
+
+    assert chunks > 2
+    assert states == expected
+
+
+async def test_history_during_period_chunked_waits_until_sent(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the next chunk is only read once the previous chunk was sent."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for i in range(7):
+        hass.states.async_set("sensor.one", str(i))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    sent_futures: list[asyncio.Future[None]] = []
+
+    def _wait_sent(connection: ActiveConnection) -> asyncio.Future[None]:
+        sent_futures.append(hass.loop.create_future())
+        return sent_futures[-1]
+
+    client = await hass_ws_client()
+    with (
+        patch.object(websocket_api, "HISTORY_CHUNK_SIZE", 3),
+        patch.object(ActiveConnection, "async_wait_sent", _wait_sent),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        states = []
+        while not (response := await client.receive_json())["event"].get("done"):
+            states.extend(response["event"]["states"]["sensor.one"])
+            # The executor waits until the chunk was sent before reading on
+            assert len(sent_futures) == len(states) // 3 + bool(len(states) % 3)
+            sent_futures[-1].set_result(None)
+
+    assert [state["s"] for state in states] == [str(i) for i in range(7)]
+    assert len(sent_futures) == 3
+
+
+async def test_history_during_period_chunked_impossible_conditions(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test chunked history_during_period is done when condition cannot be true."""
+    await async_setup_component(hass, "history", {})
+    future = dt_util.utcnow() + timedelta(hours=10)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": future.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response == {"id": 1, "type": "event", "event": {"done": True}}
+
+
 async def test_history_during_period_bad_end_time(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2154,3 +2284,104 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+@pytest.mark.parametrize("include_start_time_state", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+async def test_history_during_period_cache(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test history_during_period answered from the cache matches the database."""
+    entity_ids = ["sensor.test", "climate.test", "light.test"]
+    hass.states.async_set("light.test", "on", attributes={"brightness": 1})
+    freezer.tick(1)
+    await async_setup_component(
+        hass, "history", {"history": {"cache": {"max_states": 4}}}
+    )
+    cache = hass.data[history.DATA_HISTORY_CACHE]
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow()
+    for state, attributes in (
+        ("on", {"any": "attr"}),
+        ("off", {"any": "attr"}),
+        ("off", {"any": "changed", "restored": True}),
+        ("off", {"any": "again"}),
+        ("on", {"any": "again"}),
+        ("on", {"any": "last"}),
+    ):
+        freezer.tick(1)
+        hass.states.async_set("sensor.test", state, attributes)
+        hass.states.async_set("climate.test", state, attributes)
+        await async_recorder_block_till_done(hass)
+    freezer.tick(1)
+    hass.states.async_remove("light.test")
+    freezer.tick(1)
+    hass.states.async_set("light.test", "off")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    for msg_id, start_time, end_time in (
+        (1, start, None),
+        (2, start + timedelta(seconds=2), None),
+        (3, start + timedelta(seconds=3), start + timedelta(seconds=6)),
+        (4, start + timedelta(seconds=4), None),
+        (5, start + timedelta(seconds=4, milliseconds=500), None),
+    ):
+        expected = await recorder_mock.async_add_executor_job(
+            get_significant_states,
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+        msg = {
+            "id": msg_id,
+            "type": "history/history_during_period",
+            "start_time": start_time.isoformat(),
+            "entity_ids": entity_ids,
+            "include_start_time_state": include_start_time_state,
+            "significant_changes_only": significant_changes_only,
+            "minimal_response": minimal_response,
+            "no_attributes": no_attributes,
+        }
+        if end_time:
+            msg["end_time"] = end_time.isoformat()
+        await client.send_json(msg)
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] == expected
+
+    # The first states of the sensors were dropped from the cache, so the
+    # periods starting before the first cached state are partial hits
+    partial_hits = 3 if include_start_time_state else 2
+    assert cache.partial_hits == partial_hits
+    assert cache.hits == 5 - partial_hits
+    assert cache.misses == 0
+
+    await client.send_json(
+        {
+            "id": 6,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.unknown"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {}
+    assert cache.misses == 1
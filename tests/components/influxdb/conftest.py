@@ -0,0 +1,51 @@
+"""Fixtures for the InfluxDB tests."""
+
+from collections.abc import Callable
+from http import HTTPStatus
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+
+class FakeInfluxServer:
+    """Stand-in for the write endpoints of the V1 and V2 InfluxDB APIs."""
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.available = True
+        self.port: int | None = None
+        self.requests = 0
+        self.lines: list[bytes] = []
+
+    async def write(self, request: web.Request) -> web.Response:
+        """Accept written line protocol."""
+        if not self.available:
+            return web.Response(status=HTTPStatus.SERVICE_UNAVAILABLE)
+        body = await request.read()
+        if not body:
+            if request.path == "/api/v2/write":
+                # The V2 API refuses empty writes, which setup uses as a test
+                return web.json_response(
+                    {"code": "invalid", "message": "no points"},
+                    status=HTTPStatus.BAD_REQUEST,
+                )
+            return web.Response(status=HTTPStatus.NO_CONTENT)
+        self.requests += 1
+        self.lines.extend(body.splitlines())
+        return web.Response(status=HTTPStatus.NO_CONTENT)
+
+
+@pytest.fixture
+async def influx_server(
+    aiohttp_server: Callable[[web.Application], TestServer],
+    socket_enabled: None,
+) -> FakeInfluxServer:
+    """Return a local stand-in InfluxDB server."""
+    server = FakeInfluxServer()
+    app = web.Application()
+    app.router.add_post("/write", server.write)
+    app.router.add_post("/api/v2/write", server.write)
+    test_server = await aiohttp_server(app)
+    server.port = test_server.port
+    return server
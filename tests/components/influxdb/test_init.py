@@ -5,16 +5,29 @@ from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+from pathlib import Path
+import re
+from typing import Any
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 
 from homeassistant.components import influxdb
-from homeassistant.components.influxdb.const import DEFAULT_BUCKET
+from homeassistant.components.influxdb.const import (
+    BATCH_BUFFER_SIZE,
+    BATCH_BUFFER_SIZE_MAX,
+    BATCH_TIMEOUT,
+    BATCH_TIMEOUT_MAX,
+    DEFAULT_BUCKET,
+    DEFAULT_DATABASE,
+)
+from homeassistant.components.influxdb.spool import InfluxSpool
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.setup import async_setup_component
 
+from .conftest import FakeInfluxServer
+
 INFLUX_PATH = "homeassistant.components.influxdb"
 INFLUX_CLIENT_PATH = f"{INFLUX_PATH}.InfluxDBClient"
 BASE_V1_CONFIG = {}
@@ -42,6 +55,12 @@ class FilterTest:
     should_pass: bool
 
 
+@pytest.fixture(autouse=True)
+def mock_config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Keep the spool in a temporary directory."""
+    hass.config.config_dir = str(tmp_path)
+
+
 @pytest.fixture(autouse=True)
 def mock_batch_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
     """Mock the event bus listener and the batch timeout for tests."""
@@ -65,12 +84,90 @@ def mock_client_fixture(
         yield client
 
 
+def _split_line(text: str, separator: str) -> list[str]:
+    """Split line protocol on separators which are not escaped or quoted."""
+    parts = [""]
+    quoted = escaped = False
+    for char in text:
+        if char == separator and not quoted and not escaped:
+            parts.append("")
+            continue
+        parts[-1] += char
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+    return parts
+
+
+def _unescape(text: str) -> str:
+    """Unescape an element of line protocol."""
+    return re.sub(r"\\(.)", lambda match: {"n": "\n"}.get(match[1], match[1]), text)
+
+
+def parse_lines(data: bytes) -> list[dict[str, Any]]:
+    """Parse line protocol into points in the format of the json API."""
+    points = []
+    for line in data.decode().split("\n")[:-1]:
+        series, fields, timestamp = _split_line(line, " ")
+        measurement, *tags = _split_line(series, ",")
+        point: dict[str, Any] = {
+            "measurement": _unescape(measurement),
+            "tags": {},
+            "time": int(timestamp),
+            "fields": {},
+        }
+        for tag in tags:
+            key, value = _split_line(tag, "=")
+            point["tags"][_unescape(key)] = _unescape(value)
+        for field in _split_line(fields, ","):
+            key, value = _split_line(field, "=")
+            point["fields"][_unescape(key)] = (
+                _unescape(value[1:-1]) if value.startswith('"') else float(value)
+            )
+        points.append(point)
+    return points
+
+
+class LineProtocol:
+    """Compare written line protocol with the points it should encode."""
+
+    def __init__(self, points: list[dict[str, Any]]) -> None:
+        """Initialize the matcher."""
+        self.points = points
+
+    def __eq__(self, other: object) -> bool:
+        """Return if the line protocol encodes the points."""
+        return isinstance(other, bytes) and parse_lines(other) == self.points
+
+    def __repr__(self) -> str:
+        """Return the representation of the points."""
+        return f"LineProtocol({self.points!r})"
+
+
 @pytest.fixture(name="get_mock_call")
 def get_mock_call_fixture(request: pytest.FixtureRequest):
     """Get version specific lambda to make write API call mock."""
 
+    def v1_call(body, precision):
+        params = {"db": DEFAULT_DATABASE}
+
+        if precision is not None:
+            params["precision"] = {"ns": "n", "us": "u"}.get(precision, precision)
+
+        return call(
+            url="write",
+            method="POST",
+            params=params,
+            data=LineProtocol(body),
+            expected_response_code=204,
+            headers=ANY,
+        )
+
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": LineProtocol(body)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -79,12 +176,12 @@ def get_mock_call_fixture(request: pytest.FixtureRequest):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: v1_call(body, precision)
 
 
 def _get_write_api_mock_v1(mock_influx_client):
     """Return the write api mock for the V1 client."""
-    return mock_influx_client.return_value.write_points
+    return mock_influx_client.return_value.request
 
 
 def _get_write_api_mock_v2(mock_influx_client):
@@ -1408,7 +1505,7 @@ async def test_event_listener_scheduled_write(
 async def test_event_listener_backlog_full(
     hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
 ) -> None:
-    """Test the event listener drops old events when backlog gets full."""
+    """Test the event listener spools old events when backlog gets full."""
     await _setup(hass, mock_client, config_ext, get_write_api)
 
     monotonic_time = 0
@@ -1419,12 +1516,277 @@ async def test_event_listener_backlog_full(
         monotonic_time += 60
         return monotonic_time
 
+    body = [
+        {
+            "measurement": "entity.id",
+            "tags": {"domain": "entity", "entity_id": "id"},
+            "time": ANY,
+            "fields": {"value": 1},
+        }
+    ]
     with patch("homeassistant.components.influxdb.time.monotonic", new=fast_monotonic):
         hass.states.async_set("entity.id", 1)
         await hass.async_block_till_done()
         await async_wait_for_queue_to_process(hass)
 
-        assert get_write_api(mock_client).call_count == 0
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == get_mock_call(body)
+    assert not hass.data[influxdb.DOMAIN].spool
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_spool(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api, get_mock_call
+) -> None:
+    """Test events are spooled while influx is down and backfilled later."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    write_api = get_write_api(mock_client)
+    write_api.side_effect = OSError("foo")
+    spool = hass.data[influxdb.DOMAIN].spool
+
+    def point(entity_id: str, value: float) -> dict[str, Any]:
+        return {
+            "measurement": f"fake.{entity_id}",
+            "tags": {"domain": "fake", "entity_id": entity_id},
+            "time": ANY,
+            "fields": {"value": value},
+        }
+
+    hass.states.async_set("fake.first", 1)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 1
+    assert spool
+    assert Path(spool.path).exists()
+
+    # Spooled events are not written again until there are new events
+    await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 1
+
+    hass.states.async_set("fake.second", 2)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 2
+    assert write_api.call_args == get_mock_call([point("first", 1), point("second", 2)])
+
+    write_api.side_effect = None
+    hass.states.async_set("fake.third", 3)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    assert write_api.call_count == 3
+    assert write_api.call_args == get_mock_call(
+        [point("first", 1), point("second", 2), point("third", 3)]
+    )
+    assert not spool
+    assert not Path(spool.path).exists()
+
+
+def test_spool_load(tmp_path: Path) -> None:
+    """Test the spool picks up lines from before a restart."""
+    path = tmp_path / "spool"
+    path.write_bytes(b"a value=1 1\nb value=2 2\nc val")
+    spool = InfluxSpool(str(path), 1000)
+    spool.load()
+    assert path.read_bytes() == b"a value=1 1\nb value=2 2\n"
+
+    assert spool.read(5) == b"a value=1 1\n"
+    spool.consume(12)
+    assert spool.read(100) == b"b value=2 2\n"
+    assert spool.append([b"c value=3 3\n"])
+    assert not spool.append([b"d value=4 4\n" * 100])
+    assert spool.read(100) == b"b value=2 2\nc value=3 3\n"
+    spool.consume(24)
+    assert not spool
+    assert not path.exists()
+
+    spool.load()
+    assert not spool
+
+
+def test_json_to_line_escaping() -> None:
+    """Test names of any type are converted and escaped in line protocol."""
+    line = influxdb._json_to_line(
+        {
+            "measurement": 42,
+            "tags": {"path": "C:\\temp, now", 3: ["a", "b"], "empty": ""},
+            "fields": {"back\\slash": 1, "text": 'say "hi"\\'},
+        },
+        1,
+    )
+    assert line == (
+        b"42,3=['a'\\,\\ 'b'],path=C:\\\\temp\\,\\ now "
+        b'back\\\\slash=1.0,text="say \\"hi\\"\\\\" 1\n'
+    )
+    assert parse_lines(line) == [
+        {
+            "measurement": "42",
+            "tags": {"3": "['a', 'b']", "path": "C:\\temp, now"},
+            "time": 1,
+            "fields": {"back\\slash": 1.0, "text": 'say "hi"\\'},
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api", "get_mock_call"),
+    [
+        (
+            influxdb.DEFAULT_API_VERSION,
+            BASE_V1_CONFIG,
+            _get_write_api_mock_v1,
+            influxdb.DEFAULT_API_VERSION,
+        ),
+        (
+            influxdb.API_VERSION_2,
+            BASE_V2_CONFIG,
+            _get_write_api_mock_v2,
+            influxdb.API_VERSION_2,
+        ),
+    ],
+    indirect=["mock_client", "get_mock_call"],
+)
+async def test_event_listener_conversion_error(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+    mock_client,
+    config_ext,
+    get_write_api,
+    get_mock_call,
+) -> None:
+    """Test an event which fails to convert does not stop the writer."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+    event_to_line = instance.event_to_line
+
+    def failing_event_to_line(event):
+        if event.data["entity_id"] == "fake.broken":
+            raise ValueError("broken")
+        return event_to_line(event)
+
+    instance.event_to_line = failing_event_to_line
+    hass.states.async_set("fake.broken", 1)
+    hass.states.async_set("fake.working", 2)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+
+    assert "Error converting event" in caplog.text
+    write_api = get_write_api(mock_client)
+    assert write_api.call_count == 1
+    assert write_api.call_args == get_mock_call(
+        [
+            {
+                "measurement": "fake.working",
+                "tags": {"domain": "fake", "entity_id": "working"},
+                "time": ANY,
+                "fields": {"value": 2},
+            }
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    ("mock_client", "config_ext", "get_write_api"),
+    [
+        (influxdb.DEFAULT_API_VERSION, BASE_V1_CONFIG, _get_write_api_mock_v1),
+        (influxdb.API_VERSION_2, BASE_V2_CONFIG, _get_write_api_mock_v2),
+    ],
+    indirect=["mock_client"],
+)
+async def test_adaptive_batching(
+    hass: HomeAssistant, mock_client, config_ext, get_write_api
+) -> None:
+    """Test the batch size and flush interval adapt to the write duration."""
+    await _setup(hass, mock_client, config_ext, get_write_api)
+    instance = hass.data[influxdb.DOMAIN]
+    assert instance.batch_size == BATCH_BUFFER_SIZE
+
+    instance.adapt_batching(BATCH_BUFFER_SIZE, 0.1)
+    assert instance.batch_size == BATCH_BUFFER_SIZE * 2
+    assert instance.flush_interval == BATCH_TIMEOUT
+
+    instance.adapt_batching(10, 0.1)
+    assert instance.batch_size == BATCH_BUFFER_SIZE * 2
+
+    for _ in range(10):
+        instance.adapt_batching(instance.batch_size, 0.1)
+    assert instance.batch_size == BATCH_BUFFER_SIZE_MAX
+
+    instance.adapt_batching(instance.batch_size, 5)
+    assert instance.batch_size == BATCH_BUFFER_SIZE_MAX // 2
+    assert instance.flush_interval == 5
+
+    for _ in range(10):
+        instance.adapt_batching(instance.batch_size, 60)
+    assert instance.batch_size == BATCH_BUFFER_SIZE
+    assert instance.flush_interval == BATCH_TIMEOUT_MAX
+
+
+@pytest.mark.parametrize(
+    "config_ext",
+    [
+        {},
+        {"api_version": influxdb.API_VERSION_2, "ssl": False, **BASE_V2_CONFIG},
+    ],
+)
+async def test_write_to_server(
+    hass: HomeAssistant, influx_server: FakeInfluxServer, config_ext
+) -> None:
+    """Test writing many events to a server which goes down for a while."""
+    config = {"host": "127.0.0.1", "port": influx_server.port, **config_ext}
+    assert await async_setup_component(hass, influxdb.DOMAIN, {"influxdb": config})
+    await hass.async_block_till_done()
+
+    for value in range(500):
+        hass.states.async_set("fake.up", value)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    assert len(influx_server.lines) == 500
+    assert influx_server.requests < 500
+
+    influx_server.available = False
+    for value in range(500):
+        hass.states.async_set("fake.down", value, {"attribute": 'a,b c="d"'})
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    assert len(influx_server.lines) == 500
+
+    influx_server.available = True
+    requests = influx_server.requests
+    hass.states.async_set("fake.up", 500)
+    await hass.async_block_till_done()
+    await async_wait_for_queue_to_process(hass)
+    assert influx_server.requests == requests + 1
+
+    points = parse_lines(b"\n".join([*influx_server.lines, b""]))
+    assert [point["fields"]["value"] for point in points] == [
+        *range(500),
+        *range(500),
+        500,
+    ]
+    assert points[500]["fields"]["attribute_str"] == 'a,b c="d"'
+    assert [point["time"] for point in points] == sorted(
+        point["time"] for point in points
+    )
+
+    await hass.async_stop()
 
 
 @pytest.mark.parametrize(
@@ -4,10 +4,11 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
 from homeassistant.components import logbook, recorder
@@ -16,6 +17,7 @@ from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
+from homeassistant.components.logbook.queries.context import context_origins_stmt
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
@@ -2964,6 +2966,85 @@ async def test_get_events_with_context_state(
     assert "context_event_type" not in results[3]
 
 
+@pytest.mark.usefixtures("recorder_mock")
+@pytest.mark.parametrize("max_bind_vars", [None, 2])
+async def test_get_events_entity_context_origins(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, max_bind_vars: int | None
+) -> None:
+    """Test the context origins of an entity are found outside of its rows."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    hass.states.async_set("switch.heater", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await hass.async_block_till_done()
+
+    service_context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVAAA",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "switch", ATTR_SERVICE: "turn_on"},
+        context=service_context,
+    )
+    hass.states.async_set("switch.heater", STATE_ON, context=service_context)
+    await hass.async_block_till_done()
+    child_context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVDDD", parent_id=service_context.id
+    )
+    hass.states.async_set("light.kitchen", STATE_ON, context=child_context)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    instance = recorder.get_instance(hass)
+    chunk_sizes: list[int] = []
+
+    def _context_origins_stmt(context_ids_bin: list[bytes]) -> StatementLambdaElement:
+        chunk_sizes.append(len(context_ids_bin))
+        return context_origins_stmt(context_ids_bin)
+
+    client = await hass_ws_client()
+    with (
+        patch.object(
+            instance, "max_bind_vars", max_bind_vars or instance.max_bind_vars
+        ),
+        patch(
+            "homeassistant.components.logbook.processor.context_origins_stmt",
+            _context_origins_stmt,
+        ),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "entity_ids": ["light.kitchen"],
+            }
+        )
+        response = await client.receive_json()
+    assert response["success"]
+    # The context ids are bound twice per statement
+    assert sum(chunk_sizes) == 2
+    assert all(size * 2 <= instance.max_bind_vars for size in chunk_sizes)
+    if max_bind_vars:
+        assert chunk_sizes == [1, 1]
+    results = response["result"]
+    assert len(results) == 1
+    assert results[0]["entity_id"] == "light.kitchen"
+    assert results[0]["state"] == "on"
+    assert results[0]["context_event_type"] == "call_service"
+    assert results[0]["context_domain"] == "switch"
+    assert results[0]["context_service"] == "turn_on"
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_logbook_with_empty_config(hass: HomeAssistant) -> None:
     """Test we handle a empty configuration."""
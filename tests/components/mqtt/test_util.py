@@ -13,7 +13,7 @@ import pytest
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt.models import MessageCallbackType
-from homeassistant.components.mqtt.util import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.util import EnsureJobAfterCooldown, TopicTrie
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
@@ -102,6 +102,66 @@ async def test_canceling_debouncer_throws(
         await hass.async_block_till_done()
 
 
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        (
+            "home/kitchen/light",
+            {"exact", "single", "multi", "root", "double", "multi_sub"},
+        ),
+        ("home/kitchen", {"multi", "root"}),
+        ("home", {"multi", "root"}),
+        ("home/kitchen/light/state", {"multi", "root", "multi_sub"}),
+        ("home/bedroom/light", {"single", "multi", "root", "double"}),
+        ("office/kitchen/light", {"root", "double"}),
+        ("$SYS/broker/uptime", {"sys"}),
+        ("home/+/light", {"single", "multi", "root", "double"}),
+        ("home/#", {"multi", "root"}),
+    ],
+)
+def test_topic_trie_matches(topic: str, expected: set[str]) -> None:
+    """Test matching topics against the topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("home/kitchen/light", "exact")
+    trie.add("home/+/light", "single")
+    trie.add("home/#", "multi")
+    trie.add("home/kitchen/light/#", "multi_sub")
+    trie.add("#", "root")
+    trie.add("+/+/light", "double")
+    trie.add("$SYS/#", "sys")
+
+    matches = trie.matches(topic)
+    assert len(matches) == len(expected)
+    assert set(matches) == expected
+
+
+def test_topic_trie_add_remove() -> None:
+    """Test adding and removing values from the topic trie."""
+    trie: TopicTrie[str] = TopicTrie()
+    assert "home/+/light" not in trie
+
+    trie.add("home/+/light", "one")
+    trie.add("home/+/light", "two")
+    trie.add("home/+/switch", "three")
+    assert "home/+/light" in trie
+    assert "home/+" not in trie
+    assert set(trie.matches("home/kitchen/light")) == {"one", "two"}
+
+    trie.remove("home/+/light", "one")
+    assert trie.matches("home/kitchen/light") == ["two"]
+
+    trie.remove("home/+/light", "two")
+    assert "home/+/light" not in trie
+    assert trie.matches("home/kitchen/light") == []
+    assert trie.matches("home/kitchen/switch") == ["three"]
+
+    with pytest.raises(KeyError):
+        trie.remove("home/+/light", "two")
+
+    trie.remove("home/+/switch", "three")
+    assert trie._root.children == {}
+
+
 async def help_create_test_certificate_file(
     hass: HomeAssistant,
     mock_temp_dir: str,
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 import datetime
+import gzip
 from http import HTTPStatus
 from typing import Any
 from unittest import mock
@@ -50,6 +51,12 @@ from homeassistant.components.fan import (
     DIRECTION_REVERSE,
 )
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES
+from homeassistant.components.prometheus.exposition import (
+    Counter,
+    Gauge,
+    MetricFamily,
+    MetricsExposition,
+)
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
@@ -1284,6 +1291,116 @@ async def test_entity_becomes_unavailable_with_export(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_exposition_renders_changed_entities(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test a scrape only renders the entities which changed."""
+    await generate_latest_metrics(client)
+
+    with mock.patch.object(
+        MetricFamily,
+        "_render_entity",
+        autospec=True,
+        side_effect=MetricFamily._render_entity,
+    ) as mock_render_entity:
+        body = await generate_latest_metrics(client)
+        assert not mock_render_entity.called
+
+        set_state_with_entry(hass, sensor_entities["sensor_2"], 55.0)
+        await hass.async_block_till_done()
+        body = await generate_latest_metrics(client)
+
+    assert {call.args[1] for call in mock_render_entity.mock_calls} == {
+        "sensor.outside_humidity"
+    }
+    assert (
+        'sensor_humidity_percent{domain="sensor",'
+        'entity="sensor.outside_humidity",'
+        'friendly_name="Outside Humidity"} 55.0' in body
+    )
+    assert (
+        'sensor_temperature_celsius{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+
+
+@pytest.mark.parametrize("namespace", [""])
+async def test_gzip_exposition(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test the exposition is the same with and without gzip."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert "Content-Encoding" not in resp.headers
+    plain = (await resp.text()).split("\n")
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    compressed = (await resp.text()).split("\n")
+
+    # The process metrics change between scrapes
+    def _ha_metrics(body: list[str]) -> list[str]:
+        return [line for line in body if "entity=" in line and "_created" not in line]
+
+    assert _ha_metrics(plain)
+    assert _ha_metrics(plain) == _ha_metrics(compressed)
+    assert "# HELP python_info Python platform information" in compressed
+
+
+def test_exposition_gzip() -> None:
+    """Test the cached deflated metrics are joined into a valid gzip member."""
+    exposition = MetricsExposition()
+    gauge = Gauge(exposition, "test_gauge", "Test\\ gauge\nhelp", ["entity", "mode"])
+    gauge.labels(entity="sensor.a", mode='quote " and \\ slash').set(1)
+    gauge.labels(entity="sensor.b", mode="new\nline").set(2.5)
+    counter = Counter(exposition, "test_counter", "Test counter", ["entity"])
+    counter.labels(entity="sensor.a").inc()
+    counter.labels(entity="sensor.a").inc()
+
+    version, body = exposition.render()
+    assert exposition.render() == (version, body)
+    lines = body.decode().split("\n")
+    assert lines[:4] == [
+        "# HELP test_gauge Test\\\\ gauge\\nhelp",
+        "# TYPE test_gauge gauge",
+        'test_gauge{entity="sensor.a",mode="quote \\" and \\\\ slash"} 1.0',
+        'test_gauge{entity="sensor.b",mode="new\\nline"} 2.5',
+    ]
+    assert lines[4:7] == [
+        "# HELP test_counter_total Test counter",
+        "# TYPE test_counter_total counter",
+        'test_counter_total{entity="sensor.a"} 2.0',
+    ]
+    assert lines[7:9] == [
+        "# HELP test_counter_created Test counter",
+        "# TYPE test_counter_created gauge",
+    ]
+
+    assert gzip.decompress(exposition.gzip(version, body, b"trailer\n")) == (
+        body + b"trailer\n"
+    )
+    assert gzip.decompress(exposition.gzip(version, body, b"")) == body
+
+    gauge.remove_entity("sensor.a")
+    new_version, new_body = exposition.render()
+    assert new_version != version
+    assert b"sensor.a" not in new_body.split(b"# HELP test_counter")[0]
+    assert gzip.decompress(exposition.gzip(new_version, new_body, b"x")) == (
+        new_body + b"x"
+    )
+
+
 @pytest.fixture(name="sensor_entities")
 async def sensor_fixture(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
@@ -2111,10 +2228,11 @@ def set_state_with_entry(
 
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
-    """Mock the prometheus client."""
-    with mock.patch(f"{PROMETHEUS_PATH}.prometheus_client") as client:
-        counter_client = mock.MagicMock()
-        client.Counter = mock.MagicMock(return_value=counter_client)
+    """Mock the state change counter."""
+    counter_client = mock.MagicMock()
+    with mock.patch(
+        f"{PROMETHEUS_PATH}.Counter", mock.MagicMock(return_value=counter_client)
+    ):
         setattr(counter_client, "labels", mock.MagicMock(return_value=mock.MagicMock()))
         yield counter_client
 
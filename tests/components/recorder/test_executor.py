@@ -0,0 +1,47 @@
+"""Test the database executors."""
+
+from queue import Empty
+
+import pytest
+
+from homeassistant.components.recorder.executor import FairWorkQueue, read_queue_key
+
+
+def _put(queue: FairWorkQueue, key: str | None, item: str | None) -> None:
+    """Put an item on the queue with a queue key."""
+    token = read_queue_key.set(key)
+    try:
+        queue.put(item)
+    finally:
+        read_queue_key.reset(token)
+
+
+def test_fair_work_queue() -> None:
+    """Test the fair work queue takes the queue keys in turns."""
+    queue = FairWorkQueue()
+    assert queue.empty()
+    for item in ("a1", "a2", "a3"):
+        _put(queue, "a", item)
+    _put(queue, "b", "b1")
+    _put(queue, None, "n1")
+    _put(queue, "b", "b2")
+    assert queue.qsize() == 6
+
+    assert [queue.get() for _ in range(6)] == ["a1", "b1", "n1", "a2", "b2", "a3"]
+    assert queue.empty()
+    with pytest.raises(Empty):
+        queue.get_nowait()
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+
+
+def test_fair_work_queue_stops_workers_after_jobs() -> None:
+    """Test the None items stopping the workers are taken after the jobs."""
+    queue = FairWorkQueue()
+    _put(queue, "a", "a1")
+    queue.put(None)
+    _put(queue, "a", "a2")
+    assert queue.get() == "a1"
+    assert queue.get() == "a2"
+    assert queue.get() is None
+    assert queue.empty()
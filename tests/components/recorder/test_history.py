@@ -624,6 +624,80 @@ async def test_get_significant_states_with_initial(
     assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+async def test_get_significant_state_columns_with_session(
+    hass: HomeAssistant, significant_changes_only: bool
+) -> None:
+    """Test the columns match the states returned as State objects."""
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    one_and_half = zero + timedelta(seconds=1.5)
+    entity_ids = ["media_player.test", "thermostat.test", "thermostat.test3"]
+    with session_scope(hass=hass, read_only=True) as session:
+        hist = history.get_full_significant_states_with_session(
+            hass,
+            session,
+            one_and_half,
+            four,
+            entity_ids=entity_ids,
+            significant_changes_only=significant_changes_only,
+        )
+        columns = history.get_significant_state_columns_with_session(
+            hass,
+            session,
+            one_and_half,
+            four,
+            entity_ids,
+            significant_changes_only=significant_changes_only,
+        )
+    assert list(columns) == list(hist)
+    for entity_id, states in hist.items():
+        assert columns[entity_id] == history.StateColumns(
+            [state.state for state in states],
+            [state.last_updated.timestamp() for state in states],
+            [state.attributes for state in states],
+        )
+
+
+@pytest.mark.parametrize("minimal_response", [True, False])
+async def test_iter_significant_states_with_session(
+    hass: HomeAssistant, minimal_response: bool
+) -> None:
+    """Test the chunks of an entity join to the states of a full query."""
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    entity_ids = ["media_player.test", "thermostat.test", "thermostat.test2"]
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        significant_changes_only=False,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    chunked: dict[str, list] = {}
+    with session_scope(hass=hass, read_only=True) as session:
+        for entity_id, chunk in history.iter_significant_states_with_session(
+            hass,
+            session,
+            zero,
+            four,
+            entity_ids,
+            True,
+            False,
+            minimal_response,
+            False,
+            True,
+            2,
+        ):
+            assert 0 < len(chunk) <= 2
+            chunked.setdefault(entity_id, []).extend(chunk)
+    assert chunked == hist
+
+
 async def test_get_significant_states_without_initial(
     hass: HomeAssistant,
 ) -> None:
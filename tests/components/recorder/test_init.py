@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -33,6 +34,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READ_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -132,6 +134,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         auto_repack=True,
         keep_days=7,
         commit_interval=1,
+        partition_tables=False,
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
@@ -396,7 +399,8 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        instance = get_instance(hass)
+        for obj in (*instance.event_session, *instance._pending_bulk_states):
             if isinstance(obj, States):
                 raise OperationalError(
                     "insert the state", "fake params", "forced to fail"
@@ -439,7 +443,8 @@ async def test_saving_state_with_sqlalchemy_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        instance = get_instance(hass)
+        for obj in (*instance.event_session, *instance._pending_bulk_states):
             if isinstance(obj, States):
                 raise SQLAlchemyError(
                     "insert the state", "fake params", "forced to fail"
@@ -1469,6 +1474,125 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert", [True, False])
+async def test_saving_sets_old_state_bulk_insert(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk_insert: bool,
+) -> None:
+    """Test old states are linked with and without multi-row INSERTs."""
+    with patch.object(recorder.core, "supports_bulk_insert", return_value=bulk_insert):
+        instance = await async_setup_recorder_instance(hass)
+    assert instance._bulk_insert_active is bulk_insert
+
+    hass.states.async_set("test.one", "s1", {})
+    hass.bus.async_fire("custom_event", {"some": "data"})
+    hass.states.async_set("test.one", "s2", {})
+    hass.states.async_set("test.one", "s3", {"new": "attr"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s4", {})
+    await async_wait_recording_done(hass)
+
+    assert instance._pending_bulk_events == []
+    assert instance._pending_bulk_states == []
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s3"].shared_attrs == '{"new":"attr"}'
+        assert {state.entity_id for state in states} == {"test.one"}
+
+        events = list(
+            session.query(EventTypes.event_type, EventData.shared_data)
+            .select_from(Events)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .filter(EventTypes.event_type == "custom_event")
+        )
+        assert events == [("custom_event", '{"some":"data"}')]
+
+
+async def test_saving_bulk_insert_commit_retried(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test states and events are inserted again when the commit is retried."""
+    with patch.object(recorder.core, "supports_bulk_insert", return_value=True):
+        instance = await async_setup_recorder_instance(hass)
+
+    hass.states.async_set("test.one", "s1", {})
+    hass.bus.async_fire("custom_event", {"some": "data"})
+    await async_wait_recording_done(hass)
+
+    session = instance.event_session
+    commit = session.commit
+    failed = False
+
+    def _commit_fails_once() -> None:
+        nonlocal failed
+        if failed:
+            commit()
+            return
+        failed = True
+        session.rollback()
+        # Take the next id so the retried states get other ids than before
+        session.execute(insert(States).values(state="other"))
+        commit()
+        raise OperationalError("commit", {}, Exception("forced to fail"))
+
+    # The states are committed together, so the old state of s3 is inserted
+    # in the same transaction
+    with (
+        patch.object(instance, "commit_interval", 3600),
+        patch.object(instance, "db_retry_wait", 0.01),
+        patch.object(session, "commit", side_effect=_commit_fails_once),
+    ):
+        hass.states.async_set("test.one", "s2", {})
+        hass.states.async_set("test.one", "s3", {})
+        hass.bus.async_fire("custom_event", {"some": "data"})
+        await hass.async_block_till_done()
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+
+    assert failed
+    assert "Error executing query" in caplog.text
+    assert instance._pending_bulk_events == []
+    assert instance._pending_bulk_states == []
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(session.query(States.state_id, States.old_state_id, States.state))
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+        assert (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "custom_event")
+            .count()
+            == 2
+        )
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -2127,6 +2251,34 @@ async def test_database_connection_keep_alive_disabled_on_sqlite(
     assert "Sending keepalive" not in caplog.text
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_executor_is_read_only_on_sqlite(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test the read executor reads the database but can not write to it."""
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> list[str]:
+        assert threading.current_thread().name.startswith(DB_READ_WORKER_PREFIX)
+        with session_scope(hass=hass, read_only=True) as session:
+            return [state.state for state in session.query(States)]
+
+    def _write_event() -> None:
+        with session_scope(hass=hass) as session:
+            session.add(Events(event_type_id=None, time_fired_ts=0))
+
+    assert await instance.async_add_read_executor_job(
+        _read_states, queue_key="test"
+    ) == ["on"]
+    with pytest.raises(OperationalError, match="readonly"):
+        await instance.async_add_read_executor_job(_write_event)
+
+
 async def test_deduplication_event_data_inside_commit_interval(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -2363,7 +2515,10 @@ async def test_connect_args_priority(hass: HomeAssistant, config_url) -> None:
 
     with (
         patch("sqlalchemy.engine.url.URL._get_entrypoint", MockEntrypoint),
-        patch("sqlalchemy.engine.create.util.get_cls_kwargs", return_value=["echo"]),
+        patch(
+            "sqlalchemy.engine.create.util.get_cls_kwargs",
+            return_value=["echo", "pool_size"],
+        ),
     ):
         await async_setup_component(
             hass,
@@ -2513,6 +2668,56 @@ async def test_lru_increases_with_many_entities(
     assert instance.states_meta_manager._id_map.get_size() == mock_entity_count * 2
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 5}])
+async def test_state_attributes_looked_up_once_per_commit(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test attributes missing from the cache are looked up once per commit."""
+    for idx in range(3):
+        hass.states.async_set(f"test.entity{idx}", "on", {"idx": idx})
+    await async_wait_recording_done(hass)
+
+    instance = get_instance(hass)
+    state_attributes_manager = instance.state_attributes_manager
+    # Forget the attributes as after a restart
+    state_attributes_manager._id_map.clear()
+
+    with patch.object(
+        state_attributes_table_manager,
+        "get_shared_attributes",
+        wraps=state_attributes_table_manager.get_shared_attributes,
+    ) as get_shared_attributes_mock:
+        for idx in range(5):
+            hass.states.async_set(f"test.entity{idx}", "off", {"idx": min(idx, 3)})
+        # Process all the states before they are committed together
+        await hass.async_block_till_done()
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+    assert get_shared_attributes_mock.call_count == 1
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 4
+        off_attributes_ids = [
+            attributes_id
+            for (attributes_id,) in session.query(States.attributes_id)
+            .filter(States.state == "off")
+            .order_by(States.state_id)
+        ]
+    # The states with the same new attributes share them
+    assert off_attributes_ids[3] == off_attributes_ids[4]
+    assert set(state_attributes_manager._id_map.values()) == set(off_attributes_ids)
+
+    # The attributes of the latest states are loaded at startup
+    state_attributes_manager._id_map.clear()
+
+    def _warm_up() -> None:
+        with session_scope(hass=hass) as session:
+            state_attributes_manager.warm_up(session)
+
+    await instance.async_add_executor_job(_warm_up)
+    assert len(state_attributes_manager._id_map) == 4
+
+
 async def test_clean_shutdown_when_recorder_thread_raises_during_initialize_database(
     hass: HomeAssistant,
 ) -> None:
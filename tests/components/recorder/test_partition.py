@@ -0,0 +1,405 @@
+"""Test the partitions of the states and events tables."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+import sqlalchemy
+from sqlalchemy import delete
+
+from homeassistant.components.recorder import Recorder, migration
+from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.db_schema import Events, States
+from homeassistant.components.recorder.partition import (
+    INITIAL_PARTITION,
+    OPEN_PARTITION,
+    PARTITIONED_EVENTS,
+    PARTITIONED_STATES,
+    Partition,
+    close_open_partition,
+    drop_partitions,
+    find_old_partitions,
+    get_partitions,
+    partition_name,
+    partition_table,
+)
+from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.queries import get_migration_changes
+from homeassistant.components.recorder.util import (
+    execute_stmt_lambda_element,
+    session_scope,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def _executed_sql(session: MagicMock) -> list[str]:
+    """Return the SQL of the statements executed by a session."""
+    return [str(call.args[0]) for call in session.execute.call_args_list]
+
+
+def test_get_partitions_mysql() -> None:
+    """Test reading the partitions of a MySQL table."""
+    session = MagicMock()
+    session.execute.return_value = [
+        (INITIAL_PARTITION, "100"),
+        ("p20261017", "200"),
+        (OPEN_PARTITION, "MAXVALUE"),
+    ]
+    assert get_partitions(session, SupportedDialect.MYSQL, "states") == [
+        Partition(INITIAL_PARTITION, 100),
+        Partition("p20261017", 200),
+        Partition(OPEN_PARTITION, None),
+    ]
+    assert session.execute.call_args.args[1] == {"table": "states"}
+
+
+def test_get_partitions_postgresql() -> None:
+    """Test reading the partitions of a PostgreSQL table."""
+    session = MagicMock()
+    session.execute.return_value = [
+        ("states_pmax", "FOR VALUES FROM ('200') TO (MAXVALUE)"),
+        ("states_p20261017", "FOR VALUES FROM ('100') TO ('200')"),
+        ("states_pinitial", "FOR VALUES FROM (MINVALUE) TO ('100')"),
+    ]
+    assert get_partitions(session, SupportedDialect.POSTGRESQL, "states") == [
+        Partition(INITIAL_PARTITION, 100),
+        Partition("p20261017", 200),
+        Partition(OPEN_PARTITION, None),
+    ]
+
+    session.execute.return_value = []
+    assert get_partitions(session, SupportedDialect.POSTGRESQL, "states") == []
+
+
+def test_partition_table_mysql() -> None:
+    """Test partitioning a MySQL table."""
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = 99
+    partition_table(session, SupportedDialect.MYSQL, PARTITIONED_STATES)
+    assert _executed_sql(session)[-1] == (
+        "ALTER TABLE states PARTITION BY RANGE (state_id) ("
+        "PARTITION pinitial VALUES LESS THAN (100), "
+        "PARTITION pmax VALUES LESS THAN MAXVALUE)"
+    )
+
+
+def test_partition_table_postgresql() -> None:
+    """Test partitioning a PostgreSQL table."""
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = None
+    session.execute.return_value.all.return_value = [("states_pkey",)]
+    partition_table(session, SupportedDialect.POSTGRESQL, PARTITIONED_STATES)
+    executed = _executed_sql(session)
+    assert executed[1] == "ALTER TABLE states RENAME TO states_pinitial"
+    assert "ALTER INDEX states_pkey RENAME TO states_pkey_pinitial" in executed
+    assert executed[-2:] == [
+        "ALTER TABLE states ATTACH PARTITION states_pinitial"
+        " FOR VALUES FROM (MINVALUE) TO (1)",
+        "CREATE TABLE states_pmax PARTITION OF states"
+        " FOR VALUES FROM (1) TO (MAXVALUE)",
+    ]
+    # The indices of the schema are created on the partitioned table
+    assert session.connection.return_value.execute.call_count == len(
+        States.__table__.indexes
+    )
+
+
+def test_close_open_partition() -> None:
+    """Test closing the open partition."""
+    partitions = [Partition(INITIAL_PARTITION, 100), Partition(OPEN_PARTITION, None)]
+
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = 149
+    assert close_open_partition(
+        session, SupportedDialect.MYSQL, PARTITIONED_STATES, partitions, "p20261018"
+    ) == [
+        Partition(INITIAL_PARTITION, 100),
+        Partition("p20261018", 150),
+        Partition(OPEN_PARTITION, None),
+    ]
+    assert _executed_sql(session)[-1] == (
+        "ALTER TABLE states REORGANIZE PARTITION pmax INTO ("
+        "PARTITION p20261018 VALUES LESS THAN (150), "
+        "PARTITION pmax VALUES LESS THAN MAXVALUE)"
+    )
+
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = 149
+    close_open_partition(
+        session,
+        SupportedDialect.POSTGRESQL,
+        PARTITIONED_STATES,
+        partitions,
+        "p20261018",
+    )
+    assert _executed_sql(session)[1:] == [
+        "ALTER TABLE states DETACH PARTITION states_pmax",
+        "ALTER TABLE states_pmax RENAME TO states_p20261018",
+        "ALTER TABLE states ATTACH PARTITION states_p20261018"
+        " FOR VALUES FROM (100) TO (150)",
+        "CREATE TABLE states_pmax PARTITION OF states"
+        " FOR VALUES FROM (150) TO (MAXVALUE)",
+    ]
+
+
+def test_close_open_partition_skipped() -> None:
+    """Test the open partition is not closed twice a day or when it is empty."""
+    partitions = [Partition("p20261018", 100), Partition(OPEN_PARTITION, None)]
+    session = MagicMock()
+    assert (
+        close_open_partition(
+            session, SupportedDialect.MYSQL, PARTITIONED_STATES, partitions, "p20261018"
+        )
+        is partitions
+    )
+    session.execute.assert_not_called()
+
+    session.execute.return_value.scalar.return_value = 99
+    assert (
+        close_open_partition(
+            session, SupportedDialect.MYSQL, PARTITIONED_STATES, partitions, "p20261019"
+        )
+        is partitions
+    )
+    assert session.execute.call_count == 1
+
+
+def test_find_old_partitions() -> None:
+    """Test finding the partitions which only hold rows before the cut off."""
+    partitions = [
+        Partition(INITIAL_PARTITION, 100),
+        Partition("p20261017", 200),
+        Partition("p20261018", 300),
+        Partition(OPEN_PARTITION, None),
+    ]
+    session = MagicMock()
+    session.execute.return_value.scalar.side_effect = [None, 10.0, 30.0]
+    assert (
+        find_old_partitions(
+            session, SupportedDialect.MYSQL, PARTITIONED_STATES, partitions, 20.0
+        )
+        == partitions[:2]
+    )
+    assert _executed_sql(session) == [
+        "SELECT MAX(last_updated_ts) FROM states PARTITION (pinitial)",
+        "SELECT MAX(last_updated_ts) FROM states PARTITION (p20261017)",
+        "SELECT MAX(last_updated_ts) FROM states PARTITION (p20261018)",
+    ]
+
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = 10.0
+    assert (
+        find_old_partitions(
+            session, SupportedDialect.POSTGRESQL, PARTITIONED_STATES, partitions, 20.0
+        )
+        == partitions[:3]
+    )
+    assert _executed_sql(session)[0] == (
+        "SELECT MAX(last_updated_ts) FROM states_pinitial"
+    )
+
+
+def test_drop_partitions() -> None:
+    """Test dropping partitions."""
+    partitions = [Partition(INITIAL_PARTITION, 100), Partition("p20261017", 200)]
+
+    session = MagicMock()
+    drop_partitions(session, SupportedDialect.MYSQL, "events", partitions)
+    assert _executed_sql(session) == [
+        "ALTER TABLE events DROP PARTITION pinitial, p20261017"
+    ]
+
+    session = MagicMock()
+    drop_partitions(session, SupportedDialect.POSTGRESQL, "events", partitions)
+    assert _executed_sql(session) == ["DROP TABLE events_pinitial, events_p20261017"]
+
+
+def _partition_names(instance: Recorder) -> dict[str, list[str]]:
+    """Return the names of the partitions of the states and events tables."""
+    assert instance.dialect_name is not None
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        return {
+            partitioned.table: [
+                partition.name
+                for partition in get_partitions(
+                    session, instance.dialect_name, partitioned.table
+                )
+            ]
+            for partitioned in (PARTITIONED_STATES, PARTITIONED_EVENTS)
+        }
+
+
+def _get_migration_changes(instance: Recorder) -> dict[str, int]:
+    """Return the migration changes table as dict."""
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        return dict(execute_stmt_lambda_element(session, get_migration_changes()))
+
+
+async def test_partition_tables_migration_not_needed(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the tables are only partitioned when enabled and not on SQLite."""
+    migrator = migration.PartitionTablesMigration(migration.SCHEMA_VERSION, {})
+    session = MagicMock()
+    with patch.object(recorder_mock, "dialect_name", SupportedDialect.MYSQL):
+        assert not migrator.needs_migrate(recorder_mock, session)
+    with (
+        patch.object(recorder_mock, "partition_tables", True),
+        patch.object(recorder_mock, "dialect_name", SupportedDialect.SQLITE),
+    ):
+        assert not migrator.needs_migrate(recorder_mock, session)
+    session.execute.assert_not_called()
+    session.merge.assert_not_called()
+
+
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"partition_tables": True}])
+async def test_partition_tables_migration(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the tables are partitioned by the run time migration on startup.
+
+    This test is not run on SQLite, which does not support partitions.
+    """
+    await async_wait_recording_done(hass)
+
+    assert await recorder_mock.async_add_executor_job(
+        _partition_names, recorder_mock
+    ) == {
+        "states": [INITIAL_PARTITION, OPEN_PARTITION],
+        "events": [INITIAL_PARTITION, OPEN_PARTITION],
+    }
+    migration_changes = await recorder_mock.async_add_executor_job(
+        _get_migration_changes, recorder_mock
+    )
+    assert (
+        migration_changes[migration.PartitionTablesMigration.migration_id]
+        == migration.PartitionTablesMigration.migration_version
+    )
+    inspector = sqlalchemy.inspect(recorder_mock.engine)
+    assert not inspector.get_foreign_keys("states")
+    assert not inspector.get_foreign_keys("events")
+
+    # New rows are recorded in the open partitions
+    hass.states.async_set("test.partitioned", "on")
+    hass.bus.async_fire("test_partitioned")
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(States).filter(States.state == "on").count() == 1
+
+
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_partition_tables_migration_resumed(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the migration partitions one table per task and resumes.
+
+    This test is not run on SQLite, which does not support partitions.
+    """
+    await async_wait_recording_done(hass)
+    migrate_data = migration.PartitionTablesMigration.migrate_data
+    migrator = migration.PartitionTablesMigration(migration.SCHEMA_VERSION, {})
+
+    with (
+        session_scope(hass=hass, read_only=True) as session,
+        patch.object(recorder_mock, "partition_tables", True),
+    ):
+        assert migrator.needs_migrate(recorder_mock, session)
+
+    # The first task only partitions the states table
+    assert not await recorder_mock.async_add_executor_job(migrate_data, recorder_mock)
+    assert await recorder_mock.async_add_executor_job(
+        _partition_names, recorder_mock
+    ) == {"states": [INITIAL_PARTITION, OPEN_PARTITION], "events": []}
+
+    # A restarted migration continues with the events table
+    assert await recorder_mock.async_add_executor_job(migrate_data, recorder_mock)
+    assert await recorder_mock.async_add_executor_job(
+        _partition_names, recorder_mock
+    ) == {
+        "states": [INITIAL_PARTITION, OPEN_PARTITION],
+        "events": [INITIAL_PARTITION, OPEN_PARTITION],
+    }
+    assert await recorder_mock.async_add_executor_job(migrate_data, recorder_mock)
+
+    with (
+        session_scope(hass=hass) as session,
+        patch.object(recorder_mock, "partition_tables", True),
+    ):
+        assert not migrator.needs_migrate(recorder_mock, session)
+    migration_changes = await recorder_mock.async_add_executor_job(
+        _get_migration_changes, recorder_mock
+    )
+    assert migration.PartitionTablesMigration.migration_id in migration_changes
+
+
+@pytest.mark.skip_on_db_engine(["sqlite"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("recorder_config", [{"partition_tables": True}])
+async def test_purge_drops_partitions(
+    hass: HomeAssistant, recorder_mock: Recorder, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the purge drops the partitions which only hold old rows.
+
+    This test is not run on SQLite, which does not support partitions.
+    """
+    await async_wait_recording_done(hass)
+    dialect = recorder_mock.dialect_name
+    assert dialect is not None
+
+    def _close_open_partitions(name: str) -> None:
+        """Close the open partitions of the states and events tables."""
+        with session_scope(session=recorder_mock.get_session()) as session:
+            for partitioned in (PARTITIONED_STATES, PARTITIONED_EVENTS):
+                partitions = get_partitions(session, dialect, partitioned.table)
+                close_open_partition(session, dialect, partitioned, partitions, name)
+
+    def _delete_rows() -> None:
+        """Delete the rows recorded on startup."""
+        with session_scope(session=recorder_mock.get_session()) as session:
+            session.execute(delete(States))
+            session.execute(delete(Events))
+
+    now = dt_util.utcnow()
+    await recorder_mock.async_add_executor_job(_delete_rows)
+    freezer.move_to(now - timedelta(days=10))
+    hass.states.async_set("test.partitioned", "old")
+    hass.bus.async_fire("test_partitioned", {"age": "old"})
+    await async_wait_recording_done(hass)
+    await recorder_mock.async_add_executor_job(_close_open_partitions, "pold")
+
+    freezer.move_to(now)
+    hass.states.async_set("test.partitioned", "new")
+    hass.bus.async_fire("test_partitioned", {"age": "new"})
+    await async_wait_recording_done(hass)
+
+    finished = await recorder_mock.async_add_executor_job(
+        purge_old_data, recorder_mock, now - timedelta(days=5), False
+    )
+    assert finished
+
+    today = partition_name(now)
+    assert await recorder_mock.async_add_executor_job(
+        _partition_names, recorder_mock
+    ) == {"states": [today, OPEN_PARTITION], "events": [today, OPEN_PARTITION]}
+    with session_scope(hass=hass, read_only=True) as session:
+        states = session.query(States).all()
+        assert [state.state for state in states] == ["new"]
+        # The new state is disconnected from the dropped old state
+        assert states[0].old_state_id is None
+        assert session.query(Events).count() == 1
@@ -8,6 +8,7 @@ from unittest.mock import patch
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy import delete, text
 from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
@@ -25,6 +26,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.components.recorder.partition import OPEN_PARTITION, Partition
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
@@ -342,6 +344,89 @@ async def test_purge_old_events(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert events.count() == 2
 
 
+async def test_purge_partitions(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test old partitions are dropped instead of deleting the rows in batches."""
+    await _add_test_states(hass)
+
+    with session_scope(hass=hass) as session:
+        state_ids = [
+            state.state_id for state in session.query(States).order_by(States.state_id)
+        ]
+        assert session.query(StateAttributes).count() == 3
+    # The states of 11 days ago and 5 days ago are in partitions of their own
+    partitions = [
+        Partition("p1", state_ids[2]),
+        Partition("p2", state_ids[4]),
+        Partition(OPEN_PARTITION, None),
+    ]
+    partition_ranges = {"p1": (0, state_ids[2]), "p2": (state_ids[2], state_ids[4])}
+
+    def _from_partition(dialect: SupportedDialect, table: str, name: str) -> str:
+        # SQLite has no partitions, select the rows of the partition instead
+        lower_bound, upper_bound = partition_ranges[name]
+        return (
+            f"(SELECT * FROM {table} WHERE state_id >= {lower_bound}"  # noqa: S608
+            f" AND state_id < {upper_bound})"
+        )
+
+    def _drop_partitions(
+        session: Session,
+        dialect: SupportedDialect,
+        table: str,
+        dropped: list[Partition],
+    ) -> None:
+        assert table == "states"
+        # Partitioned tables have no foreign keys, the purge disconnects the
+        # states linked to the dropped states afterwards
+        session.execute(text("PRAGMA defer_foreign_keys = ON"))
+        session.execute(delete(States).where(States.state_id < dropped[-1].upper_bound))
+
+    purge_before = dt_util.utcnow() - timedelta(days=8)
+    with (
+        patch.object(recorder_mock, "partition_tables", True),
+        patch.object(recorder_mock, "dialect_name", SupportedDialect.MYSQL),
+        patch(
+            "homeassistant.components.recorder.purge.get_partitions",
+            side_effect=lambda session, dialect, table: (
+                partitions if table == "states" else []
+            ),
+        ),
+        patch(
+            "homeassistant.components.recorder.purge.close_open_partition",
+            side_effect=lambda session, dialect, partitioned, partitions, name: (
+                partitions
+            ),
+        ) as close_open_partition_mock,
+        patch(
+            "homeassistant.components.recorder.partition._from_partition",
+            side_effect=_from_partition,
+        ),
+        patch(
+            "homeassistant.components.recorder.purge.drop_partitions",
+            side_effect=_drop_partitions,
+        ) as drop_partitions_mock,
+    ):
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+    assert finished
+
+    assert close_open_partition_mock.call_count == 1
+    assert close_open_partition_mock.call_args[0][4] == (f"p{dt_util.utcnow():%Y%m%d}")
+    # Only the partition of 11 days ago only holds rows before the cut off
+    assert drop_partitions_mock.call_count == 1
+    assert drop_partitions_mock.call_args[0][3] == [partitions[0]]
+
+    with session_scope(hass=hass) as session:
+        states = {state.state: state for state in session.query(States)}
+        assert len(states) == 4
+        # The state linked to a state of the dropped partition is disconnected
+        assert states["purgeme_2"].old_state_id is None
+        assert states["purgeme_3"].old_state_id == states["purgeme_2"].state_id
+        # The attributes which were only used by the dropped partition are purged
+        assert session.query(StateAttributes).count() == 2
+
+    assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
+
+
 async def test_purge_old_recorder_runs(
     hass: HomeAssistant, recorder_mock: Recorder
 ) -> None:
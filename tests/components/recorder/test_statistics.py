@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDay,
+    StatisticsMonth,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1844,6 +1848,105 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-12-01 00:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone,
+) -> None:
+    """Test day and month statistics are read from the rollups."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.use_statistics_rollups
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-25 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "max": hour % 17 + 0.5,
+            "mean": hour % 13 / 3,
+            "min": -(hour % 11),
+            "state": hour % 7,
+            "sum": hour * 1.1,
+        }
+        # Leave out some hours to have days with less than 24 hours
+        for hour in range(0, 24 * 50, 5)
+        if hour % 24 < 20
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    def _rollup_counts() -> tuple[int, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                session.query(StatisticsDay).count(),
+                session.query(StatisticsMonth).count(),
+            )
+
+    days, months = await instance.async_add_executor_job(_rollup_counts)
+    assert days == len(
+        statistics_during_period(
+            hass, start, statistic_ids={"test:total_energy_import"}, period="day"
+        )["test:total_energy_import"]
+    )
+    assert months == 3
+
+    def _assert_rollups_match_hourly() -> None:
+        for period in ("day", "month"):
+            kwargs = {
+                "start_time": start,
+                "statistic_ids": {"test:total_energy_import"},
+                "period": period,
+                "units": {"energy": "Wh"},
+            }
+            rollup_stats = statistics_during_period(hass, **kwargs)
+            with patch.object(instance, "use_statistics_rollups", False):
+                hourly_stats = statistics_during_period(hass, **kwargs)
+            assert rollup_stats["test:total_energy_import"] == [
+                pytest.approx(row) for row in hourly_stats["test:total_energy_import"]
+            ]
+
+    _assert_rollups_match_hourly()
+
+    # The rollups follow adjustments of the sums
+    instance.async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(days=20), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    _assert_rollups_match_hourly()
+
+    def _rollups_to_rebuild() -> list[int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return statistics.find_statistics_rollups_to_rebuild(session)
+
+    assert await instance.async_add_executor_job(_rollups_to_rebuild) == []
+
+    # Rollups built in another time zone are not used, but rebuilt
+    await hass.config.async_set_time_zone("Asia/Kolkata")
+    _assert_rollups_match_hourly()
+    metadata_ids = await instance.async_add_executor_job(_rollups_to_rebuild)
+    assert len(metadata_ids) == 1
+
+    def _rebuild() -> None:
+        with session_scope(hass=hass) as session:
+            statistics.rebuild_statistics_rollups(session, metadata_ids)
+
+    await instance.async_add_executor_job(_rebuild)
+    assert await instance.async_add_executor_job(_rollups_to_rebuild) == []
+    _assert_rollups_match_hourly()
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
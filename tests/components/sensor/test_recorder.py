@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 import math
+import random
 from statistics import mean
 from typing import Any, Literal
 from unittest.mock import patch
@@ -34,7 +35,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -5174,3 +5180,63 @@ async def test_exclude_attributes(hass: HomeAssistant) -> None:
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+def _state_time_weighted_average(
+    states: list[State], start: datetime, end: datetime
+) -> float:
+    """Calculate a time weighted average from State objects with datetimes."""
+    old_fstate: float | None = None
+    old_start_time: datetime | None = None
+    accumulated = 0.0
+    for state in states:
+        start_time = max(state.last_updated, start)
+        if old_start_time is None:
+            start = start_time
+        else:
+            accumulated += old_fstate * (start_time - old_start_time).total_seconds()
+        old_fstate = float(state.state)
+        old_start_time = start_time
+    accumulated += old_fstate * (end - old_start_time).total_seconds()
+    if (period_seconds := (end - start).total_seconds()) == 0:
+        return 0.0
+    return accumulated / period_seconds
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_time_weighted_average_matches_states(seed: int) -> None:
+    """Test the columnar time weighted average matches the one from State objects."""
+    rand = random.Random(seed)
+    start = dt_util.utc_from_timestamp(1_700_000_000)
+    end = start + timedelta(minutes=5)
+    for _ in range(200):
+        # The first state may be the last known state before the period
+        timestamp = start.timestamp() + rand.uniform(-600, 300)
+        timestamps = sorted(
+            [timestamp]
+            + [
+                rand.uniform(timestamp, end.timestamp())
+                for _ in range(rand.randint(0, 20))
+            ]
+        )
+        states = [
+            State(
+                "sensor.test",
+                str(round(rand.uniform(-100, 1000), rand.randint(0, 4))),
+                last_updated=dt_util.utc_from_timestamp(timestamp),
+            )
+            for timestamp in timestamps
+        ]
+        columns = sensor_recorder._state_columns_to_float_columns(
+            history.StateColumns(
+                [state.state for state in states],
+                timestamps,
+                [state.attributes for state in states],
+            )
+        )
+        assert sensor_recorder._time_weighted_average(
+            columns.values,
+            columns.timestamps_us,
+            sensor_recorder._datetime_to_microseconds(start),
+            sensor_recorder._datetime_to_microseconds(end),
+        ) == _state_time_weighted_average(states, start, end)
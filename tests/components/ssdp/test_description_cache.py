@@ -0,0 +1,133 @@
+"""Test the SSDP description cache."""
+
+from datetime import timedelta
+from http import HTTPStatus
+
+from async_upnp_client.aiohttp import AiohttpSessionRequester
+from async_upnp_client.utils import CaseInsensitiveDict
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.ssdp.description_cache import DescriptionCache
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from tests.test_util.aiohttp import AiohttpClientMocker
+
+LOCATION = "http://1.1.1.1/description.xml"
+DESCRIPTION_XML = """
+<root>
+  <device>
+    <manufacturer>Paulus</manufacturer>
+  </device>
+</root>
+"""
+
+
+def _description_cache(hass: HomeAssistant) -> DescriptionCache:
+    """Return a description cache fetching with the mocked session."""
+    session = async_get_clientsession(hass)
+    return DescriptionCache(AiohttpSessionRequester(session, True, 10))
+
+
+async def test_description_cached_per_boot(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test descriptions are cached until the device boots again."""
+    aioclient_mock.get(LOCATION, text=DESCRIPTION_XML)
+    cache = _description_cache(hass)
+    headers = CaseInsensitiveDict({"BOOTID.UPNP.ORG": "1", "CONFIGID.UPNP.ORG": "1"})
+
+    assert cache.peek_description_dict(LOCATION, headers) == (False, None)
+    assert await cache.async_get_description_dict(LOCATION, headers) == {
+        "manufacturer": "Paulus"
+    }
+    assert cache.peek_description_dict(LOCATION, headers) == (
+        True,
+        {"manufacturer": "Paulus"},
+    )
+    assert await cache.async_get_description_dict(LOCATION, headers) == {
+        "manufacturer": "Paulus"
+    }
+    assert aioclient_mock.call_count == 1
+
+    rebooted = CaseInsensitiveDict({"bootid.upnp.org": "2", "configid.upnp.org": "1"})
+    assert cache.peek_description_dict(LOCATION, rebooted) == (False, None)
+    assert await cache.async_get_description_dict(LOCATION, rebooted) == {
+        "manufacturer": "Paulus"
+    }
+    assert aioclient_mock.call_count == 2
+    # The device booted again, so the description is not revalidated
+    assert aioclient_mock.mock_calls[1][3] == {}
+
+
+async def test_description_revalidated_after_max_age(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test expired descriptions are revalidated with a conditional request."""
+    aioclient_mock.get(LOCATION, text=DESCRIPTION_XML, headers={"ETag": '"v1"'})
+    cache = _description_cache(hass)
+    headers = CaseInsensitiveDict({"CACHE-CONTROL": "max-age=60"})
+
+    description = await cache.async_get_description_dict(LOCATION, headers)
+    assert description == {"manufacturer": "Paulus"}
+
+    freezer.tick(timedelta(seconds=61))
+    assert cache.peek_description_dict(LOCATION, headers) == (False, None)
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(LOCATION, status=HTTPStatus.NOT_MODIFIED)
+    # The parsed description is kept when it was not modified
+    assert await cache.async_get_description_dict(LOCATION, headers) is description
+    assert aioclient_mock.mock_calls[0][3] == {"If-None-Match": '"v1"'}
+    assert cache.peek_description_dict(LOCATION, headers) == (True, description)
+
+
+async def test_description_fetch_failure_cached(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test failing to fetch a description is cached."""
+    aioclient_mock.get(LOCATION, status=HTTPStatus.NOT_FOUND)
+    cache = _description_cache(hass)
+
+    assert await cache.async_get_description_dict(LOCATION) is None
+    assert cache.peek_description_dict(LOCATION) == (True, None)
+    assert await cache.async_get_description_dict(LOCATION) is None
+    assert aioclient_mock.call_count == 1
+
+    assert cache.peek_description_dict(None) == (True, None)
+    assert await cache.async_get_description_dict(None) is None
+
+
+async def test_description_kept_when_revalidation_fails(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the cached description is kept when it can not be revalidated."""
+    aioclient_mock.get(LOCATION, text=DESCRIPTION_XML, headers={"ETag": '"v1"'})
+    cache = _description_cache(hass)
+    headers = CaseInsensitiveDict({"CACHE-CONTROL": "max-age=60"})
+
+    description = await cache.async_get_description_dict(LOCATION, headers)
+    assert description == {"manufacturer": "Paulus"}
+
+    freezer.tick(timedelta(seconds=61))
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(LOCATION, status=HTTPStatus.INTERNAL_SERVER_ERROR)
+    assert await cache.async_get_description_dict(LOCATION, headers) is description
+    assert cache.peek_description_dict(LOCATION, headers) == (True, description)
+
+    freezer.tick(timedelta(seconds=61))
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(LOCATION, exc=TimeoutError)
+    assert await cache.async_get_description_dict(LOCATION, headers) is description
+    assert cache.peek_description_dict(LOCATION, headers) == (True, description)
+    assert aioclient_mock.call_count == 3
+
+    # The description is not kept once the device booted again
+    rebooted = CaseInsensitiveDict(
+        {"CACHE-CONTROL": "max-age=60", "BOOTID.UPNP.ORG": "2"}
+    )
+    assert await cache.async_get_description_dict(LOCATION, rebooted) is None
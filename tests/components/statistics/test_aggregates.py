@@ -0,0 +1,142 @@
+"""The tests for the rolling aggregates of the statistics sensor."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.aggregates import (
+    RollingAggregate,
+    RollingCircularMean,
+    RollingDifferences,
+    RollingExtremes,
+    RollingMoments,
+    RollingOrderStatistics,
+    RollingSum,
+    RollingTimeWeightedArea,
+)
+from homeassistant.util import dt as dt_util
+
+WINDOW = 25
+
+
+def _slide(
+    aggregate: RollingAggregate, values: list[float]
+) -> Iterator[tuple[deque[float | bool], deque[datetime]]]:
+    """Slide a window over the values and yield the buffers after each update."""
+    states: deque[float | bool] = deque()
+    ages: deque[datetime] = deque()
+    start = dt_util.utcnow()
+    for i, value in enumerate(values):
+        if len(states) == WINDOW:
+            aggregate.remove(states, ages)
+            states.popleft()
+            ages.popleft()
+        age = start + timedelta(seconds=i * 1.5 + (i % 3))
+        aggregate.add(states, ages, value, age)
+        states.append(value)
+        ages.append(age)
+        yield states, ages
+        if i % 40 == 39:
+            # Drain the buffer like a purge of expired samples does
+            while len(states) > 1:
+                aggregate.remove(states, ages)
+                states.popleft()
+                ages.popleft()
+
+
+@pytest.fixture(name="values")
+def values_fixture() -> list[float]:
+    """Return random sample values with duplicates."""
+    rand = random.Random(42)
+    return [round(rand.uniform(-50, 400), rand.choice((0, 1, 3))) for _ in range(300)]
+
+
+def test_rolling_sum_and_moments(values: list[float]) -> None:
+    """Test running sum, mean and variance match a full computation."""
+    rolling_sum = RollingSum()
+    moments = RollingMoments()
+    for (states, _), (states2, _) in zip(
+        _slide(rolling_sum, values), _slide(moments, values), strict=True
+    ):
+        assert states == states2
+        assert rolling_sum.total == pytest.approx(sum(states))
+        assert moments.mean == pytest.approx(statistics.mean(states))
+        if len(states) >= 2:
+            assert moments.variance == pytest.approx(statistics.variance(states))
+
+
+def test_rolling_extremes(values: list[float]) -> None:
+    """Test the extremes and their age match max() and min() on the buffer."""
+    extremes = RollingExtremes()
+    for states, ages in _slide(extremes, values):
+        assert extremes.max == (
+            max(states),
+            ages[states.index(max(states))],
+        )
+        assert extremes.min == (
+            min(states),
+            ages[states.index(min(states))],
+        )
+
+
+def test_rolling_order_statistics(values: list[float]) -> None:
+    """Test median and percentiles match the statistics module exactly."""
+    order_statistics = RollingOrderStatistics()
+    for states, _ in _slide(order_statistics, values):
+        assert order_statistics.median == statistics.median(states)
+        if len(states) >= 2:
+            quantiles = statistics.quantiles(states, n=100, method="exclusive")
+            for percentile in (1, 10, 25, 50, 75, 90, 99):
+                expected = quantiles[percentile - 1]
+                assert order_statistics.percentile(percentile) == expected
+
+
+def test_rolling_differences(values: list[float]) -> None:
+    """Test sums of differences between consecutive samples."""
+    differences = RollingDifferences()
+    for states, _ in _slide(differences, values):
+        pairs = list(zip(list(states), list(states)[1:], strict=False))
+        assert differences.sum_differences == pytest.approx(
+            sum(abs(j - i) for i, j in pairs), abs=1e-6
+        )
+        assert differences.sum_differences_nonnegative == pytest.approx(
+            sum((j - i if j >= i else j) for i, j in pairs), abs=1e-6
+        )
+
+
+def test_rolling_time_weighted_area(values: list[float]) -> None:
+    """Test step and linear areas below the samples."""
+    area = RollingTimeWeightedArea()
+    for states, ages in _slide(area, values):
+        step = linear = 0.0
+        for i in range(1, len(states)):
+            seconds = (ages[i] - ages[i - 1]).total_seconds()
+            step += states[i - 1] * seconds
+            linear += 0.5 * (states[i] + states[i - 1]) * seconds
+        assert area.step_area == pytest.approx(step, abs=1e-6)
+        assert area.linear_area == pytest.approx(linear, abs=1e-6)
+
+
+def test_rolling_circular_mean(values: list[float]) -> None:
+    """Test the circular mean of angles in degrees."""
+    circular_mean = RollingCircularMean()
+    for states, _ in _slide(circular_mean, values):
+        sin_sum = sum(math.sin(math.radians(x)) for x in states)
+        cos_sum = sum(math.cos(math.radians(x)) for x in states)
+        expected = (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
+        assert circular_mean.mean == pytest.approx(expected, abs=1e-6)
+
+
+def test_rolling_sum_counts_binary_samples() -> None:
+    """Test the running sum of binary samples counts the on samples."""
+    rolling_sum = RollingSum()
+    values = [True, False, True, True, False] * 20
+    for states, _ in _slide(rolling_sum, values):
+        assert rolling_sum.total == states.count(True)
@@ -34,6 +34,7 @@ from homeassistant.components.stream.const import (
     CONF_SEGMENT_DURATION,
     DOMAIN,
     HLS_PROVIDER,
+    MAX_KEYFRAME_IMAGES,
     MAX_MISSING_DTS,
     PACKETS_TO_WAIT_FOR_AUDIO,
     RECORDER_PROVIDER,
@@ -847,6 +848,15 @@ async def test_durations(hass: HomeAssistant, worker_finished_stream) -> None:
 
     assert len(complete_segments) >= 1
 
+    # check that the parts of complete segments share the segment buffer
+    for segment in complete_segments:
+        buffer = segment.get_data_with_init()
+        assert buffer == segment.init + segment.get_data()
+        assert segment.get_data_chunks() == [segment.get_data()]
+        for part in segment.parts:
+            assert isinstance(part.data, memoryview)
+            assert part.data.obj is buffer
+
     # check that the Part duration metadata matches the durations in the media
     running_metadata_duration = 0
     for segment in complete_segments:
@@ -1027,6 +1037,34 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
 
     await stream.stop()
 
+    # The images of the last keyframe are encoded once per size
+    keyframe_converter = stream._keyframe_converter
+    assert await keyframe_converter.async_get_image() == EMPTY_8_6_JPEG
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+    encode.reset_mock()
+    assert await keyframe_converter.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 0
+    await asyncio.gather(
+        keyframe_converter.async_get_image(width=4, height=2),
+        keyframe_converter.async_get_image(width=4, height=2),
+    )
+    assert await keyframe_converter.async_get_image(width=4, height=2) == (
+        EMPTY_8_6_JPEG
+    )
+    assert encode.call_count == 1
+    assert encode.call_args[0][0].shape == (2, 4, 3)
+
+    # Only the most recently requested sizes are kept
+    for width in range(3, MAX_KEYFRAME_IMAGES + 3):
+        await keyframe_converter.async_get_image(width=width * 2, height=2)
+    encode.reset_mock()
+    await keyframe_converter.async_get_image(
+        width=(MAX_KEYFRAME_IMAGES + 2) * 2, height=2
+    )
+    assert encode.call_count == 0
+    await keyframe_converter.async_get_image(width=4, height=2)
+    assert encode.call_count == 1
+
 
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
@@ -9,7 +9,11 @@ from unittest.mock import patch
 import pytest
 from pytest_unordered import unordered
 
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import (
+    DATA_TRACE_MEMORY,
+    DEFAULT_STORED_TRACES,
+    MEMORY_BUDGET,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.helpers.typing import UNDEFINED
@@ -406,6 +410,8 @@ async def test_get_trace(
     # Get all traces and generate expected stored traces
     traces = defaultdict(list)
     for trace in trace_list:
+        # The size of the compressed trace is not saved
+        assert trace.pop("size") > 0
         item_id = trace["item_id"]
         run_id = trace["run_id"]
         await client.send_json(
@@ -467,6 +473,7 @@ async def test_restore_traces(
     traces = defaultdict(list)
     contexts = {}
     for trace in trace_list:
+        assert trace.pop("size") > 0
         item_id = trace["item_id"]
         run_id = trace["run_id"]
         await client.send_json(
@@ -602,6 +609,87 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_memory_budget(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, domain: str
+) -> None:
+    """Test the oldest stopped traces are removed when over the memory budget."""
+    msg_id = 1
+
+    def next_id():
+        nonlocal msg_id
+        msg_id += 1
+        return msg_id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"event": "another_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config, moon_config])
+
+    client = await hass_ws_client()
+
+    await client.send_json(
+        {"id": next_id(), "type": "trace/list", "domain": domain, "memory": True}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "traces": [],
+        "memory": {"size": 0, "budget": MEMORY_BUDGET},
+    }
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    # The size of the sun trace is accounted when it stops
+    await client.send_json(
+        {"id": next_id(), "type": "trace/list", "domain": domain, "memory": True}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sun_traces = _find_traces(response["result"]["traces"], domain, "sun")
+    assert len(sun_traces) == 1
+    sun_size = sun_traces[0]["size"]
+    assert sun_size > 0
+    assert response["result"]["memory"] == {"size": sun_size, "budget": MEMORY_BUDGET}
+
+    # Only one of the traces fits the budget, the oldest is removed
+    hass.data[DATA_TRACE_MEMORY].budget = sun_size * 3 // 2
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json(
+        {"id": next_id(), "type": "trace/list", "domain": domain, "memory": True}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert _find_traces(response["result"]["traces"], domain, "sun") == []
+    moon_traces = _find_traces(response["result"]["traces"], domain, "moon")
+    assert len(moon_traces) == 1
+    assert moon_traces[0]["state"] == "stopped"
+    assert response["result"]["memory"] == {
+        "size": moon_traces[0]["size"],
+        "budget": sun_size * 3 // 2,
+    }
+
+    # A trace which does not fit the budget is removed as soon as it stops
+    hass.data[DATA_TRACE_MEMORY].budget = 1
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == []
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
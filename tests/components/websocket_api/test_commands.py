@@ -27,6 +27,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util.import_profiler import ImportTiming
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -2515,6 +2516,41 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_import_info(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test the import timings recorded by the import profiler."""
+    await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    profiler = loader.async_enable_import_profiler(hass)
+    profiler.timings.append(
+        ImportTiming(
+            "homeassistant.components.hue.light", None, "MainThread", 1.5, 1.0, 1, 1
+        )
+    )
+    await websocket_client.send_json({"id": 8, "type": "integration/import_info"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "integrations": [{"name": "hue.light", "wall": 1.5, "cpu": 1.0}],
+        "modules": [
+            {
+                "module": "homeassistant.components.hue.light",
+                "parent": None,
+                "thread": "MainThread",
+                "wall": 1.5,
+                "cpu": 1.0,
+                "self_wall": 1,
+                "self_cpu": 1,
+            }
+        ],
+    }
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -2866,3 +2902,56 @@ async def test_subscribe_entities_chained_state_change(
 
     await websocket_client.close()
     await hass.async_block_till_done()
+
+
+async def test_subscribe_entities_batch(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test states set together are sent in a single message."""
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.removed", "on")
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.permitted", "light.new"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.permitted": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}}
+    }
+
+    hass.states.async_set_many(
+        [
+            ("light.permitted", "on", None),
+            ("light.new", "on", {"brightness": 255}),
+            ("light.not_subscribed", "on", None),
+        ]
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.new": {"a": {"brightness": 255}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}},
+    }
+
+    hass.states.async_set_many(
+        [("light.permitted", "off", None), ("light.permitted", "on", None)]
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}
+    }
+    msg = await websocket_client.receive_json()
+    # Both states share the context and the timestamp
+    assert msg["event"] == {"c": {"light.permitted": {"+": {"s": "on"}}}}
@@ -10,6 +10,7 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -451,6 +452,37 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_wait_sent(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test waiting until the queued messages were sent to the client."""
+    sent_before_wait: list[bool] = []
+
+    @websocket_command({"type": "fake_wait_sent"})
+    @async_response
+    async def fake_wait_sent(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        connection.send_result(msg["id"])
+        sent = connection.async_wait_sent()
+        sent_before_wait.append(sent.done())
+        await sent
+        # Nothing is queued anymore
+        assert connection.async_wait_sent().done()
+        connection.send_event(msg["id"], "sent")
+
+    async_register_command(hass, fake_wait_sent)
+
+    await websocket_client.send_json({"id": 1, "type": "fake_wait_sent"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"] is True
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["event"] == "sent"
+    assert sent_before_wait == [False]
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
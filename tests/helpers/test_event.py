@@ -537,6 +537,34 @@ async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     unsub_throws()
 
 
+async def test_async_track_state_change_event_set_many(hass: HomeAssistant) -> None:
+    """Test async_track_state_change_event with states set together."""
+    tracker: list[str] = []
+
+    @ha.callback
+    def run_callback(event: Event[EventStateChangedData]) -> None:
+        tracker.append(event.data["entity_id"])
+
+    unsub = async_track_state_change_event(
+        hass, ["light.bowl", "switch.kitchen"], run_callback
+    )
+    hass.states.async_set_many(
+        [
+            ("switch.kitchen", "on", None),
+            ("light.other", "on", None),
+            ("light.bowl", "on", None),
+        ]
+    )
+    assert tracker == []
+    await hass.async_block_till_done()
+    assert tracker == ["switch.kitchen", "light.bowl"]
+
+    unsub()
+    hass.states.async_set_many([("light.bowl", "off", None)])
+    await hass.async_block_till_done()
+    assert tracker == ["switch.kitchen", "light.bowl"]
+
+
 async def test_async_track_state_change_event_with_empty_list(
     hass: HomeAssistant,
 ) -> None:
@@ -12,6 +12,7 @@ from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.integration_platform import (
+    async_load_deferred_integration_platforms,
     async_process_integration_platforms,
 )
 from homeassistant.setup import ATTR_COMPONENT
@@ -59,6 +60,90 @@ async def test_process_integration_platforms_with_wait(hass: HomeAssistant) -> N
     assert len(processed) == 2
 
 
+async def test_process_deferred_integration_platforms(hass: HomeAssistant) -> None:
+    """Test deferred integration platforms are processed on their first use."""
+    loader.async_defer_platform_imports(hass)
+    assert "diagnostics" not in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.diagnostics", loaded_platform)
+    hass.config.components.add("loaded")
+    event_platform = Mock()
+    mock_platform(hass, "event.diagnostics", event_platform)
+    later_platform = Mock()
+    mock_platform(hass, "later.diagnostics", later_platform)
+
+    processed = []
+
+    @callback
+    def _process_platform(hass: HomeAssistant, domain: str, platform: Any) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    await async_process_integration_platforms(
+        hass, "diagnostics", _process_platform, wait_for_platforms=True
+    )
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    hass.config.components.add("event")
+    await hass.async_block_till_done()
+    assert processed == []
+
+    await async_load_deferred_integration_platforms(hass, "diagnostics")
+    assert sorted(processed) == [("event", event_platform), ("loaded", loaded_platform)]
+    assert "diagnostics" in hass.data[loader.DATA_PRELOAD_PLATFORMS]
+
+    # Integrations loaded after the first use are processed as they are loaded
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "later"})
+    await hass.async_block_till_done()
+    assert processed[-1] == ("later", later_platform)
+
+    # Later uses and platforms which are not deferred are no-ops
+    await async_load_deferred_integration_platforms(hass, "diagnostics")
+    await async_load_deferred_integration_platforms(hass, "platform_to_check")
+    assert len(processed) == 3
+
+
+async def test_process_deferred_integration_platforms_retried(
+    hass: HomeAssistant,
+) -> None:
+    """Test deferred integration platforms are retried when processing fails."""
+    loader.async_defer_platform_imports(hass)
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.diagnostics", loaded_platform)
+    hass.config.components.add("loaded")
+    event_platform = Mock()
+    mock_platform(hass, "event.diagnostics", event_platform)
+
+    processed = []
+
+    @callback
+    def _process_platform(hass: HomeAssistant, domain: str, platform: Any) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    await async_process_integration_platforms(
+        hass, "diagnostics", _process_platform, wait_for_platforms=True
+    )
+    with (
+        patch(
+            "homeassistant.helpers.integration_platform.async_get_integrations",
+            side_effect=HomeAssistantError,
+        ),
+        pytest.raises(HomeAssistantError),
+    ):
+        await async_load_deferred_integration_platforms(hass, "diagnostics")
+    assert processed == []
+    assert loader.async_is_platform_import_deferred(hass, "diagnostics")
+
+    await async_load_deferred_integration_platforms(hass, "diagnostics")
+    assert processed == [("loaded", loaded_platform)]
+
+    # The platform is only processed once for integrations loaded later
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    await hass.async_block_till_done()
+    assert processed == [("loaded", loaded_platform), ("event", event_platform)]
+
+
 async def test_process_integration_platforms(hass: HomeAssistant) -> None:
     """Test processing integrations."""
     loaded_platform = Mock()
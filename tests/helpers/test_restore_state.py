@@ -1,8 +1,10 @@
 """The tests for the Restore component."""
 
 from collections.abc import Coroutine
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -14,24 +16,31 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    JOURNAL_KEY,
     STORAGE_KEY,
+    ExtraStoredData,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
+    RestoreStateJournal,
     StoredState,
     async_get,
     async_load,
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
     async_fire_time_changed,
+    async_mock_load_restore_state_from_storage,
     json_round_trip,
     mock_integration,
     mock_platform,
@@ -116,7 +125,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     # Emulate a fresh load
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         hass.data.pop(DATA_RESTORE_STATE)
         await async_load(hass)
@@ -132,7 +141,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
@@ -140,7 +149,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -148,7 +157,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
         await hass.async_block_till_done()
@@ -164,7 +173,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
 
     # Emulate a fresh load
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         hass.data.pop(DATA_RESTORE_STATE)
         await async_load(hass)
@@ -181,7 +190,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
         await hass.async_block_till_done()
@@ -190,7 +199,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert not mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         await RestoreStateData.async_save_persistent_states(hass)
         await hass.async_block_till_done()
@@ -198,7 +207,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
@@ -206,7 +215,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.RestoreStateData.async_dump_states"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
@@ -341,21 +350,27 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     for state in states:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with (
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data,
+        patch(
+            "homeassistant.helpers.restore_state.RestoreStateJournal.async_append"
+        ) as mock_append,
+    ):
         await data.async_dump_states()
 
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
-    assert len(written_states) == 2
-    state0 = json_round_trip(written_states[0])
-    state1 = json_round_trip(written_states[1])
-    assert state0["state"]["entity_id"] == "input_boolean.b3"
-    assert state0["state"]["state"] == "off"
-    assert state1["state"]["entity_id"] == "input_boolean.b5"
-    assert state1["state"]["state"] == "off"
+    # Only the change is appended to the journal
+    assert not mock_write_data.called
+    assert mock_append.called
+    args = mock_append.mock_calls[0][1]
+    written_records = list(args[0])
+    assert len(written_records) == 1
+    assert written_records[0]["removed"] == "input_boolean.b1"
+    assert [state.state.entity_id for state in data.async_get_stored_states()] == [
+        "input_boolean.b3",
+        "input_boolean.b5",
+    ]
 
 
 async def test_dump_error(hass: HomeAssistant) -> None:
@@ -550,3 +565,217 @@ async def test_restore_entity_end_to_end(
     assert len(storage_data) == 1
     assert storage_data[0]["state"]["entity_id"] == entity_id
     assert storage_data[0]["state"]["state"] == "stored"
+
+
+class MockRestoreEntityWithExtraData(RestoreEntity):
+    """Mock restore entity with extra data."""
+
+    extra_data: dict[str, Any] | None = None
+
+    @property
+    def extra_restore_state_data(self) -> RestoredExtraData | None:
+        """Return the extra data."""
+        return RestoredExtraData(self.extra_data) if self.extra_data else None
+
+
+async def test_dump_journal(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test only changed states are appended to the journal until compacted."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for i in range(8):
+        entity = MockRestoreEntityWithExtraData()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{i}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    await data.async_dump_states()
+
+    # The first dump of a run writes the base snapshot
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 8
+    assert JOURNAL_KEY not in hass_storage
+
+    hass.states.async_set("input_boolean.b0", "off")
+    entities[1].extra_data = {"value": 1}
+    await data.async_dump_states()
+
+    journal = hass_storage[JOURNAL_KEY].splitlines()
+    assert len(journal) == 2
+    assert json_loads(journal[0])["state"]["state"] == "off"
+    assert json_loads(journal[1])["extra_data"] == {"value": 1}
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "on"
+
+    # Nothing changed
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY].splitlines()) == 2
+
+    hass.states.async_remove("input_boolean.b7")
+    await data.async_dump_states()
+    assert json_loads(hass_storage[JOURNAL_KEY].splitlines()[2])["removed"] == (
+        "input_boolean.b7"
+    )
+
+    await async_mock_load_restore_state_from_storage(hass)
+    assert data.last_states == {}
+    stored_state = data.async_get_restored_state("input_boolean.b0")
+    assert stored_state.state.state == "off"
+    stored_state = data.async_get_restored_state("input_boolean.b1")
+    assert stored_state.state.state == "on"
+    assert stored_state.extra_data.as_dict() == {"value": 1}
+    assert data.async_get_restored_state("input_boolean.b2").state.state == "on"
+    assert data.async_get_restored_state("input_boolean.b7") is None
+
+    # The first dump after loading compacts the journal
+    await data.async_dump_states()
+    assert len(hass_storage[STORAGE_KEY]["data"]) == 7
+    assert hass_storage[STORAGE_KEY]["data"][0]["state"]["state"] == "off"
+    assert JOURNAL_KEY not in hass_storage
+
+    for i in range(1, 5):
+        hass.states.async_set(f"input_boolean.b{i}", "off")
+    await data.async_dump_states()
+    assert len(hass_storage[JOURNAL_KEY].splitlines()) == 4
+
+    # The journal has grown too large compared to the stored states
+    await data.async_dump_states()
+    assert JOURNAL_KEY not in hass_storage
+    assert [item["state"]["state"] for item in hass_storage[STORAGE_KEY]["data"]] == [
+        "off",
+        "off",
+        "off",
+        "off",
+        "off",
+        "on",
+        "on",
+    ]
+
+
+@dataclass
+class MockExtraStoredData(ExtraStoredData):
+    """Mock extra stored data."""
+
+    value: int
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the extra data."""
+        return {"value": self.value}
+
+
+class MockRestoreEntityWithDataclass(RestoreEntity):
+    """Mock restore entity with dataclass extra data."""
+
+    value = 0
+
+    @property
+    def extra_restore_state_data(self) -> MockExtraStoredData:
+        """Return the extra data."""
+        return MockExtraStoredData(self.value)
+
+
+async def test_dump_unchanged_extra_data_not_converted(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test unchanged extra data is not converted again on every dump."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entities = []
+    for i in range(4):
+        entity = MockRestoreEntityWithDataclass()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{i}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+    for entity in entities:
+        hass.states.async_set(entity.entity_id, "on")
+
+    data = async_get(hass)
+    with patch.object(
+        MockExtraStoredData,
+        "as_dict",
+        autospec=True,
+        side_effect=lambda extra_data: {"value": extra_data.value},
+    ) as as_dict:
+        await data.async_dump_states()
+        assert as_dict.call_count == 4
+
+        # Neither the states nor the extra data changed
+        await data.async_dump_states()
+        assert as_dict.call_count == 4
+        assert JOURNAL_KEY not in hass_storage
+
+        entities[0].value = 1
+        await data.async_dump_states()
+        assert as_dict.call_count == 5
+        journal = hass_storage[JOURNAL_KEY].splitlines()
+        assert json_loads(journal[0])["extra_data"] == {"value": 1}
+
+        hass.states.async_set("input_boolean.b1", "off")
+        await data.async_dump_states()
+        assert as_dict.call_count == 6
+        journal = hass_storage[JOURNAL_KEY].splitlines()
+        assert len(journal) == 2
+        assert json_loads(journal[1])["state"]["state"] == "off"
+
+
+async def test_load_journal(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test the journal is applied on top of the base snapshot."""
+    now = dt_util.utcnow()
+    earlier = now - timedelta(minutes=15)
+    later = now + timedelta(minutes=15)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            json_round_trip(
+                StoredState(State(f"input_boolean.b{i}", "base"), None, now).as_dict()
+            )
+            for i in range(3)
+        ],
+    }
+    hass_storage[JOURNAL_KEY] = b"".join(
+        json_bytes(record) + b"\n"
+        for record in (
+            # Left over from an interrupted compaction
+            StoredState(State("input_boolean.b0", "stale"), None, earlier).as_dict(),
+            StoredState(State("input_boolean.b1", "journal"), None, later).as_dict(),
+            {"removed": "input_boolean.b2", "last_seen": later},
+            StoredState(State("input_boolean.b3", "journal"), None, later).as_dict(),
+            {"invalid": "record"},
+        )
+    )
+
+    await async_mock_load_restore_state_from_storage(hass)
+    data = async_get(hass)
+
+    assert data.async_get_restored_state("input_boolean.b0").state.state == "base"
+    assert data.async_get_restored_state("input_boolean.b1").state.state == "journal"
+    assert data.async_get_restored_state("input_boolean.b2") is None
+    assert data.async_get_restored_state("input_boolean.b3").state.state == "journal"
+
+
+def test_journal_file(tmp_path: Path) -> None:
+    """Test reading and appending to the journal file."""
+    hass = Mock(config=Mock(path=lambda *parts: str(tmp_path.joinpath(*parts))))
+    journal = RestoreStateJournal(hass, JOURNAL_KEY)
+    assert journal._read() == []
+
+    journal._append(b'{"removed":"input_boolean.b0"}\n')
+    journal._append(b'invalid\n{"removed":"input_boolean.b1"}\n{"removed":')
+    assert journal._read() == [
+        {"removed": "input_boolean.b0"},
+        {"removed": "input_boolean.b1"},
+    ]
+
+    # The incomplete record of the interrupted append has been cut off
+    journal._append(b'{"removed":"input_boolean.b2"}\n')
+    assert journal._read() == [
+        {"removed": "input_boolean.b0"},
+        {"removed": "input_boolean.b1"},
+        {"removed": "input_boolean.b2"},
+    ]
+
+    journal._remove()
+    assert journal._read() == []
+    journal._remove()
@@ -13,6 +13,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import orjson
 import pytest
 import voluptuous as vol
@@ -3792,6 +3793,84 @@ async def test_integration_entities(
     assert info.rate_limit is None
 
 
+async def test_integration_entities_lookup_cache(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    device_registry: dr.DeviceRegistry,
+    area_registry: ar.AreaRegistry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test entity lookups are cached until their sources change."""
+    caplog.set_level(logging.DEBUG, logger="homeassistant.helpers.template")
+    lookup_cache = template.async_get_lookup_cache(hass)
+    config_entry = MockConfigEntry(domain="mock", title="Bridge")
+    config_entry.add_to_hass(hass)
+    entity_entry = entity_registry.async_get_or_create(
+        "sensor", "mock", "test", config_entry=config_entry
+    )
+    area = area_registry.async_get_or_create("Kitchen")
+
+    for _ in range(3):
+        info = render_to_info(hass, "{{ integration_entities('Bridge') }}")
+        assert_result_info(info, [entity_entry.entity_id])
+    assert lookup_cache.misses["integration"] == 1
+    assert lookup_cache.hits["integration"] == 2
+
+    # Renaming the config entry clears the integration lookups
+    hass.config_entries.async_update_entry(config_entry, title="Renamed")
+    assert (
+        "Cleared the template integration lookups; 3 lookups, 2 hits (66.7%), "
+        "1 invalidations so far"
+    ) in caplog.text
+    info = render_to_info(hass, "{{ integration_entities('Bridge') }}")
+    assert_result_info(info, [])
+    info = render_to_info(hass, "{{ integration_entities('Renamed') }}")
+    assert_result_info(info, [entity_entry.entity_id])
+
+    # Adding an entity without a registry entry clears the integration lookups
+    info = render_to_info(hass, "{{ integration_entities('entryless') }}")
+    assert_result_info(info, [])
+    mock_entity = entity.Entity()
+    mock_entity.hass = hass
+    mock_entity.entity_id = "light.test_entity"
+    mock_entity.platform = EntityPlatform(
+        hass=hass,
+        logger=logging.getLogger(__name__),
+        domain="light",
+        platform_name="entryless",
+        platform=None,
+        scan_interval=timedelta(seconds=30),
+        entity_namespace=None,
+    )
+    await mock_entity.async_internal_added_to_hass()
+    info = render_to_info(hass, "{{ integration_entities('entryless') }}")
+    assert_result_info(info, ["light.test_entity"])
+    await mock_entity.async_internal_will_remove_from_hass()
+    info = render_to_info(hass, "{{ integration_entities('entryless') }}")
+    assert_result_info(info, [])
+
+    # Entities inherit the area of their device
+    info = render_to_info(hass, f"{{{{ area_entities('{area.id}') }}}}")
+    assert_result_info(info, [])
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    entity_registry.async_update_entity(
+        entity_entry.entity_id, device_id=device_entry.id
+    )
+    info = render_to_info(hass, f"{{{{ area_entities('{area.id}') }}}}")
+    assert_result_info(info, [])
+    device_registry.async_update_device(device_entry.id, area_id=area.id)
+    info = render_to_info(hass, f"{{{{ area_entities('{area.id}') }}}}")
+    assert_result_info(info, [entity_entry.entity_id])
+    info = render_to_info(hass, f"{{{{ area_entities('{area.id}') }}}}")
+    assert_result_info(info, [entity_entry.entity_id])
+
+    assert lookup_cache.invalidations > 0
+    assert 0 < lookup_cache.hit_rate < 1
+
+
 async def test_config_entry_id(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
@@ -5169,6 +5248,54 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+def _reset_template_environments(hass: HomeAssistant) -> None:
+    """Drop the template environments and the bytecode cache."""
+    for key in (
+        template._BYTECODE_CACHE,
+        template._ENVIRONMENT,
+        template._ENVIRONMENT_LIMITED,
+        template._ENVIRONMENT_STRICT,
+    ):
+        hass.data.pop(key, None)
+
+
+async def test_bytecode_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any], freezer: FrozenDateTimeFactory
+) -> None:
+    """Test compiled templates are stored and reused after a restart."""
+    source = "{{ '2' | int + 1 }}"
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template(source, hass).async_render() == 3
+    # Environments of another kind do not share the bytecode
+    template.TemplateEnvironment(hass, limited=True).compile(source)
+
+    freezer.tick(template.BYTECODE_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    stored = hass_storage[template.BYTECODE_CACHE_STORAGE_KEY]["data"]
+    assert len(stored["bytecode"]) == 2
+
+    # Simulate a restart, the templates are not compiled again
+    _reset_template_environments(hass)
+    await template.async_load_bytecode_cache(hass)
+    with patch("jinja2.Environment.compile", side_effect=AssertionError):
+        assert template.Template(source, hass).async_render() == 3
+        assert template.Template(source, hass).async_render(limited=True) == 3
+        template.TemplateEnvironment(hass, limited=True).compile(source)
+        with pytest.raises(AssertionError):
+            template.TemplateEnvironment(hass, strict=True).compile(source)
+
+    # The bytecode of another version is discarded
+    stored["version"] = "0.0.0"
+    _reset_template_environments(hass)
+    await template.async_load_bytecode_cache(hass)
+    with (
+        patch("jinja2.Environment.compile", side_effect=AssertionError),
+        pytest.raises(AssertionError),
+    ):
+        template.Template(source, hass).async_render()
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -1169,6 +1169,215 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners only receive events with their values."""
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        other_calls.append(event.data)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.hall"], listener
+    )
+    unsub_other = hass.bus.async_listen_keyed(
+        "test", "entity_id", "light.kitchen", other_listener
+    )
+    assert hass.bus.async_listeners()["test"] == 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.hall"})
+    hass.bus.async_fire("test", {"entity_id": "light.garage"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire_batch_internal(
+        "test", [{"entity_id": "light.hall"}, {"entity_id": "light.garage"}]
+    )
+    await hass.async_block_till_done()
+
+    assert calls == [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": "light.hall"},
+        {"entity_id": "light.hall"},
+    ]
+    assert other_calls == [{"entity_id": "light.kitchen"}]
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert len(other_calls) == 2
+
+    unsub_other()
+    assert "test" not in hass.bus.async_listeners()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(other_calls) == 2
+
+
+async def test_eventbus_listener_added_while_dispatching(
+    hass: HomeAssistant,
+) -> None:
+    """Test listeners added or removed by a listener apply to the next event."""
+    calls = []
+    unsubs = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener adding another listener and removing itself."""
+        calls.append("listener")
+        unsubs.pop()()
+        hass.bus.async_listen("test", ha.callback(lambda _: calls.append("added")))
+        hass.bus.async_listen_keyed(
+            "test", "key", "value", ha.callback(lambda _: calls.append("added keyed"))
+        )
+
+    unsubs.append(hass.bus.async_listen("test", listener))
+    hass.bus.async_fire("test", {"key": "value"})
+    assert calls == ["listener"]
+    hass.bus.async_fire("test", {"key": "value"})
+    await hass.async_block_till_done()
+    assert calls == ["listener", "added", "added keyed"]
+
+
+async def test_eventbus_batch_listener(hass: HomeAssistant) -> None:
+    """Test batch listeners receive batches and single events."""
+    calls = []
+    batch_calls = []
+    plain_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def batch_listener(events):
+        """Mock batch listener."""
+        batch_calls.append(events)
+
+    @ha.callback
+    def plain_listener(event):
+        """Mock listener without batch support."""
+        plain_calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data["filtered"]
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_batch(
+        "test", listener, batch_listener, event_filter=mock_filter
+    )
+    hass.bus.async_listen("test", plain_listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"filtered": False})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert len(batch_calls) == 0
+    assert len(plain_calls) == 1
+
+    hass.bus.async_fire_batch_internal(
+        "test", [{"filtered": False}, {"filtered": True}, {"filtered": False, "n": 2}]
+    )
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert len(batch_calls) == 1
+    assert [event.data for event in batch_calls[0]] == [
+        {"filtered": False},
+        {"filtered": False, "n": 2},
+    ]
+    assert len(plain_calls) == 4
+    # Both kinds of listeners receive the same event objects
+    assert batch_calls[0][0] is plain_calls[1]
+
+    hass.bus.async_fire_batch_internal("test", [{"filtered": True}])
+    await hass.async_block_till_done()
+    assert len(batch_calls) == 1
+    assert len(plain_calls) == 5
+
+    unsub()
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+    hass.bus.async_fire_batch_internal("test", [{"filtered": False}])
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert len(batch_calls) == 1
+    assert len(plain_calls) == 6
+
+
+async def test_eventbus_batch_keyed_listener_changed_while_dispatching(
+    hass: HomeAssistant,
+) -> None:
+    """Test keyed listeners can be changed while a batch is dispatched."""
+    calls = []
+    unsubs = []
+
+    @ha.callback
+    def keyed_listener(event):
+        """Mock keyed listener adding another key and removing itself."""
+        calls.append(("keyed", event.data["n"]))
+        if unsubs:
+            unsubs.pop()()
+            hass.bus.async_listen_keyed(
+                "test",
+                "other_key",
+                "value",
+                ha.callback(lambda event: calls.append(("added", event.data["n"]))),
+            )
+
+    unsub_batch = hass.bus.async_listen_batch(
+        "test", ha.callback(lambda _: None), ha.callback(lambda _: None)
+    )
+    unsubs.append(hass.bus.async_listen_keyed("test", "key", "value", keyed_listener))
+    hass.bus.async_fire_batch_internal(
+        "test",
+        [
+            {"key": "value", "other_key": "value", "n": 1},
+            {"key": "value", "other_key": "value", "n": 2},
+        ],
+    )
+    # The removed listener is not called again, the added key applies to
+    # the next batch
+    assert calls == [("keyed", 1)]
+
+    hass.bus.async_fire_batch_internal(
+        "test", [{"key": "value", "other_key": "value", "n": 3}]
+    )
+    await hass.async_block_till_done()
+    assert calls == [("keyed", 1), ("added", 3)]
+    unsub_batch()
+
+
+async def test_eventbus_batch_listener_match_all(hass: HomeAssistant) -> None:
+    """Test batch listeners for all events."""
+    batch_calls = []
+
+    @ha.callback
+    def batch_listener(events):
+        """Mock batch listener."""
+        batch_calls.append(events)
+
+    unsub = hass.bus.async_listen_batch(
+        MATCH_ALL, ha.callback(lambda _: None), batch_listener
+    )
+    hass.bus.async_fire_batch_internal("test", [{"n": 1}, {"n": 2}])
+    await hass.async_block_till_done()
+    assert len(batch_calls) == 1
+    assert len(batch_calls[0]) == 2
+    unsub()
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1544,6 +1753,75 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("light.ceiling", "off", {"brightness": 0})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported = []
+    batches = []
+
+    @ha.callback
+    def reported_listener(event):
+        reported.append(event)
+
+    @ha.callback
+    def batch_listener(events):
+        batches.append(events)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        reported_listener,
+        event_filter=ha.callback(lambda _: True),
+    )
+    hass.bus.async_listen_batch(
+        EVENT_STATE_CHANGED, ha.callback(lambda _: None), batch_listener
+    )
+    context = ha.Context()
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "off", None),
+            ("light.ceiling", "off", {"brightness": 0}),
+            ("light.new", 1, {"brightness": 50}),
+        ],
+        context=context,
+    )
+    await hass.async_block_till_done()
+
+    assert len(events) == 2
+    assert len(reported) == 1
+    assert reported[0].data["entity_id"] == "light.ceiling"
+    assert len(batches) == 1
+    assert [event.data["entity_id"] for event in batches[0]] == [
+        "light.bowl",
+        "light.new",
+    ]
+    assert batches[0][0] is events[0]
+    bowl = hass.states.get("light.bowl")
+    new = hass.states.get("light.new")
+    assert bowl.state == "off"
+    assert new.state == "1"
+    assert new.attributes == {"brightness": 50}
+    assert bowl.context is context
+    assert new.context is context
+    assert bowl.last_updated == new.last_updated
+    assert events[1].data["old_state"] is None
+
+
+async def test_statemachine_set_many_invalid_entity_id(hass: HomeAssistant) -> None:
+    """Test states set before an invalid entity id are still announced."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [("light.bowl", "on", None), ("invalid_entity_format", "on", None)]
+        )
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert hass.states.get("light.bowl").state == "on"
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}
@@ -991,6 +991,52 @@ async def test_get_ssdp(hass: HomeAssistant) -> None:
         assert ssdp["test_2"] == [{"manufacturer": "test_2", "modelName": "test_2"}]
 
 
+def test_discovery_matcher_index() -> None:
+    """Test matching discoveries with the compiled matcher index."""
+    matchers = loader.DiscoveryMatcherIndex(
+        [
+            ("prefix", {"hostname": "hub-*", "macaddress": "B8B7F1*"}),
+            ("longer_prefix", {"hostname": "hub-2*"}),
+            ("wildcard", {"hostname": "*-hub"}),
+            ("any", {}),
+            ("character_class", {"hostname": "[ab]ulb*"}),
+        ]
+    )
+    assert matchers.match({"hostname": "hub-2", "macaddress": "B8B7F1000000"}) == [
+        "prefix",
+        "longer_prefix",
+        "any",
+    ]
+    assert matchers.match({"hostname": "hub-2", "macaddress": "000000000000"}) == [
+        "longer_prefix",
+        "any",
+    ]
+    assert matchers.match({"hostname": "living-hub"}) == ["wildcard", "any"]
+    assert matchers.match({"hostname": "bulb"}) == ["any", "character_class"]
+    assert matchers.match({"hostname": "h"}) == ["any"]
+    assert matchers.match({}) == ["any"]
+
+    exact = loader.DiscoveryMatcherIndex(
+        [
+            ("hue", {"manufacturer": "Signify", "modelName": "Bridge*"}),
+            ("sonos", {"st": "urn:schemas-upnp-org:device:ZonePlayer:1"}),
+            ("sonos_s1", {"st": "urn:schemas-upnp-org:device:ZonePlayer:1"}),
+            ("empty", {"st": ""}),
+        ],
+        glob=False,
+    )
+    assert exact.match({"manufacturer": "Signify", "modelName": "Bridge*"}) == ["hue"]
+    assert exact.match({"manufacturer": "Signify", "modelName": "Bridge 2"}) == []
+    assert exact.match({"st": "urn:schemas-upnp-org:device:ZonePlayer:1"}) == [
+        "sonos",
+        "sonos_s1",
+    ]
+    # The values must be equal, a longer value does not match
+    assert exact.match({"st": "urn:schemas-upnp-org:device:ZonePlayer:10"}) == []
+    assert exact.match({"st": ""}) == ["empty"]
+    assert exact.match({"st": None}) == []
+
+
 async def test_get_mqtt(hass: HomeAssistant) -> None:
     """Verify that custom components with MQTT are found."""
     test_1_integration = _get_test_integration(hass, "test_1", True)
@@ -0,0 +1,86 @@
+"""Test the import profiler."""
+
+from collections.abc import Generator
+from pathlib import Path
+import sys
+
+import pytest
+
+from homeassistant.util.import_profiler import ImportProfiler, ImportTiming
+
+
+@pytest.fixture
+def profiled_package(tmp_path: Path) -> Generator[str]:
+    """Create a package with a module importing another module."""
+    package = tmp_path / "profiled_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "light.py").write_text(
+        "import time\nfrom . import lib\nsum(range(100000))\n"
+    )
+    (package / "lib.py").write_text("sum(range(100000))\n")
+    sys.path.insert(0, str(tmp_path))
+    yield "profiled_package"
+    sys.path.remove(str(tmp_path))
+    for name in ("profiled_package", "profiled_package.light", "profiled_package.lib"):
+        sys.modules.pop(name, None)
+
+
+def test_import_profiler(profiled_package: str) -> None:
+    """Test the profiler records the imports and their transitive imports."""
+    profiler = ImportProfiler()
+    profiler.start()
+    profiler.start()
+    assert sys.meta_path.count(profiler) == 1
+    try:
+        __import__(f"{profiled_package}.light")
+    finally:
+        profiler.stop()
+    profiler.stop()
+    assert not profiler.started
+
+    timings = {timing.module: timing for timing in profiler.timings}
+    assert set(timings) == {
+        "profiled_package",
+        "profiled_package.light",
+        "profiled_package.lib",
+    }
+    assert timings["profiled_package"].parent is None
+    assert timings["profiled_package.light"].parent is None
+    assert timings["profiled_package.lib"].parent == "profiled_package.light"
+    light = timings["profiled_package.light"]
+    lib = timings["profiled_package.lib"]
+    assert light.wall >= lib.wall > 0
+    assert light.self_wall == pytest.approx(light.wall - lib.wall)
+    assert light.self_cpu == pytest.approx(light.cpu - lib.cpu)
+
+    # The loaders are restored once the modules are executed
+    assert "exec_module" not in vars(sys.modules["profiled_package.lib"].__loader__)
+
+    profile = profiler.as_dict()
+    assert [module["module"] for module in profile["modules"]][0] == (
+        "profiled_package.light"
+    )
+    assert {integration["name"] for integration in profile["integrations"]} == {
+        "profiled_package"
+    }
+
+
+def test_import_profiler_integration_keys() -> None:
+    """Test the imports are attributed to integrations and platforms."""
+    profiler = ImportProfiler()
+    profiler.timings.extend(
+        ImportTiming(module, parent, "MainThread", wall, wall / 2)
+        for module, parent, wall in (
+            ("homeassistant.components.hue", None, 1.0),
+            ("homeassistant.components.hue.light", None, 2.0),
+            ("aiohue", "homeassistant.components.hue.light", 1.5),
+            ("custom_components.my_light.light", None, 0.5),
+            ("custom_components.my_light.light", None, 0.25),
+        )
+    )
+    assert profiler.as_dict()["integrations"] == [
+        {"name": "hue.light", "wall": 2.0, "cpu": 1.0},
+        {"name": "hue", "wall": 1.0, "cpu": 0.5},
+        {"name": "my_light.light", "wall": 0.75, "cpu": 0.375},
+    ]